@@ -7,6 +7,7 @@ and interaction with the Amazon Q Business API.
 """
 
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, ClassVar, Optional
 
 import boto3
@@ -51,6 +52,9 @@ class QBusinessConstants:  # pylint: disable=too-few-public-methods
         "DELETE_MAX_DOCS": 10,  # Maximum number of documents in a single BatchDeleteDocument request
     }
 
+    # Number of threads used to read and hash document files concurrently
+    CHECKSUM_MAX_WORKERS = 8
+
 
 class QBusinessCustomConnectorInterface(BaseCustomConnectorInterface):
     """
@@ -116,11 +120,12 @@ class QBusinessCustomConnectorInterface(BaseCustomConnectorInterface):
                 logger.info("Processing %s documents to upload", len(current_docs))
                 documents_to_delete = list(self.get_documents_to_delete())
                 logger.info("Processing %s documents to delete", len(documents_to_delete))
+                current_checksums: dict[str, str] = {}
 
                 # If CCF is enabled, use checksums to optimize sync
                 if self.ccf_client:
                     # Calculate checksums for current documents
-                    current_checksums = {doc.id: doc.get_checksum() for doc in current_docs}
+                    current_checksums = self._calculate_checksums(current_docs)
 
                     # Get existing CCF document states
                     ccf_docs = self.ccf_client.list_documents()
@@ -146,7 +151,7 @@ class QBusinessCustomConnectorInterface(BaseCustomConnectorInterface):
 
                     # Update CCF with new checksums if enabled
                     if self.ccf_client:
-                        checksums_to_update = {doc.id: doc.get_checksum() for doc in current_docs}
+                        checksums_to_update = {doc.id: current_checksums[doc.id] for doc in current_docs}
                         logger.info("Updating custom connector documents api with %s", len(checksums_to_update))
                         self.ccf_client.batch_put_documents(checksums_to_update)
 
@@ -164,6 +169,29 @@ class QBusinessCustomConnectorInterface(BaseCustomConnectorInterface):
             logger.warning("Sync operation failed: %s", error)
             raise
 
+    @staticmethod
+    def _calculate_checksums(documents: list[Document]) -> dict[str, str]:
+        """
+        Calculate checksums for documents using a thread pool.
+
+        File reads and SHA-256 hashing both release the GIL, so hashing several
+        documents at once overlaps disk I/O for one file with hashing of another.
+
+        Args:
+            documents (List[Document]): Documents to calculate checksums for.
+
+        Returns:
+            Dict[str, str]: Mapping of document IDs to their checksums.
+
+        """
+        if len(documents) <= 1:
+            return {doc.id: doc.get_checksum() for doc in documents}
+
+        max_workers = min(QBusinessConstants.CHECKSUM_MAX_WORKERS, len(documents))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            checksums = executor.map(lambda doc: doc.get_checksum(), documents)
+            return {doc.id: checksum for doc, checksum in zip(documents, checksums, strict=True)}
+
     def _start_sync_job(self) -> str:
         """
         Start a data source sync job in Amazon Q Business.
@@ -208,8 +236,7 @@ class QBusinessCustomConnectorInterface(BaseCustomConnectorInterface):
 
         try:
             key = f"qbusiness-docs/{doc.id}{doc.file.file_path.suffix}"
-            with open(doc.file.file_path, "rb") as file_handle:
-                self._s3_client.put_object(Bucket=self._s3_bucket, Key=key, Body=file_handle.read())
+            self._s3_client.put_object(Bucket=self._s3_bucket, Key=key, Body=doc.file.read_bytes())
         except Exception as error:  # pylint: disable=broad-exception-caught
             logger.error("Failed to upload document %s to S3: %s", doc.id, error)
             return None
@@ -250,16 +277,17 @@ class QBusinessCustomConnectorInterface(BaseCustomConnectorInterface):
                 content = DocumentContent(s3=s3_info)
             else:
                 # For smaller documents, include content directly
-                with open(doc.file.file_path, "rb") as file_handle:
-                    content = DocumentContent(blob=file_handle.read())
+                content = DocumentContent(blob=doc.file.read_bytes())
 
             # Create standard attributes
-            attributes = [
-                DocumentAttribute(
-                    name="_source_uri",
-                    value=Value(stringValue=doc.metadata.source_uri),
+            attributes = []
+            if doc.metadata.source_uri:
+                attributes.append(
+                    DocumentAttribute(
+                        name="_source_uri",
+                        value=Value(stringValue=doc.metadata.source_uri),
+                    )
                 )
-            ]
             if doc.metadata.last_updated_at:
                 attributes.append(
                     DocumentAttribute(
@@ -7,10 +7,15 @@ and checksum calculation for change detection.
 """
 
 import hashlib
+import io
 import json
-import mimetypes
+import os
+import time
+from contextlib import suppress
 from datetime import UTC, datetime
+from functools import lru_cache
 from pathlib import Path
+from typing import BinaryIO
 
 import filetype
 from pydantic import BaseModel, ConfigDict, Field
@@ -19,6 +24,64 @@ from custom_connector_framework.models.exceptions import UnsupportedDocumentErro
 from custom_connector_framework.models.qbusiness import AccessControl
 from custom_connector_framework.types import ContentType, DocumentTypeMapper
 
+# Content types that can be read back as UTF-8 text
+_TEXT_CONTENT_TYPES = frozenset(
+    {
+        ContentType.HTML,
+        ContentType.XML,
+        ContentType.XSLT,
+        ContentType.MD,
+        ContentType.JSON,
+        ContentType.CSV,
+        ContentType.PLAIN_TEXT,
+    }
+)
+
+
+def _advise_will_need(file_descriptor: int) -> None:
+    """
+    Ask the kernel to start reading a file into the page cache ahead of use.
+
+    This is a no-op on platforms without posix_fadvise (macOS, Windows) and on
+    filesystems that reject the hint.
+
+    Args:
+        file_descriptor (int): Open file descriptor to advise on.
+
+    """
+    if hasattr(os, "posix_fadvise"):
+        with suppress(OSError):
+            os.posix_fadvise(file_descriptor, 0, 0, os.POSIX_FADV_WILLNEED)
+
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(epoch_seconds: int) -> str:
+    """
+    Format a whole-second epoch timestamp as an ISO 8601 UTC string.
+
+    Args:
+        epoch_seconds (int): Seconds since the Unix epoch.
+
+    Returns:
+        str: The ISO-formatted timestamp.
+
+    """
+    return datetime.fromtimestamp(epoch_seconds, UTC).isoformat()
+
+
+def _iso_now() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string with second precision.
+
+    The formatted string is cached for the current second, so metadata built in
+    bulk shares one timestamp instead of formatting a new datetime per field.
+
+    Returns:
+        str: The ISO-formatted current timestamp.
+
+    """
+    return _iso_timestamp(int(time.time()))
+
 
 class DocumentMetadata(BaseModel):
     """
@@ -44,8 +107,8 @@ class DocumentMetadata(BaseModel):
     )
     title: str
     source_uri: str | None = None
-    last_updated_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
-    created_at: str = Field(default_factory=lambda: datetime.now(UTC).isoformat())
+    last_updated_at: str = Field(default_factory=_iso_now)
+    created_at: str = Field(default_factory=_iso_now)
     attributes: dict[str, str] = Field(default_factory=dict)
     access_control_list: list[AccessControl] = Field(default_factory=list)
 
@@ -55,13 +118,18 @@ class DocumentFile:
     Represents a file on the local filesystem with methods for content access and type detection.
 
     This class handles file operations such as reading content, determining file size,
-    and inferring content type based on file characteristics.
+    and inferring content type based on file characteristics. Content that is already
+    in memory can be wrapped with `from_bytes` instead of being written to disk first.
 
     Attributes:
-        file_path (Path): Path to the file on the local filesystem.
+        file_path (Path): Path to the file on the local filesystem. For in-memory files this
+                          is a placeholder name that only carries the file extension.
 
     """
 
+    # Connectors may hold one instance per document for a whole sync, so skip the per-instance __dict__
+    __slots__ = ("_content", "file_path")
+
     def __init__(self, file_path: str | Path):
         """
         Initialize a DocumentFile instance.
@@ -74,17 +142,63 @@ class DocumentFile:
 
         """
         self.file_path = Path(file_path) if isinstance(file_path, str) else file_path
+        self._content: bytes | None = None
         if not self.file_path.exists():
             raise FileNotFoundError(f"File not found: {self.file_path}")
 
+    @classmethod
+    def from_bytes(cls, content: bytes, suffix: str = "") -> "DocumentFile":
+        """
+        Create a DocumentFile backed by in-memory content instead of a file on disk.
+
+        Args:
+            content (bytes): The file content.
+            suffix (str): File extension including the leading dot (e.g. ".md"), used for
+                          content type detection and S3 object keys.
+
+        Returns:
+            DocumentFile: A DocumentFile serving reads from the given content.
+
+        """
+        document_file = cls.__new__(cls)
+        document_file.file_path = Path(f"in-memory{suffix}")
+        document_file._content = content
+        return document_file
+
+    def open_binary(self) -> BinaryIO:
+        """
+        Open the file content for binary reading.
+
+        Returns:
+            BinaryIO: A binary file object positioned at the start of the content.
+                      The caller is responsible for closing it.
+
+        """
+        if self._content is not None:
+            return io.BytesIO(self._content)
+        file_handle = open(self.file_path, "rb")  # pylint: disable=consider-using-with
+        _advise_will_need(file_handle.fileno())
+        return file_handle
+
+    def read_bytes(self) -> bytes:
+        """
+        Read the full content of the file as bytes.
+
+        Returns:
+            bytes: The content of the file.
+
+        """
+        if self._content is not None:
+            return self._content
+        return self.file_path.read_bytes()
+
     def infer_content_type(self) -> ContentType:
         """
         Determine the content type of the file.
 
-        This method uses multiple strategies to determine the content type:
+        This method uses two strategies to determine the content type:
         1. First tries using the filetype library for binary detection
-        2. Falls back to mimetypes based on file extension
-        3. Finally tries to determine type from extension directly
+        2. Falls back to the file extension, which covers every supported format
 
         Returns:
             ContentType: The detected content type enum value.
@@ -95,23 +209,15 @@ class DocumentFile:
         """
         try:
             # Try to detect content type using filetype library (works best for binary files)
-            kind = filetype.guess(str(self.file_path))
+            kind = filetype.guess(self._content if self._content is not None else str(self.file_path))
             if kind:
-                mime_type = kind.mime
-            else:
-                # Fall back to mimetypes based on extension
-                mime_type, _ = mimetypes.guess_type(str(self.file_path))
-                if not mime_type:
-                    # Last resort: try to determine from extension directly
-                    extension = self.file_path.suffix.lower().lstrip(".")
-                    return DocumentTypeMapper.get_content_type_from_extension(extension)
-
-            try:
-                return DocumentTypeMapper.get_content_type_from_mime(mime_type)
-            except UnsupportedDocumentError:
-                # If mime type lookup fails, try extension-based lookup
-                extension = self.file_path.suffix.lower().lstrip(".")
-                return DocumentTypeMapper.get_content_type_from_extension(extension)
+                try:
+                    return DocumentTypeMapper.get_content_type_from_mime(kind.mime)
+                except UnsupportedDocumentError:
+                    # If mime type lookup fails, fall through to extension-based lookup
+                    pass
+
+            return DocumentTypeMapper.get_content_type_from_extension(self.file_path.suffix)
 
         except (UnsupportedDocumentError, ValueError) as error:
             raise UnsupportedDocumentError(f"Unable to determine content type for file: {self.file_path}") from error
@@ -131,17 +237,8 @@ class DocumentFile:
         """
         content_type = self.infer_content_type()
         # Only attempt to read text-based file types
-        if content_type in {
-            ContentType.HTML,
-            ContentType.XML,
-            ContentType.XSLT,
-            ContentType.MD,
-            ContentType.JSON,
-            ContentType.CSV,
-            ContentType.PLAIN_TEXT,
-        }:
-            with open(self.file_path, encoding="utf-8") as file_handle:
-                return file_handle.read()
+        if content_type in _TEXT_CONTENT_TYPES:
+            return self.read_bytes().decode("utf-8")
         raise NotImplementedError(f"Content extraction not implemented for {content_type.value} files.")
 
     def get_size(self) -> int:
@@ -152,6 +249,8 @@ class DocumentFile:
             int: The size of the file in bytes.
 
         """
+        if self._content is not None:
+            return len(self._content)
         return self.file_path.stat().st_size
 
 
@@ -196,8 +295,9 @@ class Document(BaseModel):
         )
         data = f"{self.id}+{metadata}"
 
-        # Add file content hash to the checksum calculation
-        with open(self.file.file_path, "rb") as file_handle:
-            data += f"+{hashlib.sha256(file_handle.read()).hexdigest()}"
+        # Add file content hash to the checksum calculation, streaming the file through
+        # a reused buffer rather than loading it into memory as a single bytes object
+        with self.file.open_binary() as file_handle:
+            data += f"+{hashlib.file_digest(file_handle, 'sha256').hexdigest()}"
 
         return hashlib.sha256(data.encode()).hexdigest()
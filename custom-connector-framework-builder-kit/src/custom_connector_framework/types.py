@@ -162,9 +162,9 @@ class DocumentTypeMapper:
 
         """
         try:
-            file_ext = FileExtension(extension.lower().lstrip("."))
-            return cls.EXTENSION_TO_CONTENT_TYPE[file_ext]
-        except (ValueError, KeyError) as error:
+            # FileExtension is a str enum, so the mapping can be keyed directly on the normalized suffix
+            return cls.EXTENSION_TO_CONTENT_TYPE[extension.lower().lstrip(".")]
+        except KeyError as error:
             raise UnsupportedDocumentError(f"Unsupported file extension: {extension}") from error
 
     @classmethod
@@ -2,22 +2,46 @@
 Pytest configuration for Custom Connector Framework tests.
 
 This module provides shared fixtures and configuration for all tests,
-including handling of optional dependencies like the CCF service.
+including handling of optional dependencies like the CCF service and
+RAM-backed storage for temporary test files.
 """
 
+import functools
+import os
+import tempfile
+
 import boto3
 import pytest
 from botocore.exceptions import UnknownServiceError
 
+# Linux tmpfs mount used to keep temporary test files off disk when available
+TMPFS_DIR = "/dev/shm"
+
 
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line("markers", "ccf_required: mark test as requiring CCF service (may be skipped in CI)")
 
 
-@pytest.fixture(scope="session")
-def ccf_service_available():
-    """Check if CCF service is available in the current environment."""
+@pytest.fixture(scope="session", autouse=True)
+def tmpfs_tempdir():
+    """
+    Point the tempfile module at a session temporary directory, on tmpfs when available.
+
+    Fixture files are written to memory and removed together when the directory is
+    cleaned up at the end of the session, so individual fixtures skip their own cleanup.
+    """
+    original_tempdir = tempfile.tempdir
+    parent_dir = TMPFS_DIR if os.path.isdir(TMPFS_DIR) and os.access(TMPFS_DIR, os.W_OK) else None
+    with tempfile.TemporaryDirectory(dir=parent_dir) as session_dir:
+        tempfile.tempdir = session_dir
+        yield session_dir
+        tempfile.tempdir = original_tempdir
+
+
+@functools.lru_cache(maxsize=1)
+def _is_ccf_service_available():
+    """Check once per session whether the CCF service model is installed."""
     try:
         # Try to create a CCF client to see if the service is available
         boto3.client("ccf", region_name="us-east-1")
@@ -26,10 +50,13 @@ def ccf_service_available():
         return False
 
 
+@pytest.fixture(scope="session")
+def ccf_service_available():
+    """Check if CCF service is available in the current environment."""
+    return _is_ccf_service_available()
+
+
 def pytest_runtest_setup(item):
     """Skip tests that require CCF service when it's not available."""
-    if "ccf_required" in item.keywords:
-        try:
-            boto3.client("ccf", region_name="us-east-1")
-        except UnknownServiceError:
-            pytest.skip("CCF service not available - skipping test that requires deployed infrastructure")
+    if "ccf_required" in item.keywords and not _is_ccf_service_available():
+        pytest.skip("CCF service not available - skipping test that requires deployed infrastructure")
@@ -1,12 +1,13 @@
+import functools
+import os
 import tempfile
 import uuid
 from collections.abc import Iterator
 from pathlib import Path
-from unittest.mock import MagicMock, patch
 
 import boto3
 import pytest
-from botocore.stub import Stubber
+from botocore.stub import ANY, Stubber
 
 from custom_connector_framework.ccf_client import CCFClient
 from custom_connector_framework.custom_connector_interface import \
@@ -19,12 +20,35 @@ from custom_connector_framework.models.qbusiness import (
     Principal, PrincipalGroup, PrincipalUser, QBusinessDocument, Value)
 from custom_connector_framework.utils import JsonSerializer
 
+SAMPLE_CONTENT = b"Test content"
+
+# Fixed document timestamps so metadata and expected requests are identical across tests
+FIXED_TIMESTAMP = "2024-01-01T00:00:00+00:00"
+
+SAMPLE_SOURCE_URI = "https://example.com/test-document"
+
+SAMPLE_PRINCIPALS = [
+    Principal(user=PrincipalUser(access=AccessType.ALLOW, id="user@example.com", membershipType=MembershipType.INDEX)),
+    Principal(
+        group=PrincipalGroup(access=AccessType.ALLOW, name="engineering-group", membershipType=MembershipType.INDEX)
+    ),
+    Principal(
+        group=PrincipalGroup(access=AccessType.DENY, name="restricted-group", membershipType=MembershipType.INDEX)
+    ),
+]
+
+SAMPLE_ACCESS_CONTROLS = [AccessControl(memberRelation=MemberRelation.AND, principals=[SAMPLE_PRINCIPALS[0]])]
+
 
 class TestQBusinessConnector(QBusinessCustomConnectorInterface):
     """Test implementation of QBusinessCustomConnectorInterface."""
 
-    _documents_to_add = []
-    _documents_to_delete = []
+    __slots__ = ("_documents_to_add", "_documents_to_delete")
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._documents_to_add = []
+        self._documents_to_delete = []
 
     def get_documents_to_add(self) -> Iterator[Document]:
         return iter(self._documents_to_add)
@@ -39,7 +63,34 @@ class TestQBusinessConnector(QBusinessCustomConnectorInterface):
         self._documents_to_delete = document_ids
 
 
-@pytest.fixture
+class FakeCCFClient:
+    """
+    Minimal stand-in for the boto3 CCF client.
+
+    Responses are registered per operation with a Stubber-like add_response and served from a dict.
+    When expected parameters are given, the actual call parameters must match them.
+    """
+
+    def __init__(self):
+        self._responses = {}
+
+    def add_response(self, operation_name, response, expected_params=None):
+        self._responses[operation_name] = (response, expected_params)
+
+    def _respond(self, operation_name, params):
+        response, expected_params = self._responses.get(operation_name, ({}, None))
+        if expected_params is not None:
+            assert params == expected_params, f"Unexpected parameters for {operation_name}: {params}"
+        return response
+
+    def list_custom_connector_documents(self, **kwargs):
+        return self._respond("list_custom_connector_documents", kwargs)
+
+    def batch_put_custom_connector_documents(self, **kwargs):
+        return self._respond("batch_put_custom_connector_documents", kwargs)
+
+
+@pytest.fixture(scope="session")
 def test_ids():
     return {
         "application_id": str(uuid.uuid4()),
@@ -53,53 +104,88 @@ def execution_id():
     return str(uuid.uuid4())
 
 
-@pytest.fixture
-def sample_principals():
-    return [
-        Principal(
-            user=PrincipalUser(access=AccessType.ALLOW, id="user@example.com", membershipType=MembershipType.INDEX)
-        ),
-        Principal(
-            group=PrincipalGroup(access=AccessType.ALLOW, name="engineering-group", membershipType=MembershipType.INDEX)
-        ),
-        Principal(
-            group=PrincipalGroup(access=AccessType.DENY, name="restricted-group", membershipType=MembershipType.INDEX)
-        ),
-    ]
+@pytest.fixture(scope="session")
+def sync_job_params(test_ids):
+    # Parameters shared by the start and stop data source sync job calls
+    return {
+        "applicationId": test_ids["application_id"],
+        "indexId": test_ids["index_id"],
+        "dataSourceId": test_ids["data_source_id"],
+    }
+
+
+@pytest.fixture(scope="session")
+def sample_metadata():
+    return DocumentMetadata(
+        title="Test Document",
+        source_uri=SAMPLE_SOURCE_URI,
+        last_updated_at=FIXED_TIMESTAMP,
+        created_at=FIXED_TIMESTAMP,
+        access_control_list=SAMPLE_ACCESS_CONTROLS,
+    )
+
+
+@pytest.fixture(scope="session")
+def large_metadata():
+    return DocumentMetadata(
+        title="Large Document",
+        source_uri=SAMPLE_SOURCE_URI,
+        last_updated_at=FIXED_TIMESTAMP,
+        created_at=FIXED_TIMESTAMP,
+        access_control_list=SAMPLE_ACCESS_CONTROLS,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _boto_client(service_name):
+    """Create a boto3 client once per service so its service model is only loaded once."""
+    return boto3.client(service_name, region_name="us-east-1")
 
 
 @pytest.fixture
 def mock_qbusiness_client():
-    client = boto3.client("qbusiness", region_name="us-east-1")
+    # The client is shared across tests, so each test gets its own stubber and releases it afterwards
+    client = _boto_client("qbusiness")
     stubber = Stubber(client)
-    return client, stubber
+    yield client, stubber
+    stubber.deactivate()
 
 
 @pytest.fixture
 def mock_s3_client():
-    client = boto3.client("s3", region_name="us-east-1")
+    client = _boto_client("s3")
     stubber = Stubber(client)
-    return client, stubber
-
-
-@pytest.fixture
-def sample_text_file():
-    with tempfile.NamedTemporaryFile(suffix=".txt", mode="w", delete=False) as f:
-        f.write("Test content")
-    file_path = Path(f.name)
-    yield file_path
-    file_path.unlink()
+    yield client, stubber
+    stubber.deactivate()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_text_file():
-    # Create a file larger than 10MB but smaller than 50MB
+    # Create a file larger than 10MB but smaller than 50MB, sparse-allocated so no content is written
     size = 15 * 1024 * 1024  # 15MB
-    with tempfile.NamedTemporaryFile(suffix=".txt", mode="wb", delete=False) as f:
-        f.write(b"0" * size)
-    file_path = Path(f.name)
-    yield file_path
-    file_path.unlink()
+    fd, path = tempfile.mkstemp(suffix=".txt")
+    os.ftruncate(fd, size)
+    os.close(fd)
+    # Removed along with the session temporary directory
+    return Path(path)
+
+
+@pytest.fixture(scope="session")
+def small_doc(sample_metadata):
+    return Document(
+        id="test-doc", file=DocumentFile.from_bytes(SAMPLE_CONTENT, suffix=".txt"), metadata=sample_metadata
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_checksum(small_doc):
+    # The document is session-scoped, so its checksum only needs to be hashed once
+    return small_doc.get_checksum()
+
+
+@pytest.fixture(scope="session")
+def large_doc(large_text_file, large_metadata):
+    return Document(id="large-doc", file=DocumentFile(large_text_file), metadata=large_metadata)
 
 
 @pytest.fixture
@@ -121,204 +207,217 @@ def connector(mock_qbusiness_client, mock_s3_client, test_ids):
 
 @pytest.fixture
 def mock_ccf_client():
-    """Mock CCF client since the service definition is only available after deployment."""
-    # Create a mock boto3 client that doesn't require the actual CCF service
-    mock_client = MagicMock()
-
-    # Create a stubber-like object for consistency with other tests
-    class MockStubber:
-        def __init__(self, client):
-            self.client = client
-            self._responses = []
-            self._current_response = 0
-
-        def add_response(self, operation_name, response, expected_params=None):
-            self._responses.append(
-                {"operation": operation_name, "response": response, "expected_params": expected_params}
-            )
-
-        def __enter__(self):
-            # Set up the mock client to return responses in order
-            def create_side_effect(operation):
-                def side_effect(*args, **kwargs):
-                    for resp in self._responses:
-                        if resp["operation"] == operation:
-                            return resp["response"]
-                    return {}
+    """Fake CCF client since the service definition is only available after deployment."""
+    return FakeCCFClient()
 
-                return side_effect
 
-            # Mock the specific operations used in tests
-            mock_client.list_custom_connector_documents = MagicMock(
-                side_effect=create_side_effect("list_custom_connector_documents")
-            )
-            mock_client.batch_put_custom_connector_documents = MagicMock(
-                side_effect=create_side_effect("batch_put_custom_connector_documents")
-            )
-            return self
-
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            pass
-
-    stubber = MockStubber(mock_client)
-    return mock_client, stubber
-
-
-def test_when_small_file_uploaded_then_inline_content_used(
-    connector, sample_text_file, execution_id, sample_principals
+def _expected_batch_put_request(  # noqa: PLR0913
+    application_id, index_id, execution_id, doc_id, title, last_updated_at, created_at, blob=None, s3_key=None
 ):
-    connector_instance, stubber, _, test_ids = connector
+    """
+    Build the expected BatchPutDocument request for a single document.
 
-    access_controls = [AccessControl(memberRelation=MemberRelation.AND, principals=[sample_principals[0]])]
+    The request is written out as the wire-format dict rather than dumped from the Pydantic models;
+    test_expected_batch_put_request_matches_model_serialization keeps the two in sync.
+    """
+    content = {"blob": blob} if s3_key is None else {"s3": {"bucket": "test-bucket", "key": s3_key}}
+    return {
+        "applicationId": application_id,
+        "indexId": index_id,
+        "documents": [
+            {
+                "id": doc_id,
+                "title": title,
+                "contentType": "PLAIN_TEXT",
+                "content": content,
+                "attributes": [
+                    {"name": "_source_uri", "value": {"stringValue": SAMPLE_SOURCE_URI}},
+                    {"name": "_last_updated_at", "value": {"stringValue": last_updated_at}},
+                    {"name": "_created_at", "value": {"stringValue": created_at}},
+                ],
+                "accessConfiguration": {
+                    "accessControls": [
+                        {
+                            "principals": [
+                                {"user": {"access": "ALLOW", "id": "user@example.com", "membershipType": "INDEX"}}
+                            ],
+                            "memberRelation": "AND",
+                        }
+                    ],
+                    "memberRelation": "AND",
+                },
+            }
+        ],
+        "dataSourceSyncId": execution_id,
+    }
 
-    metadata = DocumentMetadata(title="Test Document", access_control_list=access_controls)
-    doc = Document(id="test-doc", file=DocumentFile(sample_text_file), metadata=metadata)
-    connector_instance.set_documents_to_add([doc])
 
-    # 1. Start sync job
-    stubber.add_response(
-        "start_data_source_sync_job",
-        {"executionId": execution_id},
-        {
-            "applicationId": test_ids["application_id"],
-            "indexId": test_ids["index_id"],
-            "dataSourceId": test_ids["data_source_id"],
-        },
-    )
+def _add_sync_stubs(stubber, sync_job_params, execution_id, expected_request):
+    """Queue the start sync job, batch put document and stop sync job responses in call order."""
+    stubber.add_response("start_data_source_sync_job", {"executionId": execution_id}, sync_job_params)
+    stubber.add_response("batch_put_document", {"failedDocuments": []}, expected_request)
+    stubber.add_response("stop_data_source_sync_job", {}, sync_job_params)
 
-    # 2. Batch put document
-    with open(sample_text_file, "rb") as f:
-        content = f.read()
-
-    qbusiness_doc = QBusinessDocument(
-        id="test-doc",
-        title="Test Document",
-        contentType="PLAIN_TEXT",
-        content=DocumentContent(blob=content),
-        attributes=[
-            DocumentAttribute(name="_last_updated_at", value=Value(stringValue=metadata.last_updated_at)),
-            DocumentAttribute(name="_created_at", value=Value(stringValue=metadata.created_at)),
-        ],
-        accessConfiguration=AccessConfiguration(accessControls=access_controls, memberRelation=MemberRelation.AND),
-    )
 
+@pytest.mark.parametrize(
+    "content",
+    [{"blob": SAMPLE_CONTENT}, {"s3_key": "qbusiness-docs/large-doc.txt"}],
+    ids=["inline-content", "s3-content"],
+)
+def test_expected_batch_put_request_matches_model_serialization(content, test_ids, execution_id):
+    blob = content.get("blob")
+    s3_key = content.get("s3_key")
     request = BatchPutDocumentRequest(
         applicationId=test_ids["application_id"],
         indexId=test_ids["index_id"],
-        documents=[qbusiness_doc],
+        documents=[
+            QBusinessDocument(
+                id="doc-1",
+                title="Test Document",
+                contentType="PLAIN_TEXT",
+                content=(
+                    DocumentContent(blob=blob)
+                    if s3_key is None
+                    else DocumentContent(s3={"bucket": "test-bucket", "key": s3_key})
+                ),
+                attributes=[
+                    DocumentAttribute(name="_source_uri", value=Value(stringValue=SAMPLE_SOURCE_URI)),
+                    DocumentAttribute(name="_last_updated_at", value=Value(stringValue=FIXED_TIMESTAMP)),
+                    DocumentAttribute(name="_created_at", value=Value(stringValue=FIXED_TIMESTAMP)),
+                ],
+                accessConfiguration=AccessConfiguration(
+                    accessControls=SAMPLE_ACCESS_CONTROLS, memberRelation=MemberRelation.AND
+                ),
+            )
+        ],
         dataSourceSyncId=execution_id,
     )
 
-    expected_request = JsonSerializer.serialize(request.model_dump(exclude_none=True))
-
-    # 3. Stop sync job
-    stubber.add_response(
-        "stop_data_source_sync_job",
-        {},
-        {
-            "applicationId": test_ids["application_id"],
-            "indexId": test_ids["index_id"],
-            "dataSourceId": test_ids["data_source_id"],
-        },
+    assert JsonSerializer.serialize(request.model_dump(by_alias=True, exclude_none=True)) == (
+        _expected_batch_put_request(
+            test_ids["application_id"],
+            test_ids["index_id"],
+            execution_id,
+            "doc-1",
+            "Test Document",
+            FIXED_TIMESTAMP,
+            FIXED_TIMESTAMP,
+            **content,
+        )
     )
 
-    # 4. Add batch put document response last
-    stubber.add_response("batch_put_document", {"failedDocuments": []}, expected_request)
 
-    with stubber:
-        connector_instance.sync()
-
-
-def test_when_large_file_uploaded_then_s3_content_used(connector, large_text_file, execution_id, sample_principals):
+@pytest.mark.parametrize(
+    ("use_large_file", "use_ccf"),
+    [
+        pytest.param(False, False, id="small-file-inline-content"),
+        pytest.param(True, False, id="large-file-s3-content"),
+        pytest.param(False, True, id="ccf-first-sync"),
+    ],
+)
+def test_when_documents_uploaded_then_batch_put_called(  # noqa: PLR0913
+    use_large_file,
+    use_ccf,
+    connector,
+    execution_id,
+    sync_job_params,
+    small_doc,
+    large_doc,
+    mock_ccf_client,
+    sample_checksum,
+):
     connector_instance, stubber, s3_stubber, test_ids = connector
 
-    access_controls = [AccessControl(memberRelation=MemberRelation.AND, principals=[sample_principals[0]])]
-
-    metadata = DocumentMetadata(title="Large Document", access_control_list=access_controls)
-    doc = Document(id="large-doc", file=DocumentFile(large_text_file), metadata=metadata)
+    if use_large_file:
+        # Documents over 10MB are uploaded to S3 and referenced by key
+        doc = large_doc
+        s3_key = f"qbusiness-docs/large-doc{large_doc.file.file_path.suffix}"
+        # Match any body rather than reading the 15MB file back just to compare it
+        s3_stubber.add_response("put_object", {}, {"Bucket": "test-bucket", "Key": s3_key, "Body": ANY})
+        content = {"s3_key": s3_key}
+    else:
+        doc = small_doc
+        content = {"blob": SAMPLE_CONTENT}
     connector_instance.set_documents_to_add([doc])
 
-    # 1. Start sync job
-    stubber.add_response(
-        "start_data_source_sync_job",
-        {"executionId": execution_id},
-        {
-            "applicationId": test_ids["application_id"],
-            "indexId": test_ids["index_id"],
-            "dataSourceId": test_ids["data_source_id"],
-        },
-    )
-
-    # 2. S3 upload
-    s3_key = f"qbusiness-docs/large-doc{large_text_file.suffix}"
-    with open(large_text_file, "rb") as f:
-        content = f.read()
-        s3_stubber.add_response(
-            "put_object",
+    if use_ccf:
+        # No documents are known to CCF yet, so the document is uploaded and its checksum recorded
+        connector_instance.ccf_client = CCFClient(mock_ccf_client, "test-connector-id")
+        mock_ccf_client.add_response(
+            "list_custom_connector_documents",
+            {"documents": []},
+            {"connector_id": "test-connector-id"},
+        )
+        mock_ccf_client.add_response(
+            "batch_put_custom_connector_documents",
             {},
             {
-                "Bucket": "test-bucket",
-                "Key": s3_key,
-                "Body": content,
+                "connector_id": "test-connector-id",
+                "documents": [{"document_id": doc.id, "checksum": sample_checksum}],
             },
         )
 
-    # 3. Create request with S3 reference
-    qbusiness_doc = QBusinessDocument(
-        id="large-doc",
-        title="Large Document",
-        contentType="PLAIN_TEXT",
-        content=DocumentContent(s3={"bucket": "test-bucket", "key": s3_key}),
-        attributes=[
-            DocumentAttribute(name="_last_updated_at", value=Value(stringValue=metadata.last_updated_at)),
-            DocumentAttribute(name="_created_at", value=Value(stringValue=metadata.created_at)),
-        ],
-        accessConfiguration=AccessConfiguration(accessControls=access_controls, memberRelation=MemberRelation.AND),
+    expected_request = _expected_batch_put_request(
+        test_ids["application_id"],
+        test_ids["index_id"],
+        execution_id,
+        doc.id,
+        doc.metadata.title,
+        FIXED_TIMESTAMP,
+        FIXED_TIMESTAMP,
+        **content,
     )
+    _add_sync_stubs(stubber, sync_job_params, execution_id, expected_request)
 
-    request = BatchPutDocumentRequest(
-        applicationId=test_ids["application_id"],
-        indexId=test_ids["index_id"],
-        documents=[qbusiness_doc],
-        dataSourceSyncId=execution_id,
-    )
+    with stubber, s3_stubber:
+        connector_instance.sync()
 
-    expected_request = JsonSerializer.serialize(request.model_dump(exclude_none=True))
+    stubber.assert_no_pending_responses()
+    s3_stubber.assert_no_pending_responses()
 
-    # 4. Stop sync job
-    stubber.add_response(
-        "stop_data_source_sync_job",
-        {},
-        {
-            "applicationId": test_ids["application_id"],
-            "indexId": test_ids["index_id"],
-            "dataSourceId": test_ids["data_source_id"],
-        },
+
+def test_when_document_has_no_source_uri_then_source_uri_attribute_omitted(connector, execution_id, sync_job_params):
+    connector_instance, stubber, _, test_ids = connector
+
+    metadata = DocumentMetadata(
+        title="No Source Document",
+        last_updated_at=FIXED_TIMESTAMP,
+        created_at=FIXED_TIMESTAMP,
+        access_control_list=SAMPLE_ACCESS_CONTROLS,
     )
+    doc = Document(id="no-source-doc", file=DocumentFile.from_bytes(SAMPLE_CONTENT, suffix=".txt"), metadata=metadata)
+    connector_instance.set_documents_to_add([doc])
 
-    # 5. Batch put document
-    stubber.add_response("batch_put_document", {"failedDocuments": []}, expected_request)
+    request = _expected_batch_put_request(
+        test_ids["application_id"],
+        test_ids["index_id"],
+        execution_id,
+        doc.id,
+        metadata.title,
+        FIXED_TIMESTAMP,
+        FIXED_TIMESTAMP,
+        blob=SAMPLE_CONTENT,
+    )
+    # Same request without the _source_uri attribute, an empty Value union is rejected by botocore
+    document = request["documents"][0]
+    attributes = [attribute for attribute in document["attributes"] if attribute["name"] != "_source_uri"]
+    expected_request = {**request, "documents": [{**document, "attributes": attributes}]}
+    _add_sync_stubs(stubber, sync_job_params, execution_id, expected_request)
 
-    with stubber, s3_stubber:
+    with stubber:
         connector_instance.sync()
 
+    stubber.assert_no_pending_responses()
+
 
-def test_when_documents_deleted_then_batch_delete_called(connector, execution_id):
+def test_when_documents_deleted_then_batch_delete_called(connector, execution_id, sync_job_params):
     connector_instance, stubber, _, test_ids = connector
 
     doc_ids = ["doc1", "doc2", "doc3"]
     connector_instance.set_documents_to_delete(doc_ids)
 
     # 1. Start sync job
-    stubber.add_response(
-        "start_data_source_sync_job",
-        {"executionId": execution_id},
-        {
-            "applicationId": test_ids["application_id"],
-            "indexId": test_ids["index_id"],
-            "dataSourceId": test_ids["data_source_id"],
-        },
-    )
+    stubber.add_response("start_data_source_sync_job", {"executionId": execution_id}, sync_job_params)
 
     # 2. Batch delete
     request = {
@@ -331,26 +430,16 @@ def test_when_documents_deleted_then_batch_delete_called(connector, execution_id
     stubber.add_response("batch_delete_document", {"failedDocuments": []}, request)
 
     # 3. Stop sync job
-    stubber.add_response(
-        "stop_data_source_sync_job",
-        {},
-        {
-            "applicationId": test_ids["application_id"],
-            "indexId": test_ids["index_id"],
-            "dataSourceId": test_ids["data_source_id"],
-        },
-    )
+    stubber.add_response("stop_data_source_sync_job", {}, sync_job_params)
 
     with stubber:
         connector_instance.sync()
 
 
-def test_when_sync_fails_then_exception_raised(connector, sample_text_file, execution_id):
-    connector_instance, stubber, _, test_ids = connector
+def test_when_sync_fails_then_exception_raised(connector, small_doc):
+    connector_instance, stubber, _, _ = connector
 
-    metadata = DocumentMetadata(title="Test Document")
-    doc = Document(id="test-doc", file=DocumentFile(sample_text_file), metadata=metadata)
-    connector_instance.set_documents_to_add([doc])
+    connector_instance.set_documents_to_add([small_doc])
 
     # 1. Start sync job - simulate failure
     stubber.add_client_error(
@@ -363,172 +452,51 @@ def test_when_sync_fails_then_exception_raised(connector, sample_text_file, exec
         connector_instance.sync()
 
 
-def test_when_document_type_unsupported_then_error_raised(connector, execution_id):
-    connector_instance, stubber, _, test_ids = connector
+def test_when_document_type_unsupported_then_error_raised(connector, execution_id, sync_job_params):
+    connector_instance, stubber, _, _ = connector
 
-    # Create a temporary file with unsupported extension
+    # Create a temporary file with unsupported extension, removed along with the session temporary directory
     with tempfile.NamedTemporaryFile(suffix=".xyz", mode="w", delete=False) as f:
         f.write("Test content")
     unsupported_file = Path(f.name)
 
-    try:
-        metadata = DocumentMetadata(title="Unsupported Document")
-        doc = Document(id="unsupported-doc", file=DocumentFile(unsupported_file), metadata=metadata)
-        connector_instance.set_documents_to_add([doc])
-
-        # Add start sync job response
-        stubber.add_response(
-            "start_data_source_sync_job",
-            {"executionId": execution_id},
-            {
-                "applicationId": test_ids["application_id"],
-                "indexId": test_ids["index_id"],
-                "dataSourceId": test_ids["data_source_id"],
-            },
-        )
-
-        # Add stop sync job response since it will be called in the finally block
-        stubber.add_response(
-            "stop_data_source_sync_job",
-            {},
-            {
-                "applicationId": test_ids["application_id"],
-                "indexId": test_ids["index_id"],
-                "dataSourceId": test_ids["data_source_id"],
-            },
-        )
-
-        with stubber:
-            with pytest.raises(UnsupportedDocumentError) as exc_info:
-                connector_instance.sync()
-            assert "Unable to determine content type for file" in str(exc_info.value)
-
-    finally:
-        # Clean up the temporary file
-        if unsupported_file.exists():
-            unsupported_file.unlink()
-
-
-@pytest.mark.ccf_required
-def test_when_ccf_enabled_checksums_used_for_sync(
-    connector, sample_text_file, execution_id, sample_principals, mock_ccf_client
-):
-    """Test that CCF checksums are used to determine which documents need syncing."""
-    connector_instance, stubber, _, test_ids = connector
-    ccf_client, ccf_stubber = mock_ccf_client
-
-    # Create CCF client and add it to connector
-    ccf_docs_client = CCFClient(ccf_client, "test-connector-id")
-    connector_instance.ccf_client = ccf_docs_client
-
-    # Create test document
-    access_controls = [AccessControl(memberRelation=MemberRelation.AND, principals=[sample_principals[0]])]
-    metadata = DocumentMetadata(title="Test Document", access_control_list=access_controls)
-    doc = Document(id="test-doc", file=DocumentFile(sample_text_file), metadata=metadata)
+    metadata = DocumentMetadata(title="Unsupported Document")
+    doc = Document(id="unsupported-doc", file=DocumentFile(unsupported_file), metadata=metadata)
     connector_instance.set_documents_to_add([doc])
 
-    # Calculate expected checksum
-    expected_checksum = doc.get_checksum()
-
-    # Setup CCF list documents response
-    ccf_stubber.add_response(
-        "list_custom_connector_documents",
-        {"documents": []},  # Empty list means no existing documents, omit next_token
-        {"connector_id": "test-connector-id"},
-    )
+    # Add start sync job response
+    stubber.add_response("start_data_source_sync_job", {"executionId": execution_id}, sync_job_params)
 
-    # Setup CCF batch put documents response
-    ccf_stubber.add_response(
-        "batch_put_custom_connector_documents",
-        {},
-        {
-            "connector_id": "test-connector-id",
-            "documents": [{"document_id": "test-doc", "checksum": expected_checksum}],
-        },
-    )
+    # Add stop sync job response since it will be called in the finally block
+    stubber.add_response("stop_data_source_sync_job", {}, sync_job_params)
 
-    # Setup Q Business responses
-    stubber.add_response(
-        "start_data_source_sync_job",
-        {"executionId": execution_id},
-        {
-            "applicationId": test_ids["application_id"],
-            "indexId": test_ids["index_id"],
-            "dataSourceId": test_ids["data_source_id"],
-        },
-    )
-
-    # Add batch put document response
-    with open(sample_text_file, "rb") as f:
-        content = f.read()
-
-    qbusiness_doc = QBusinessDocument(
-        id="test-doc",
-        title="Test Document",
-        contentType="PLAIN_TEXT",
-        content=DocumentContent(blob=content),
-        attributes=[
-            DocumentAttribute(name="_last_updated_at", value=Value(stringValue=metadata.last_updated_at)),
-            DocumentAttribute(name="_created_at", value=Value(stringValue=metadata.created_at)),
-        ],
-        accessConfiguration=AccessConfiguration(accessControls=access_controls, memberRelation=MemberRelation.AND),
-    )
-
-    request = BatchPutDocumentRequest(
-        applicationId=test_ids["application_id"],
-        indexId=test_ids["index_id"],
-        documents=[qbusiness_doc],
-        dataSourceSyncId=execution_id,
-    )
-
-    expected_request = JsonSerializer.serialize(request.model_dump(exclude_none=True))
-
-    # Stop sync job must be added before batch_put_document because of finally block
-    stubber.add_response(
-        "stop_data_source_sync_job",
-        {},
-        {
-            "applicationId": test_ids["application_id"],
-            "indexId": test_ids["index_id"],
-            "dataSourceId": test_ids["data_source_id"],
-        },
-    )
-
-    stubber.add_response("batch_put_document", {"failedDocuments": []}, expected_request)
-
-    with stubber, ccf_stubber:
-        connector_instance.sync()
+    with stubber:
+        with pytest.raises(UnsupportedDocumentError) as exc_info:
+            connector_instance.sync()
+        assert "Unable to determine content type for file" in str(exc_info.value)
 
 
-@pytest.mark.ccf_required
-def test_when_document_unchanged_then_skip_sync(
-    connector, sample_text_file, execution_id, sample_principals, mock_ccf_client
+def test_when_document_unchanged_then_skip_sync(  # noqa: PLR0913
+    connector, execution_id, sync_job_params, mock_ccf_client, small_doc, sample_checksum
 ):
     """Test that documents with unchanged checksums are skipped."""
-    connector_instance, stubber, _, test_ids = connector
-    ccf_client, ccf_stubber = mock_ccf_client
+    connector_instance, stubber, _, _ = connector
+    ccf_client = mock_ccf_client
 
     # Create CCF client and add it to connector
     ccf_docs_client = CCFClient(ccf_client, "test-connector-id")
     connector_instance.ccf_client = ccf_docs_client
 
-    # Create test document
-    access_controls = [AccessControl(memberRelation=MemberRelation.AND, principals=[sample_principals[0]])]
-    metadata = DocumentMetadata(title="Test Document", access_control_list=access_controls)
-    doc = Document(id="test-doc", file=DocumentFile(sample_text_file), metadata=metadata)
-    connector_instance.set_documents_to_add([doc])
-
-    # Calculate checksum
-    checksum = doc.get_checksum()
+    connector_instance.set_documents_to_add([small_doc])
 
     # Setup CCF list documents response with matching checksum
-    ccf_stubber.add_response(
+    ccf_client.add_response(
         "list_custom_connector_documents",
         {
             "documents": [
                 {
                     "document_id": "test-doc",
-                    "checksum": checksum,
+                    "checksum": sample_checksum,
                     "created_at": "2024-01-01T00:00:00Z",
                     "updated_at": "2024-01-01T00:00:00Z",
                 }
@@ -538,25 +506,9 @@ def test_when_document_unchanged_then_skip_sync(
     )
 
     # Setup Q Business responses - only start/stop since no sync needed
-    stubber.add_response(
-        "start_data_source_sync_job",
-        {"executionId": execution_id},
-        {
-            "applicationId": test_ids["application_id"],
-            "indexId": test_ids["index_id"],
-            "dataSourceId": test_ids["data_source_id"],
-        },
-    )
+    stubber.add_response("start_data_source_sync_job", {"executionId": execution_id}, sync_job_params)
 
-    stubber.add_response(
-        "stop_data_source_sync_job",
-        {},
-        {
-            "applicationId": test_ids["application_id"],
-            "indexId": test_ids["index_id"],
-            "dataSourceId": test_ids["data_source_id"],
-        },
-    )
+    stubber.add_response("stop_data_source_sync_job", {}, sync_job_params)
 
-    with stubber, ccf_stubber:
+    with stubber:
         connector_instance.sync()
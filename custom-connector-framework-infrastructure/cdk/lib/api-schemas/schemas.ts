@@ -574,6 +574,13 @@ export const startJobRequestSchema = {
       default: [],
       description: 'List of environment variables to pass to the connector job',
     },
+    idempotency_token: {
+      type: JsonSchemaType.STRING,
+      minLength: 1,
+      maxLength: 64,
+      description:
+        'Optional token that makes the request idempotent. Retrying with the same token returns the job started by the first request',
+    },
   },
 };
 
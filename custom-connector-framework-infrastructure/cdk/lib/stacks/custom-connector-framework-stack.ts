@@ -284,7 +284,9 @@ export class CustomConnectorFrameworkStack extends Stack {
           command: [
             'bash',
             '-c',
-            'pip install --no-cache-dir -r requirements.txt --platform manylinux2014_x86_64 --target /asset-output --only-binary=:all: && cp -au . /asset-output',
+            // Precompile bytecode: the Lambda filesystem is read-only, so modules would otherwise be compiled on every
+            // cold start. unchecked-hash keeps the .pyc files valid after the asset zip resets file timestamps.
+            'pip install --no-cache-dir -r requirements.txt --platform manylinux2014_x86_64 --target /asset-output --only-binary=:all: && cp -au . /asset-output && python -m compileall -q -j 0 --invalidation-mode unchecked-hash /asset-output',
           ],
           environment: {
             PIP_NO_CACHE_DIR: 'true',
@@ -392,6 +394,9 @@ export class CustomConnectorFrameworkStack extends Stack {
       schema: { type: apigateway.JsonSchemaType.OBJECT },
     });
 
+    // Every route is served by the same API handler Lambda, so all methods share one integration
+    const apiIntegration = new apigateway.LambdaIntegration(apiHandler);
+
     const commonErrorResponses = [
       {
         statusCode: schemas.errorStatusCodes.BAD_REQUEST,
@@ -411,7 +416,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       },
     ];
 
-    customConnectorsResource.addMethod('POST', new apigateway.LambdaIntegration(apiHandler), {
+    customConnectorsResource.addMethod('POST', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestModels: {
@@ -435,7 +440,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       schema: schemas.listConnectorsResponseSchema,
     });
 
-    customConnectorsResource.addMethod('GET', new apigateway.LambdaIntegration(apiHandler), {
+    customConnectorsResource.addMethod('GET', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       methodResponses: [
         {
@@ -457,7 +462,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       schema: schemas.getConnectorResponseSchema,
     });
 
-    connectorResource.addMethod('GET', new apigateway.LambdaIntegration(apiHandler), {
+    connectorResource.addMethod('GET', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -487,7 +492,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       schema: schemas.updateConnectorResponseSchema,
     });
 
-    connectorResource.addMethod('PUT', new apigateway.LambdaIntegration(apiHandler), {
+    connectorResource.addMethod('PUT', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -508,7 +513,7 @@ export class CustomConnectorFrameworkStack extends Stack {
     });
 
     // DELETE /api/v1/custom-connectors/{connector_id} - Delete custom connector
-    connectorResource.addMethod('DELETE', new apigateway.LambdaIntegration(apiHandler), {
+    connectorResource.addMethod('DELETE', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -540,7 +545,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       schema: schemas.startJobResponseSchema,
     });
 
-    jobsResource.addMethod('POST', new apigateway.LambdaIntegration(apiHandler), {
+    jobsResource.addMethod('POST', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -567,7 +572,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       schema: schemas.listJobsResponseSchema,
     });
 
-    jobsResource.addMethod('GET', new apigateway.LambdaIntegration(apiHandler), {
+    jobsResource.addMethod('GET', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -588,7 +593,7 @@ export class CustomConnectorFrameworkStack extends Stack {
     const stopJobResource = jobResource.addResource('stop');
 
     // POST /api/v1/custom-connectors/{connector_id}/jobs/{job_id}/stop - Stop custom connector job
-    stopJobResource.addMethod('POST', new apigateway.LambdaIntegration(apiHandler), {
+    stopJobResource.addMethod('POST', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -618,7 +623,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       }
     );
 
-    documentsResource.addMethod('POST', new apigateway.LambdaIntegration(apiHandler), {
+    documentsResource.addMethod('POST', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -648,7 +653,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       }
     );
 
-    documentsResource.addMethod('DELETE', new apigateway.LambdaIntegration(apiHandler), {
+    documentsResource.addMethod('DELETE', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -674,7 +679,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       schema: schemas.listDocumentsResponseSchema,
     });
 
-    documentsResource.addMethod('GET', new apigateway.LambdaIntegration(apiHandler), {
+    documentsResource.addMethod('GET', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -700,7 +705,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       schema: schemas.putCheckpointRequestSchema,
     });
 
-    checkpointResource.addMethod('PUT', new apigateway.LambdaIntegration(apiHandler), {
+    checkpointResource.addMethod('PUT', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -727,7 +732,7 @@ export class CustomConnectorFrameworkStack extends Stack {
       schema: schemas.getCheckpointResponseSchema,
     });
 
-    checkpointResource.addMethod('GET', new apigateway.LambdaIntegration(apiHandler), {
+    checkpointResource.addMethod('GET', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -745,7 +750,7 @@ export class CustomConnectorFrameworkStack extends Stack {
     });
 
     // DELETE /api/v1/custom-connectors/{connector_id}/checkpoint - Delete custom connector checkpoint
-    checkpointResource.addMethod('DELETE', new apigateway.LambdaIntegration(apiHandler), {
+    checkpointResource.addMethod('DELETE', apiIntegration, {
       authorizationType: apigateway.AuthorizationType.IAM,
       requestValidator: requestValidator,
       requestParameters: {
@@ -1,17 +1,73 @@
 #!/usr/bin/env python3
+import functools
+import hashlib
 import json
 import os
+import shutil
 import sys
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set
+from urllib.parse import urlparse
+
+try:
+    import orjson
+except ImportError:  # Fall back to the standard library when the orjson wheel is not installed
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # Large specs are loaded whole when the ijson package is not installed
+    ijson = None
+
+# Directory holding service models already generated for a given spec
+_CACHE_DIR = ".cache"
+
+# Specs at least this many bytes are streamed with ijson instead of decoded in one piece
+_STREAMING_SPEC_SIZE = 512 * 1024
+
+# Prefix shared by all references to component schemas
+_REF_PREFIX = "#/components/schemas/"
+
+# Primitive shapes every service model starts with
+_BASIC_SHAPES = {
+    "String": {"type": "string"},
+    "Integer": {"type": "integer"},
+    "Boolean": {"type": "boolean"},
+    "Timestamp": {"type": "timestamp"},
+    "Float": {"type": "float"},
+    "Document": {"type": "structure", "document": True}
+}
+
+# Service model operation name for each (HTTP method, path) in the API
+_OPERATION_NAME_MAPPING = {
+    ("POST", "/api/v1/custom-connectors"): "CreateCustomConnector",
+    ("GET", "/api/v1/custom-connectors/{connector_id}"): "GetCustomConnector",
+    ("PUT", "/api/v1/custom-connectors/{connector_id}"): "UpdateCustomConnector",
+    ("GET", "/api/v1/custom-connectors"): "ListCustomConnectors",
+    ("DELETE", "/api/v1/custom-connectors/{connector_id}"): "DeleteCustomConnector",
+    ("POST", "/api/v1/custom-connectors/{connector_id}/jobs"): "StartCustomConnectorJob",
+    ("GET", "/api/v1/custom-connectors/{connector_id}/jobs"): "ListCustomConnectorJobs",
+    ("POST", "/api/v1/custom-connectors/{connector_id}/jobs/{job_id}/stop"): "StopCustomConnectorJob",
+    ("POST", "/api/v1/custom-connectors/{connector_id}/documents"): "BatchPutCustomConnectorDocuments",
+    ("GET", "/api/v1/custom-connectors/{connector_id}/documents"): "ListCustomConnectorDocuments",
+    ("DELETE", "/api/v1/custom-connectors/{connector_id}/documents"): "BatchDeleteCustomConnectorDocuments",
+    ("GET", "/api/v1/custom-connectors/{connector_id}/checkpoint"): "GetCustomConnectorCheckpoint",
+    ("PUT", "/api/v1/custom-connectors/{connector_id}/checkpoint"): "PutCustomConnectorCheckpoint",
+    ("DELETE", "/api/v1/custom-connectors/{connector_id}/checkpoint"): "DeleteCustomConnectorCheckpoint"
+}
+
+# Shape names already resolved for a (parent shape, property name, property type) key
+_property_shape_cache: Dict[tuple, str] = {}
 
 def convert_openapi_to_service_model(openapi_path: str, service_name: str = "ccf") -> Dict[str, Any]:
     """
     Convert an OpenAPI 3.0 specification to an AWS service model format
     that can be used with `aws configure add-model`.
     """
+    # Shape names cached by a previous conversion refer to that conversion's shapes
+    _property_shape_cache.clear()
+    
     # Load the OpenAPI spec
-    with open(openapi_path, 'r', encoding="utf-8") as f:
-        openapi_spec = json.load(f)
+    openapi_spec = load_openapi_spec(openapi_path)
     
     # Get the API Gateway endpoint URL from the OpenAPI spec
     api_gateway_url = None
@@ -19,220 +75,204 @@ def convert_openapi_to_service_model(openapi_path: str, service_name: str = "ccf
         api_gateway_url = openapi_spec["servers"][0].get("url")
     
     # Create the basic service model structure
+    info = openapi_spec.get("info", {})
     service_model = {
         "version": "2.0",
         "metadata": {
-            "apiVersion": openapi_spec.get("info", {}).get("version", "2025-06-01"),
+            "apiVersion": info.get("version", "2025-06-01"),
             "endpointPrefix": service_name,
             "jsonVersion": "1.1",
             "protocol": "rest-json",
-            "serviceFullName": openapi_spec.get("info", {}).get("title", "Custom Connector Framework"),
+            "serviceFullName": info.get("title", "Custom Connector Framework"),
             "serviceId": service_name,
             "signatureVersion": "v4",
             "uid": f"{service_name}-2025-06-01",
             "signingName": "execute-api"
         },
         "operations": {},
-        "shapes": {},
-        "documentation": openapi_spec.get("info", {}).get("description", "Custom Connector Framework API")
+        # Start from the basic shapes, copied so the module-level templates are never mutated
+        "shapes": {shape_name: dict(shape) for shape_name, shape in _BASIC_SHAPES.items()},
+        "documentation": info.get("description", "Custom Connector Framework API")
     }
     
     # Add endpoint information if available
     if api_gateway_url:
         # Extract the hostname from the URL
-        import re
-        hostname_match = re.search(r'https?://([^/]+)', api_gateway_url)
-        if hostname_match:
-            hostname = hostname_match.group(1)
+        hostname = urlparse(api_gateway_url).netloc
+        if hostname:
             service_model["metadata"]["endpoint"] = hostname
             service_model["metadata"]["hostname"] = hostname
     
-    # Add basic shapes
-    service_model["shapes"]["String"] = {"type": "string"}
-    service_model["shapes"]["Integer"] = {"type": "integer"}
-    service_model["shapes"]["Boolean"] = {"type": "boolean"}
-    service_model["shapes"]["Timestamp"] = {"type": "timestamp"}
-    service_model["shapes"]["Float"] = {"type": "float"}
-    service_model["shapes"]["Document"] = {"type": "structure", "document": True}
-    
-    # Operation name mapping
-    operation_name_mapping = {
-        ("POST", "/api/v1/custom-connectors"): "CreateCustomConnector",
-        ("GET", "/api/v1/custom-connectors/{connector_id}"): "GetCustomConnector",
-        ("PUT", "/api/v1/custom-connectors/{connector_id}"): "UpdateCustomConnector",
-        ("GET", "/api/v1/custom-connectors"): "ListCustomConnectors",
-        ("DELETE", "/api/v1/custom-connectors/{connector_id}"): "DeleteCustomConnector",
-        ("POST", "/api/v1/custom-connectors/{connector_id}/jobs"): "StartCustomConnectorJob",
-        ("GET", "/api/v1/custom-connectors/{connector_id}/jobs"): "ListCustomConnectorJobs",
-        ("POST", "/api/v1/custom-connectors/{connector_id}/jobs/{job_id}/stop"): "StopCustomConnectorJob",
-        ("POST", "/api/v1/custom-connectors/{connector_id}/documents"): "BatchPutCustomConnectorDocuments",
-        ("GET", "/api/v1/custom-connectors/{connector_id}/documents"): "ListCustomConnectorDocuments",
-        ("DELETE", "/api/v1/custom-connectors/{connector_id}/documents"): "BatchDeleteCustomConnectorDocuments",
-        ("GET", "/api/v1/custom-connectors/{connector_id}/checkpoint"): "GetCustomConnectorCheckpoint",
-        ("PUT", "/api/v1/custom-connectors/{connector_id}/checkpoint"): "PutCustomConnectorCheckpoint",
-        ("DELETE", "/api/v1/custom-connectors/{connector_id}/checkpoint"): "DeleteCustomConnectorCheckpoint"
-    }
     
-    # Process paths and operations
-    for path, path_item in openapi_spec.get("paths", {}).items():
-        for method, operation in path_item.items():
-            if method.upper() not in ["GET", "POST", "PUT", "DELETE", "PATCH"]:
-                continue
-                
-            # Get the operation name from the mapping
-            operation_name = operation_name_mapping.get((method.upper(), path))
-            if not operation_name:
-                continue
-            
-            # Create request and response shapes
-            input_shape_name = f"{operation_name}Request"
-            output_shape_name = f"{operation_name}Response"
-            
-            # Create operation entry
-            service_model["operations"][operation_name] = {
-                "name": operation_name,
-                "http": {
-                    "method": method.upper(),
-                    "requestUri": path,
-                    "responseCode": 200
-                },
-                "documentation": operation.get("description", f"{operation_name} operation")
-            }
-            
-            # Process parameters and create input shape
-            input_shape = {"type": "structure", "required": [], "members": {}}
-            
-            # Process path parameters
-            path_params = [p for p in operation.get("parameters", []) if p.get("in") == "path"]
-            for param in path_params:
-                param_name = param.get("name")
-                param_schema = param.get("schema", {})
-                param_type = param_schema.get("type", "string")
-                
-                # Add to required list if required
-                if param.get("required", False):
-                    input_shape["required"].append(param_name)
-                
-                # Add member to input shape
-                input_shape["members"][param_name] = {
-                    "shape": map_type_to_shape(param_type),
-                    "location": "uri",
-                    "locationName": param_name,
-                    "documentation": param.get("description", f"The {param_name} parameter")
-                }
-            
-            # Process query parameters
-            query_params = [p for p in operation.get("parameters", []) if p.get("in") == "query"]
-            for param in query_params:
-                param_name = param.get("name")
-                param_schema = param.get("schema", {})
-                param_type = param_schema.get("type", "string")
+    # Process the mapped operations, looking each one up in the spec
+    paths = openapi_spec.get("paths", {})
+    for (method, path), operation_name in _OPERATION_NAME_MAPPING.items():
+        operation = paths.get(path, {}).get(method.lower())
+        if not operation:
+            continue
+        
+        # Create request and response shapes
+        input_shape_name = f"{operation_name}Request"
+        output_shape_name = f"{operation_name}Response"
+        
+        # Create operation entry
+        service_model["operations"][operation_name] = {
+            "name": operation_name,
+            "http": {
+                "method": method,
+                "requestUri": path,
+                "responseCode": 200
+            },
+            "documentation": operation.get("description", f"{operation_name} operation")
+        }
+        
+        # Process parameters and create input shape
+        input_shape = {"type": "structure", "required": [], "members": {}}
+        
+        # Split the parameters into path and query parameters in a single pass
+        path_params = []
+        query_params = []
+        for param in operation.get("parameters") or []:
+            param_location = param.get("in")
+            if param_location == "path":
+                path_params.append(param)
+            elif param_location == "query":
+                query_params.append(param)
+        
+        # Process path parameters, then query parameters
+        for param in path_params:
+            add_parameter_member(input_shape, param, "uri")
+        for param in query_params:
+            add_parameter_member(input_shape, param, "querystring")
+        
+        # Process request body if it exists
+        if operation.get("requestBody"):
+            content_type = next(iter(operation["requestBody"].get("content", {})), None)
+            if content_type and content_type == "application/json":
+                schema_ref = operation["requestBody"]["content"][content_type].get("schema", {}).get("$ref")
                 
-                # Add to required list if required
-                if param.get("required", False):
-                    input_shape["required"].append(param_name)
+                if schema_ref:
+                    # Extract schema name from reference
+                    schema_name = schema_name_from_ref(schema_ref)
+                    schema = openapi_spec["components"]["schemas"][schema_name]
+                    
+                    # Create shapes for the schema properties
+                    for prop_name, prop_schema in schema.get("properties", {}).items():
+                        prop_shape_name = get_shape_for_property(prop_name, prop_schema, schema_name, service_model["shapes"])
+                        
+                        # Add to required list if the property is required in the schema
+                        if prop_name in schema.get("required", []):
+                            input_shape["required"].append(prop_name)
+                        
+                        # Add member to input shape as a top-level parameter
+                        input_shape["members"][prop_name] = {
+                            "shape": prop_shape_name,
+                            "documentation": prop_schema.get("description", f"The {prop_name} property")
+                        }
+        
+        # Add input shape to service model if it has members
+        if input_shape["members"]:
+            service_model["shapes"][input_shape_name] = input_shape
+            service_model["operations"][operation_name]["input"] = {"shape": input_shape_name}
+        
+        # Process responses
+        for status_code, response in operation.get("responses", {}).items():
+            if status_code.startswith("2"):  # 2xx responses
+                service_model["operations"][operation_name]["http"]["responseCode"] = int(status_code)
                 
-                # Add member to input shape
-                input_shape["members"][param_name] = {
-                    "shape": map_type_to_shape(param_type),
-                    "location": "querystring",
-                    "locationName": param_name,
-                    "documentation": param.get("description", f"The {param_name} parameter")
-                }
-            
-            # Process request body if it exists
-            if operation.get("requestBody"):
-                content_type = next(iter(operation["requestBody"].get("content", {})), None)
-                if content_type and content_type == "application/json":
-                    schema_ref = operation["requestBody"]["content"][content_type].get("schema", {}).get("$ref")
+                if "content" in response and "application/json" in response["content"]:
+                    schema_ref = response["content"]["application/json"].get("schema", {}).get("$ref")
                     
                     if schema_ref:
                         # Extract schema name from reference
-                        schema_name = schema_ref.split("/")[-1]
+                        schema_name = schema_name_from_ref(schema_ref)
                         schema = openapi_spec["components"]["schemas"][schema_name]
                         
-                        # Create shapes for the schema properties
+                        # Create shapes for the schema
+                        process_schema(schema, schema_name, service_model["shapes"])
+                        
+                        # Create output shape that directly maps to the response schema
+                        output_shape = {"type": "structure", "members": {}}
+                        
+                        # For other operations, extract properties from the schema
+                        # and add them directly to the output shape
                         for prop_name, prop_schema in schema.get("properties", {}).items():
-                            prop_shape_name = get_shape_for_property(prop_name, prop_schema, schema_name, service_model["shapes"])
-                            
-                            # Add to required list if the property is required in the schema
-                            if prop_name in schema.get("required", []):
-                                input_shape["required"].append(prop_name)
-                            
-                            # Add member to input shape as a top-level parameter
-                            input_shape["members"][prop_name] = {
-                                "shape": prop_shape_name,
+                            output_shape["members"][prop_name] = {
+                                "shape": get_shape_for_property(prop_name, prop_schema, schema_name, service_model["shapes"]),
                                 "documentation": prop_schema.get("description", f"The {prop_name} property")
                             }
-            
-            # Add input shape to service model if it has members
-            if input_shape["members"]:
-                service_model["shapes"][input_shape_name] = input_shape
-                service_model["operations"][operation_name]["input"] = {"shape": input_shape_name}
-            
-            # Process responses
-            for status_code, response in operation.get("responses", {}).items():
-                if status_code.startswith("2"):  # 2xx responses
-                    service_model["operations"][operation_name]["http"]["responseCode"] = int(status_code)
-                    
-                    if "content" in response and "application/json" in response["content"]:
-                        schema_ref = response["content"]["application/json"].get("schema", {}).get("$ref")
                         
-                        if schema_ref:
-                            # Extract schema name from reference
-                            schema_name = schema_ref.split("/")[-1]
-                            schema = openapi_spec["components"]["schemas"][schema_name]
-                            
-                            # Create shapes for the schema
-                            process_schema(schema, schema_name, service_model["shapes"])
-                            
-                            # Create output shape that directly maps to the response schema
-                            output_shape = {"type": "structure", "members": {}}
-                            
-                            # For other operations, extract properties from the schema
-                            # and add them directly to the output shape
-                            for prop_name, prop_schema in schema.get("properties", {}).items():
-                                output_shape["members"][prop_name] = {
-                                    "shape": get_shape_for_property(prop_name, prop_schema, schema_name, service_model["shapes"]),
-                                    "documentation": prop_schema.get("description", f"The {prop_name} property")
-                                }
-                            
-                            # Add output shape to service model
-                            service_model["shapes"][output_shape_name] = output_shape
-                            service_model["operations"][operation_name]["output"] = {"shape": output_shape_name}
-                    
-                    break  # Only process the first successful response
-            
-            # Process error responses
-            error_shapes = []
-            for status_code, response in operation.get("responses", {}).items():
-                if not status_code.startswith("2"):  # Non-2xx responses
-                    error_shape_name = f"{operation_name}Error{status_code}"
-                    error_shape = {
-                        "type": "structure",
-                        "members": {
-                            "message": {
-                                "shape": "String",
-                                "documentation": "Error message"
-                            }
-                        },
-                        "error": {
-                            "httpStatusCode": int(status_code)
-                        },
-                        "exception": True,
-                        "documentation": response.get("description", f"Error {status_code}")
-                    }
-                    
-                    # Add error shape to service model
-                    service_model["shapes"][error_shape_name] = error_shape
-                    error_shapes.append({"shape": error_shape_name})
-            
-            # Add error shapes to operation
-            if error_shapes:
-                service_model["operations"][operation_name]["errors"] = error_shapes
+                        # Add output shape to service model
+                        service_model["shapes"][output_shape_name] = output_shape
+                        service_model["operations"][operation_name]["output"] = {"shape": output_shape_name}
+                
+                break  # Only process the first successful response
+        
+        # Process error responses
+        error_shapes = []
+        for status_code, response in operation.get("responses", {}).items():
+            if not status_code.startswith("2"):  # Non-2xx responses
+                error_shape_name = f"{operation_name}Error{status_code}"
+                error_shape = {
+                    "type": "structure",
+                    "members": {
+                        "message": {
+                            "shape": "String",
+                            "documentation": "Error message"
+                        }
+                    },
+                    "error": {
+                        "httpStatusCode": int(status_code)
+                    },
+                    "exception": True,
+                    "documentation": response.get("description", f"Error {status_code}")
+                }
+                
+                # Add error shape to service model
+                service_model["shapes"][error_shape_name] = error_shape
+                error_shapes.append({"shape": error_shape_name})
+        
+        # Add error shapes to operation
+        if error_shapes:
+            service_model["operations"][operation_name]["errors"] = error_shapes
     
     return service_model
 
+def load_openapi_spec(openapi_path: str) -> Dict[str, Any]:
+    """
+    Load an OpenAPI spec, streaming its top-level keys with ijson when the file is large.
+    
+    Small specs decode faster in one piece, so streaming is only used past _STREAMING_SPEC_SIZE.
+    """
+    with open(openapi_path, 'rb') as f:
+        if ijson and os.path.getsize(openapi_path) >= _STREAMING_SPEC_SIZE:
+            return dict(ijson.kvitems(f, '', use_float=True))
+        return orjson.loads(f.read()) if orjson else json.load(f)
+
+def schema_name_from_ref(schema_ref: str) -> str:
+    """Get the schema name from a $ref such as '#/components/schemas/Name'."""
+    if schema_ref.startswith(_REF_PREFIX):
+        return schema_ref.removeprefix(_REF_PREFIX)
+    return schema_ref.rpartition("/")[2]
+
+def add_parameter_member(input_shape: Dict[str, Any], param: Dict[str, Any], location: str) -> None:
+    """Add a path or query parameter to an input shape as a member bound to the given location."""
+    param_name = param.get("name")
+    param_type = param.get("schema", {}).get("type", "string")
+    
+    # Add to required list if required
+    if param.get("required", False):
+        input_shape["required"].append(param_name)
+    
+    # Add member to input shape
+    input_shape["members"][param_name] = {
+        "shape": map_type_to_shape(param_type),
+        "location": location,
+        "locationName": param_name,
+        "documentation": param.get("description", f"The {param_name} parameter")
+    }
+
+@functools.lru_cache(maxsize=None)
 def map_type_to_shape(openapi_type: str) -> str:
     """Map OpenAPI types to AWS service model shape types."""
     type_mapping = {
@@ -245,28 +285,51 @@ def map_type_to_shape(openapi_type: str) -> str:
     }
     return type_mapping.get(openapi_type, "String")
 
-def get_shape_for_property(prop_name: str, prop_schema: Dict[str, Any], parent_shape_name: str, shapes: Dict[str, Any]) -> str:
-    """Get or create a shape for a property."""
+def get_shape_for_property(prop_name: str, prop_schema: Dict[str, Any], parent_shape_name: str, shapes: Dict[str, Any], visited: Optional[Set[str]] = None) -> str:
+    """
+    Get or create a shape for a property.
+    
+    Shapes named in `visited` are still being built further up the call stack, so they are
+    referenced by name without recursing into them again.
+    """
+    visited = visited if visited is not None else set()
     prop_type = prop_schema.get("type")
+    cache_key = _shape_key(prop_name, prop_type, parent_shape_name)
+    cached_shape_name = _property_shape_cache.get(cache_key)
+    if cached_shape_name is not None:
+        return cached_shape_name
     
+    shape_name = _resolve_property_shape(prop_name, prop_schema, prop_type, parent_shape_name, shapes, visited)
+    _property_shape_cache[cache_key] = shape_name
+    return shape_name
+
+def _shape_key(prop_name: str, prop_type: Optional[str], parent_shape_name: str) -> tuple:
+    """Build the cache key identifying a property's shape."""
+    return (parent_shape_name, prop_name, prop_type)
+
+def _resolve_property_shape(prop_name: str, prop_schema: Dict[str, Any], prop_type: Optional[str], parent_shape_name: str, shapes: Dict[str, Any], visited: Set[str]) -> str:
+    """Create the shape for a property if needed and return its name."""
     if prop_type == "object":
         # Create a shape for the object
         shape_name = f"{parent_shape_name}{prop_name.title()}"
-        if shape_name not in shapes:
-            shapes[shape_name] = create_object_shape(prop_schema, shape_name, shapes)
+        if shape_name not in visited and shape_name not in shapes:
+            visited.add(shape_name)
+            shapes[shape_name] = create_object_shape(prop_schema, shape_name, shapes, visited)
         return shape_name
     elif prop_type == "array":
         # Create a shape for the array
         shape_name = f"{parent_shape_name}{prop_name.title()}List"
-        if shape_name not in shapes:
-            shapes[shape_name] = create_array_shape(prop_schema, shape_name, shapes)
+        if shape_name not in visited and shape_name not in shapes:
+            visited.add(shape_name)
+            shapes[shape_name] = create_array_shape(prop_schema, shape_name, shapes, visited)
         return shape_name
     else:
         # Use a primitive type
         return map_type_to_shape(prop_type)
 
-def create_object_shape(schema: Dict[str, Any], shape_name: str, shapes: Dict[str, Any]) -> Dict[str, Any]:
+def create_object_shape(schema: Dict[str, Any], shape_name: str, shapes: Dict[str, Any], visited: Optional[Set[str]] = None) -> Dict[str, Any]:
     """Create a shape for an object schema."""
+    visited = visited if visited is not None else set()
     shape = {
         "type": "structure",
         "required": schema.get("required", []),
@@ -275,21 +338,24 @@ def create_object_shape(schema: Dict[str, Any], shape_name: str, shapes: Dict[st
     
     for prop_name, prop_schema in schema.get("properties", {}).items():
         shape["members"][prop_name] = {
-            "shape": get_shape_for_property(prop_name, prop_schema, shape_name, shapes),
+            "shape": get_shape_for_property(prop_name, prop_schema, shape_name, shapes, visited),
             "documentation": prop_schema.get("description", f"The {prop_name} property")
         }
     
     return shape
 
-def create_array_shape(schema: Dict[str, Any], shape_name: str, shapes: Dict[str, Any]) -> Dict[str, Any]:
+def create_array_shape(schema: Dict[str, Any], shape_name: str, shapes: Dict[str, Any], visited: Optional[Set[str]] = None) -> Dict[str, Any]:
     """Create a shape for an array schema."""
+    visited = visited if visited is not None else set()
     items_schema = schema.get("items", {})
     items_type = items_schema.get("type")
     
     if items_type == "object":
         # Create a shape for the array items
         item_shape_name = f"{shape_name}Item"
-        shapes[item_shape_name] = create_object_shape(items_schema, item_shape_name, shapes)
+        if item_shape_name not in visited:
+            visited.add(item_shape_name)
+            shapes[item_shape_name] = create_object_shape(items_schema, item_shape_name, shapes, visited)
         
         return {
             "type": "list",
@@ -306,17 +372,31 @@ def create_array_shape(schema: Dict[str, Any], shape_name: str, shapes: Dict[str
             }
         }
 
-def process_schema(schema: Dict[str, Any], schema_name: str, shapes: Dict[str, Any]) -> None:
+def process_schema(schema: Dict[str, Any], schema_name: str, shapes: Dict[str, Any], visited: Optional[Set[str]] = None) -> None:
     """Process a schema and add it to the shapes dictionary."""
-    if schema_name in shapes:
-        return  # Already processed
+    visited = visited if visited is not None else set()
+    if schema_name in visited or schema_name in shapes:
+        return  # Already processed or being processed
+    visited.add(schema_name)
     
-    if schema.get("type") == "object":
-        shapes[schema_name] = create_object_shape(schema, schema_name, shapes)
-    elif schema.get("type") == "array":
-        shapes[schema_name] = create_array_shape(schema, schema_name, shapes)
+    schema_type = schema.get("type")
+    if schema_type == "object":
+        shapes[schema_name] = create_object_shape(schema, schema_name, shapes, visited)
+    elif schema_type == "array":
+        shapes[schema_name] = create_array_shape(schema, schema_name, shapes, visited)
     else:
-        shapes[schema_name] = {"type": map_type_to_shape(schema.get("type"))}
+        shapes[schema_name] = {"type": map_type_to_shape(schema_type)}
+
+def write_service_model(service_model: Dict[str, Any], output_path: str, compact: bool = False) -> None:
+    """Write a service model as JSON, indented by two spaces unless compact is set."""
+    if orjson:
+        option = orjson.OPT_APPEND_NEWLINE if compact else orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        content = orjson.dumps(service_model, option=option)
+    else:
+        content = json.dumps(service_model, indent=None if compact else 2).encode("utf-8")
+    
+    with open(output_path, 'wb') as f:
+        f.write(content)
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -325,13 +405,28 @@ if __name__ == "__main__":
     
     openapi_path = sys.argv[1]
     service_name = sys.argv[2] if len(sys.argv) > 2 else "ccf"
+    output_path = f"{service_name}-service-model.json"
+    compact = bool(os.environ.get("CCF_COMPACT_MODEL"))
     
-    service_model = convert_openapi_to_service_model(openapi_path, service_name)
+    # Reuse the service model generated on an earlier run for a byte-identical spec and converter,
+    # so a change to this script never serves a model it would no longer produce
+    hasher = hashlib.blake2b(digest_size=8)
+    with open(openapi_path, 'rb') as f:
+        hasher.update(f.read())
+    with open(__file__, 'rb') as f:
+        hasher.update(f.read())
+    spec_hash = hasher.hexdigest()
+    cache_path = os.path.join(_CACHE_DIR, f"{service_name}-{spec_hash}{'-compact' if compact else ''}.json")
     
-    # Write the service model to a file
-    output_path = f"{service_name}-service-model.json"
-    with open(output_path, 'w', encoding="utf-8") as f:
-        json.dump(service_model, f, indent=2)
+    if os.path.exists(cache_path):
+        shutil.copyfile(cache_path, output_path)
+    else:
+        service_model = convert_openapi_to_service_model(openapi_path, service_name)
+        
+        # Write the service model to a file, unindented when only machines will read it
+        write_service_model(service_model, output_path, compact=compact)
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        shutil.copyfile(output_path, cache_path)
     
     print(f"Service model created at: {output_path}")
     print(f"To add this model to AWS CLI, run:")
@@ -1,7 +1,7 @@
 """Activity to delete custom connector documents."""
 
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from common.exceptions import InternalServerError, ResourceNotFoundError
 from common.observability import logger
@@ -16,6 +16,8 @@ from common.tenant import TenantContext
 class BatchDeleteCustomConnectorDocumentsRequest(BaseModel):
     """Request model for batch deleting custom connector documents."""
 
+    model_config = ConfigDict(frozen=True)
+
     tenant_context: TenantContext
     connector_id: str = Field(..., min_length=1)
     document_ids: list[str] = Field(..., min_length=1)
@@ -30,31 +32,40 @@ class BatchDeleteCustomConnectorDocumentsActivity:
     def delete(self, request: BatchDeleteCustomConnectorDocumentsRequest) -> Response:
         """Delete multiple documents for a custom connector."""
         logger.info(
-            f"BatchDeleteCustomConnectorDocumentsRequest received: "
-            f"connector_id={request.connector_id}, document_count={len(request.document_ids)}"
+            "BatchDeleteCustomConnectorDocumentsRequest received: connector_id=%s, document_count=%d",
+            request.connector_id,
+            len(request.document_ids),
         )
         try:
+            # Retried deletes often repeat IDs, drop them so each document is only deleted once
+            document_ids = list(dict.fromkeys(request.document_ids))
+            logger.debug(
+                "Removed %d duplicate document IDs: connector_id=%s",
+                len(request.document_ids) - len(document_ids),
+                request.connector_id,
+            )
             dao_req = DaoBatchDeleteDocumentsRequest(
                 tenant_context=request.tenant_context,
                 connector_id=request.connector_id,
-                document_ids=request.document_ids,
+                document_ids=document_ids,
             )
             self.documents_dao.batch_delete_documents(dao_req)
             logger.info(
-                f"BatchDeleteCustomConnectorDocuments succeeded: "
-                f"connector_id={request.connector_id}, document_count={len(request.document_ids)}"
+                "BatchDeleteCustomConnectorDocuments succeeded: connector_id=%s, document_count=%d",
+                request.connector_id,
+                len(document_ids),
             )
             response = create_success_response({}, status_code=202)
             logger.info("BatchDeleteCustomConnectorDocumentsResponse: 202 Accepted")
 
         except DaoResourceNotFoundError as error:
-            logger.warning(f"Connector not found when deleting documents: connector_id={request.connector_id}")
+            logger.warning("Connector not found when deleting documents: connector_id=%s", request.connector_id)
             response = create_error_response(ResourceNotFoundError(str(error)), status_code=404)
             logger.info("BatchDeleteCustomConnectorDocumentsResponse: 404 Not Found")
             return response
 
         except DaoInternalError as error:
-            logger.exception(f"Internal error while deleting documents: connector_id={request.connector_id}")
+            logger.exception("Internal error while deleting documents: connector_id=%s", request.connector_id)
             response = create_error_response(InternalServerError(str(error)), status_code=500)
             logger.info("BatchDeleteCustomConnectorDocumentsResponse: 500 Internal Server Error")
         else:
@@ -1,11 +1,13 @@
 """Activity to put custom connector documents."""
 
+import logging
+
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from common.exceptions import (ConflictError, InternalServerError,
                                ResourceNotFoundError)
-from common.observability import LogContext, create_log_context, logger
+from common.observability import logger
 from common.response import create_error_response, create_success_response
 from common.storage.ddb.custom_connector_documents_dao import \
     BatchPutDocumentsRequest as DaoBatchPutDocumentsRequest
@@ -20,6 +22,8 @@ from common.tenant import TenantContext
 class BatchPutCustomConnectorDocumentsRequest(BaseModel):
     """Request model for batch putting custom connector documents."""
 
+    model_config = ConfigDict(frozen=True)
+
     tenant_context: TenantContext
     connector_id: str = Field(..., min_length=1)
     documents: list[DaoDocumentItem] = Field(..., min_length=1)
@@ -31,45 +35,60 @@ class BatchPutCustomConnectorDocumentsActivity:
     def __init__(self, documents_dao: CustomConnectorDocumentsDao):
         self.documents_dao = documents_dao
 
-    def put(self, request: BatchPutCustomConnectorDocumentsRequest) -> Response:
-        """Put multiple documents for a custom connector."""
-        log_context = create_log_context(
-            LogContext(connector_id=request.connector_id, account_id=request.tenant_context.account_id)
-        )
+    def put(
+        self, request: BatchPutCustomConnectorDocumentsRequest, log_context: dict[str, str] | None = None
+    ) -> Response:
+        """
+        Put multiple documents for a custom connector.
+
+        Args:
+            request: The batch put documents request
+            log_context: Log context already built by the caller
+
+        Returns:
+            Response: HTTP response with an empty body or error details
+
+        """
+        if log_context is None:
+            log_context = {"connector_id": request.connector_id, "account_id": request.tenant_context.account_id}
+        document_count_context = log_context | {"document_count": len(request.documents)}
 
         try:
-            logger.info(
-                "Batch putting custom connector documents",
-                extra={**log_context, "document_count": len(request.documents)},
-            )
-            logger.debug(
-                "Batch put documents request details",
-                extra={**log_context, "request": request.model_dump(exclude={"tenant_context", "documents"})},
-            )
+            logger.info("Batch putting custom connector documents", extra=document_count_context)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Batch put documents request details",
+                    extra=log_context | {"request": request.model_dump(exclude={"tenant_context", "documents"})},
+                )
+
+            # Keep the last checksum sent for each document, DynamoDB rejects batches with duplicate keys
+            documents = list({document.document_id: document for document in request.documents}.values())
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Removed duplicate documents",
+                    extra=log_context | {"duplicate_count": len(request.documents) - len(documents)},
+                )
 
             dao_req = DaoBatchPutDocumentsRequest(
                 tenant_context=request.tenant_context,
                 connector_id=request.connector_id,
-                documents=request.documents,
+                documents=documents,
             )
             self.documents_dao.batch_put_documents(dao_req)
 
-            logger.info(
-                "Batch put documents completed successfully",
-                extra={**log_context, "document_count": len(request.documents)},
-            )
+            logger.info("Batch put documents completed successfully", extra=document_count_context)
             return create_success_response({}, status_code=202)
 
         except DaoResourceNotFoundError as error:
             logger.warning(
-                "Connector not found when putting documents", extra={**log_context, "error_message": error.message}
+                "Connector not found when putting documents", extra=log_context | {"error_message": error.message}
             )
             return create_error_response(ResourceNotFoundError(error.message), status_code=404)
 
         except DaoConflictError as error:
-            logger.warning("Conflict when putting documents", extra={**log_context, "error_message": error.message})
+            logger.warning("Conflict when putting documents", extra=log_context | {"error_message": error.message})
             return create_error_response(ConflictError(error.message), status_code=409)
 
         except DaoInternalError as error:
-            logger.exception("Internal error while putting documents", extra={**log_context, "error": str(error)})
+            logger.exception("Internal error while putting documents", extra=log_context | {"error": str(error)})
             return create_error_response(InternalServerError(str(error)), status_code=500)
@@ -1,13 +1,14 @@
 """Activity to create custom connectors."""
 
+import logging
 from datetime import datetime
 from enum import Enum
 
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from common.exceptions import ConflictError, InternalServerError
-from common.observability import LogContext, create_log_context, logger
+from common.observability import logger
 from common.response import create_error_response, create_success_response
 from common.storage.ddb.custom_connectors_dao import \
     ContainerProperties as DaoContainerProperties
@@ -27,9 +28,16 @@ class ConnectorStatus(str, Enum):
     IN_USE = "IN_USE"
 
 
+# Activity status for each DAO status value, looked up without enum coercion
+_CONNECTOR_STATUS_BY_VALUE = {status.value: status for status in ConnectorStatus}
+
+
 class ResourceRequirements(BaseModel):
     """Model for container resource requirements."""
 
+    # Frozen instances are hashable, so the shared default below is reused rather than deep-copied per request
+    model_config = ConfigDict(frozen=True)
+
     cpu: float | None = Field(default=1)
     memory: int | None = Field(default=2048)
 
@@ -37,6 +45,8 @@ class ResourceRequirements(BaseModel):
 class ContainerProperties(BaseModel):
     """Model for container properties configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     execution_role_arn: str
     image_uri: str
     job_role_arn: str
@@ -47,6 +57,8 @@ class ContainerProperties(BaseModel):
 class CreateCustomConnectorRequest(BaseModel):
     """Request model for creating a custom connector."""
 
+    model_config = ConfigDict(frozen=True)
+
     tenant_context: TenantContext
     name: str = Field(..., min_length=1, max_length=128, pattern=r"^[a-zA-Z0-9-]+$")
     description: str | None = Field(default=None, max_length=1000)
@@ -56,6 +68,8 @@ class CreateCustomConnectorRequest(BaseModel):
 class ConnectorSummary(BaseModel):
     """Summary model for connector information."""
 
+    model_config = ConfigDict(frozen=True)
+
     connector_id: str
     arn: str
     name: str
@@ -77,22 +91,37 @@ class CreateCustomConnectorActivity:
     def __init__(self, dao: CustomConnectorsDao):
         self.dao = dao
 
-    def create(self, request: CreateCustomConnectorRequest) -> Response:
-        """Create a new custom connector."""
-        log_context = create_log_context(LogContext(account_id=request.tenant_context.account_id))
+    def create(self, request: CreateCustomConnectorRequest, log_context: dict[str, str] | None = None) -> Response:
+        """
+        Create a new custom connector.
+
+        Args:
+            request: The create connector request
+            log_context: Log context already built by the caller, extended in place with the connector ID
+
+        Returns:
+            Response: HTTP response with the created connector or error details
+
+        """
+        if log_context is None:
+            log_context = {"account_id": request.tenant_context.account_id}
 
         try:
-            logger.info("Creating custom connector", extra={**log_context, "connector_name": request.name})
-            logger.debug(
-                "Create connector request details",
-                extra={**log_context, "request": request.model_dump(exclude={"tenant_context"})},
-            )
+            logger.info("Creating custom connector", extra=log_context | {"connector_name": request.name})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Create connector request details",
+                    extra=log_context | {"request": request.model_dump(exclude={"tenant_context"})},
+                )
 
             dao_request = DaoCreateConnectorRequest(
                 tenant_context=request.tenant_context,
                 name=request.name,
                 description=request.description,
-                container_properties=DaoContainerProperties(**request.container_properties.model_dump()),
+                # Read the already validated properties by attribute instead of dumping them to a dict first
+                container_properties=DaoContainerProperties.model_validate(
+                    request.container_properties, from_attributes=True
+                ),
             )
 
             dao_response: DaoCreateConnectorResponse = self.dao.create_connector(dao_request)
@@ -104,30 +133,30 @@ class CreateCustomConnectorActivity:
                     name=dao_response.name,
                     created_at=dao_response.created_at,
                     updated_at=dao_response.updated_at,
-                    status=ConnectorStatus(dao_response.status),
+                    status=_CONNECTOR_STATUS_BY_VALUE[dao_response.status.value],
                     description=request.description,
                 )
             )
 
-            log_context_with_id = create_log_context(
-                LogContext(connector_id=dao_response.connector_id, account_id=request.tenant_context.account_id)
-            )
-            logger.info("Custom connector created successfully", extra=log_context_with_id)
-            logger.debug(
-                "Create connector response", extra={**log_context_with_id, "response": activity_response.model_dump()}
-            )
+            log_context["connector_id"] = dao_response.connector_id
+            logger.info("Custom connector created successfully", extra=log_context)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Create connector response",
+                    extra=log_context | {"response": activity_response.model_dump()},
+                )
 
             return create_success_response(activity_response, status_code=201)
 
         except DaoConflictError as error:
             logger.warning(
                 "Conflict while creating connector",
-                extra={**log_context, "error_message": error.message, "connector_name": request.name},
+                extra=log_context | {"error_message": error.message, "connector_name": request.name},
             )
             return create_error_response(ConflictError(error.message), status_code=409)
         except Exception as error:
             logger.exception(
                 "Unexpected error while creating connector",
-                extra={**log_context, "error": str(error), "connector_name": request.name},
+                extra=log_context | {"error": str(error), "connector_name": request.name},
             )
             return create_error_response(InternalServerError(str(error)))
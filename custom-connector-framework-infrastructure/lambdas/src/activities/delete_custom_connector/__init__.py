@@ -1,11 +1,11 @@
 """Activity to delete custom connectors."""
 
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from common.exceptions import (ConflictError, InternalServerError,
                                ResourceNotFoundError)
-from common.observability import LogContext, create_log_context, logger
+from common.observability import logger
 from common.response import create_error_response, create_success_response
 from common.storage.ddb.custom_connectors_dao import (CustomConnectorsDao,
                                                       DaoConflictError,
@@ -18,6 +18,8 @@ from common.tenant import TenantContext
 class DeleteCustomConnectorRequest(BaseModel):
     """Request model for deleting a custom connector."""
 
+    model_config = ConfigDict(frozen=True)
+
     tenant_context: TenantContext
     connector_id: str
 
@@ -28,11 +30,20 @@ class DeleteCustomConnectorActivity:
     def __init__(self, dao: CustomConnectorsDao):
         self.dao = dao
 
-    def delete(self, request: DeleteCustomConnectorRequest) -> Response:
-        """Delete a custom connector."""
-        log_context = create_log_context(
-            LogContext(connector_id=request.connector_id, account_id=request.tenant_context.account_id)
-        )
+    def delete(self, request: DeleteCustomConnectorRequest, log_context: dict[str, str] | None = None) -> Response:
+        """
+        Delete a custom connector.
+
+        Args:
+            request: The delete connector request
+            log_context: Log context already built by the caller
+
+        Returns:
+            Response: HTTP response with an empty body or error details
+
+        """
+        if log_context is None:
+            log_context = {"connector_id": request.connector_id, "account_id": request.tenant_context.account_id}
 
         try:
             logger.info("Deleting custom connector", extra=log_context)
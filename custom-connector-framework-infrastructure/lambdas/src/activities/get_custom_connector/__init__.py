@@ -1,13 +1,14 @@
 """Activity to get custom connectors."""
 
+import logging
 from datetime import datetime
 from enum import Enum
 
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from common.exceptions import InternalServerError, ResourceNotFoundError
-from common.observability import LogContext, create_log_context, logger
+from common.observability import logger
 from common.response import create_error_response, create_success_response
 from common.storage.ddb.custom_connectors_dao import (ContainerProperties,
                                                       CustomConnectorsDao,
@@ -26,9 +27,15 @@ class ConnectorStatus(str, Enum):
     IN_USE = "IN_USE"
 
 
+# Activity status for each DAO status value, looked up without enum coercion
+_CONNECTOR_STATUS_BY_VALUE = {status.value: status for status in ConnectorStatus}
+
+
 class GetCustomConnectorRequest(BaseModel):
     """Request model for getting a custom connector."""
 
+    model_config = ConfigDict(frozen=True)
+
     tenant_context: TenantContext
     connector_id: str
 
@@ -58,11 +65,20 @@ class GetCustomConnectorActivity:
     def __init__(self, dao: CustomConnectorsDao):
         self.dao = dao
 
-    def fetch(self, request: GetCustomConnectorRequest) -> Response:
-        """Fetch a custom connector by ID."""
-        log_context = create_log_context(
-            LogContext(connector_id=request.connector_id, account_id=request.tenant_context.account_id)
-        )
+    def fetch(self, request: GetCustomConnectorRequest, log_context: dict[str, str] | None = None) -> Response:
+        """
+        Fetch a custom connector by ID.
+
+        Args:
+            request: The get connector request
+            log_context: Log context already built by the caller
+
+        Returns:
+            Response: HTTP response with the connector or error details
+
+        """
+        if log_context is None:
+            log_context = {"connector_id": request.connector_id, "account_id": request.tenant_context.account_id}
 
         try:
             logger.info("Fetching custom connector", extra=log_context)
@@ -81,7 +97,7 @@ class GetCustomConnectorActivity:
                     created_at=dao_response.created_at,
                     updated_at=dao_response.updated_at,
                     description=dao_response.description,
-                    status=ConnectorStatus(dao_response.status),
+                    status=_CONNECTOR_STATUS_BY_VALUE[dao_response.status.value],
                     container_properties=dao_response.container_properties,
                 )
             )
@@ -89,7 +105,10 @@ class GetCustomConnectorActivity:
             logger.info(
                 "Custom connector fetched successfully", extra={**log_context, "connector_name": dao_response.name}
             )
-            logger.debug("Get connector response", extra={**log_context, "response": activity_response.model_dump()})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Get connector response", extra={**log_context, "response": activity_response.model_dump()}
+                )
 
             return create_success_response(activity_response)
 
@@ -1,11 +1,13 @@
 """Activity for listing custom connector jobs."""
 
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from common.exceptions import InternalServerError, ResourceNotFoundError
 from common.observability import logger
-from common.response import create_error_response, create_success_response
+from common.response import (create_error_response,
+                             create_serialized_response,
+                             create_success_response)
 from common.storage.ddb.custom_connector_jobs_dao import (
     CustomConnectorJobsDao, DaoInternalError, DaoResourceNotFoundError)
 from common.storage.ddb.custom_connector_jobs_dao import \
@@ -16,10 +18,15 @@ from common.storage.ddb.custom_connector_jobs_dao import \
     ListJobsResponse as DaoListJobsResponse
 from common.tenant import TenantContext
 
+# Response body for a final page with no jobs, returned without building the response
+_EMPTY_JOBS_BODY = '{"jobs":[],"next_token":null}'
+
 
 class ListCustomConnectorJobsRequest(BaseModel):
     """Request model for listing custom connector jobs."""
 
+    model_config = ConfigDict(frozen=True)
+
     tenant_context: TenantContext
     connector_id: str = Field(..., min_length=1)
     max_results: int | None = Field(default=50, gt=0)
@@ -27,22 +34,6 @@ class ListCustomConnectorJobsRequest(BaseModel):
     status: DaoJobStatus | None = None
 
 
-class JobDetail(BaseModel):
-    """Job detail information."""
-
-    job_id: str
-    connector_id: str
-    status: DaoJobStatus
-    created_at: str
-
-
-class ListCustomConnectorJobsResponse(BaseModel):
-    """Response model for listing custom connector jobs."""
-
-    jobs: list[JobDetail]
-    next_token: str | None = None
-
-
 class ListCustomConnectorJobsActivity:
     """Activity for listing custom connector jobs."""
 
@@ -52,8 +43,13 @@ class ListCustomConnectorJobsActivity:
     def list(self, request: ListCustomConnectorJobsRequest) -> Response:
         """List custom connector jobs."""
         logger.info(
-            f"ListCustomConnectorJobsRequest received: connector_id={request.connector_id}, "
-            f"max_results={request.max_results}, next_token={request.next_token}, status={request.status}"
+            "ListCustomConnectorJobsRequest received",
+            extra={
+                "connector_id": request.connector_id,
+                "max_results": request.max_results,
+                "next_token": request.next_token,
+                "status": request.status,
+            },
         )
         try:
             dao_req = DaoListJobsRequest(
@@ -65,22 +61,24 @@ class ListCustomConnectorJobsActivity:
             )
             dao_resp: DaoListJobsResponse = self.jobs_dao.list_jobs(dao_req)
 
+            if not dao_resp.jobs and dao_resp.next_token is None:
+                return create_serialized_response(_EMPTY_JOBS_BODY)
+
             job_details = [
-                JobDetail(
-                    job_id=job.job_id,
-                    connector_id=job.connector_id,
-                    status=job.status,
-                    created_at=job.created_at,
-                )
+                {
+                    "job_id": job.job_id,
+                    "connector_id": job.connector_id,
+                    "status": job.status.value,
+                    "created_at": job.created_at,
+                }
                 for job in dao_resp.jobs
             ]
 
-            activity_resp = ListCustomConnectorJobsResponse(
-                jobs=job_details,
-                next_token=dao_resp.next_token,
+            logger.info(
+                "ListCustomConnectorJobsResponse",
+                extra={"job_count": len(job_details), "next_token": dao_resp.next_token},
             )
-            logger.info(f"ListCustomConnectorJobsResponse: {len(job_details)} jobs, next_token={dao_resp.next_token}")
-            return create_success_response(activity_resp, status_code=200)
+            return create_success_response({"jobs": job_details, "next_token": dao_resp.next_token}, status_code=200)
 
         except DaoResourceNotFoundError as error:
             logger.warning(f"Resource not found while listing jobs: {error.message}")
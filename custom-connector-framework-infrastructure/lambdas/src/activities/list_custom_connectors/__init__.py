@@ -1,14 +1,16 @@
 """Activity for listing custom connectors."""
 
-from datetime import datetime
+import logging
 from enum import Enum
 
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from common.exceptions import InternalServerError
-from common.observability import LogContext, create_log_context, logger
-from common.response import create_error_response, create_success_response
+from common.observability import logger
+from common.response import (create_error_response,
+                             create_serialized_response,
+                             create_success_response)
 from common.storage.ddb.custom_connectors_dao import CustomConnectorsDao
 from common.storage.ddb.custom_connectors_dao import \
     ListConnectorsRequest as DaoListConnectorsRequest
@@ -16,6 +18,9 @@ from common.storage.ddb.custom_connectors_dao import \
     ListConnectorsResponse as DaoListConnectorsResponse
 from common.tenant import TenantContext
 
+# Response body for a final page with no connectors, returned without building the response
+_EMPTY_CONNECTORS_BODY = '{"connectors":[],"next_token":null}'
+
 
 class ConnectorStatus(str, Enum):
     """Connector status enumeration."""
@@ -24,14 +29,18 @@ class ConnectorStatus(str, Enum):
     IN_USE = "IN_USE"
 
 
+# Activity status for each DAO status value, so listed rows skip enum coercion
+_CONNECTOR_STATUS_BY_VALUE = {status.value: status for status in ConnectorStatus}
+
+
 class ConnectorSummary(BaseModel):
     """Summary information for a connector."""
 
     connector_id: str
     arn: str
     name: str
-    created_at: datetime
-    updated_at: datetime
+    created_at: str
+    updated_at: str
     status: ConnectorStatus
     description: str | None = None
 
@@ -39,6 +48,8 @@ class ConnectorSummary(BaseModel):
 class ListCustomConnectorsRequest(BaseModel):
     """Request model for listing custom connectors."""
 
+    model_config = ConfigDict(frozen=True)
+
     tenant_context: TenantContext
     max_results: int | None = Field(default=50, ge=1, le=100)
     next_token: str | None = None
@@ -57,16 +68,28 @@ class ListCustomConnectorsActivity:
     def __init__(self, dao: CustomConnectorsDao):
         self.dao = dao
 
-    def list(self, request: ListCustomConnectorsRequest) -> Response:
-        """List custom connectors."""
-        log_context = create_log_context(LogContext(account_id=request.tenant_context.account_id))
+    def list(self, request: ListCustomConnectorsRequest, log_context: dict[str, str] | None = None) -> Response:
+        """
+        List custom connectors.
+
+        Args:
+            request: The list connectors request
+            log_context: Log context already built by the caller
+
+        Returns:
+            Response: HTTP response with a page of connectors or error details
+
+        """
+        if log_context is None:
+            log_context = {"account_id": request.tenant_context.account_id}
 
         try:
             logger.info("Listing custom connectors", extra={**log_context, "max_results": request.max_results})
-            logger.debug(
-                "List connectors request details",
-                extra={**log_context, "request": request.model_dump(exclude={"tenant_context"})},
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "List connectors request details",
+                    extra={**log_context, "request": request.model_dump(exclude={"tenant_context"})},
+                )
 
             dao_request = DaoListConnectorsRequest(
                 tenant_context=request.tenant_context, max_results=request.max_results, next_token=request.next_token
@@ -74,20 +97,26 @@ class ListCustomConnectorsActivity:
 
             dao_response: DaoListConnectorsResponse = self.dao.list_connectors(dao_request)
 
+            if not dao_response.connectors and dao_response.next_token is None:
+                return create_serialized_response(_EMPTY_CONNECTORS_BODY)
+
+            # DAO rows are already validated, so the summaries are built without re-running validation
             connector_summaries = [
-                ConnectorSummary(
+                ConnectorSummary.model_construct(
                     connector_id=connector.connector_id,
                     arn=connector.arn,
                     name=connector.name,
                     created_at=connector.created_at,
                     updated_at=connector.updated_at,
-                    status=ConnectorStatus(connector.status),
+                    status=_CONNECTOR_STATUS_BY_VALUE[connector.status.value],
                     description=connector.description,
                 )
                 for connector in dao_response.connectors
             ]
 
-            response = ListCustomConnectorsResponse(connectors=connector_summaries, next_token=dao_response.next_token)
+            response = ListCustomConnectorsResponse.model_construct(
+                connectors=connector_summaries, next_token=dao_response.next_token
+            )
 
             logger.info(
                 "Custom connectors listed successfully",
@@ -97,7 +126,8 @@ class ListCustomConnectorsActivity:
                     "has_next_token": dao_response.next_token is not None,
                 },
             )
-            logger.debug("List connectors response", extra={**log_context, "response": response.model_dump()})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("List connectors response", extra={**log_context, "response": response.model_dump()})
 
             return create_success_response(response)
 
@@ -1,7 +1,7 @@
 """Activity for putting custom connector checkpoints."""
 
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from common.exceptions import (ConflictError, InternalServerError,
                                ResourceNotFoundError)
@@ -19,6 +19,8 @@ from common.tenant import TenantContext
 class PutCustomConnectorCheckpointRequest(BaseModel):
     """Request model for putting a custom connector checkpoint."""
 
+    model_config = ConfigDict(frozen=True)
+
     tenant_context: TenantContext
     connector_id: str = Field(..., min_length=1)
     checkpoint_data: str = Field(..., min_length=1)
@@ -32,7 +34,6 @@ class PutCustomConnectorCheckpointActivity:
 
     def put(self, request: PutCustomConnectorCheckpointRequest) -> Response:
         """Put a checkpoint for a custom connector."""
-        logger.info(f"PutCustomConnectorCheckpointRequest received: connector_id={request.connector_id}")
         try:
             dao_req = DaoPutCheckpointRequest(
                 tenant_context=request.tenant_context,
@@ -40,24 +41,26 @@ class PutCustomConnectorCheckpointActivity:
                 checkpoint_data=request.checkpoint_data,
             )
             self.connectors_dao.put_checkpoint(dao_req)
-            logger.info(f"Checkpoint stored successfully for connector: {request.connector_id}")
-            logger.info("PutCustomConnectorCheckpointResponse: 202 Accepted")
+            logger.info("Checkpoint stored", extra={"connector_id": request.connector_id, "status_code": 202})
             return create_success_response({}, status_code=202)
 
         except DaoResourceNotFoundError as error:
-            logger.warning(f"Connector not found when putting checkpoint: {error.message}")
-            response = create_error_response(ResourceNotFoundError(error.message), status_code=404)
-            logger.info("PutCustomConnectorCheckpointResponse: 404 Not Found")
-            return response
+            logger.warning(
+                f"Connector not found when putting checkpoint: {error.message}",
+                extra={"connector_id": request.connector_id, "status_code": 404},
+            )
+            return create_error_response(ResourceNotFoundError(error.message), status_code=404)
 
         except DaoConflictError as error:
-            logger.warning(f"Conflict when putting checkpoint: {error.message}")
-            response = create_error_response(ConflictError(error.message), status_code=409)
-            logger.info("PutCustomConnectorCheckpointResponse: 409 Conflict")
-            return response
+            logger.warning(
+                f"Conflict when putting checkpoint: {error.message}",
+                extra={"connector_id": request.connector_id, "status_code": 409},
+            )
+            return create_error_response(ConflictError(error.message), status_code=409)
 
         except DaoInternalError as error:
-            logger.exception(f"Internal error while putting checkpoint: {error.message}")
-            response = create_error_response(InternalServerError(str(error)), status_code=500)
-            logger.info("PutCustomConnectorCheckpointResponse: 500 Internal Server Error")
-            return response
+            logger.exception(
+                f"Internal error while putting checkpoint: {error.message}",
+                extra={"connector_id": request.connector_id, "status_code": 500},
+            )
+            return create_error_response(InternalServerError(str(error)), status_code=500)
@@ -1,15 +1,18 @@
 """Activity for starting custom connector jobs."""
 
+import logging
+
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from common.clients import is_throttled
 from common.exceptions import (ConflictError, InternalServerError,
-                               ResourceNotFoundError)
-from common.observability import LogContext, create_log_context, logger
+                               ResourceNotFoundError, ThrottlingError)
+from common.observability import logger
 from common.response import create_error_response, create_success_response
 from common.storage.ddb.custom_connector_jobs_dao import (
     CustomConnectorJobsDao, DaoConflictError, DaoInternalError,
-    DaoResourceNotFoundError, JobStatus)
+    DaoResourceNotFoundError)
 from common.storage.ddb.custom_connector_jobs_dao import \
     StartJobRequest as DaoStartJobRequest
 from common.storage.ddb.custom_connector_jobs_dao import \
@@ -20,6 +23,8 @@ from common.tenant import TenantContext
 class EnvironmentVariable(BaseModel):
     """Environment variable for job execution."""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     value: str
 
@@ -27,24 +32,12 @@ class EnvironmentVariable(BaseModel):
 class StartCustomConnectorJobRequest(BaseModel):
     """Request model for starting a custom connector job."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     tenant_context: TenantContext
     connector_id: str = Field(..., min_length=1)
     environment: list[EnvironmentVariable] | None = Field(default_factory=list)
-
-
-class JobDetail(BaseModel):
-    """Job detail information."""
-
-    job_id: str
-    connector_id: str
-    status: JobStatus
-    created_at: str
-
-
-class StartCustomConnectorJobResponse(BaseModel):
-    """Response model for starting a custom connector job."""
-
-    job: JobDetail
+    idempotency_token: str | None = Field(default=None, min_length=1, max_length=64)
 
 
 class StartCustomConnectorJobActivity:
@@ -59,47 +52,53 @@ class StartCustomConnectorJobActivity:
     def __init__(self, jobs_dao: CustomConnectorJobsDao):
         self.jobs_dao = jobs_dao
 
-    def start(self, request: StartCustomConnectorJobRequest) -> Response:
-        """Start a custom connector job."""
-        log_context = create_log_context(
-            LogContext(connector_id=request.connector_id, account_id=request.tenant_context.account_id)
-        )
+    def start(self, request: StartCustomConnectorJobRequest, log_context: dict[str, str] | None = None) -> Response:
+        """
+        Start a custom connector job.
+
+        Args:
+            request: The start job request
+            log_context: Log context already built by the caller, extended in place with the job ID
+
+        Returns:
+            Response: HTTP response with the started job or error details
+
+        """
+        if log_context is None:
+            log_context = {"connector_id": request.connector_id, "account_id": request.tenant_context.account_id}
 
         try:
             logger.info("Starting custom connector job", extra=log_context)
-            logger.debug(
-                "Start job request details", extra={**log_context, "environment_count": len(request.environment or [])}
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Start job request details",
+                    extra={**log_context, "environment_count": len(request.environment or [])},
+                )
 
-            environment_list = []
-            if request.environment is not None:
-                environment_list = [env.model_dump() for env in request.environment]
+            # The request was validated at the API boundary, so the DAO hand-off skips re-validation
+            environment_list = [{"name": env.name, "value": env.value} for env in request.environment or ()]
 
-            dao_req = DaoStartJobRequest(
+            dao_req = DaoStartJobRequest.model_construct(
                 tenant_context=request.tenant_context,
                 connector_id=request.connector_id,
                 environment=environment_list,
+                idempotency_token=request.idempotency_token,
             )
             dao_resp: DaoStartJobResponse = self.jobs_dao.start_job(dao_req)
 
-            activity_resp = StartCustomConnectorJobResponse(
-                job=JobDetail(
-                    job_id=dao_resp.job_id,
-                    connector_id=dao_resp.connector_id,
-                    status=dao_resp.status,
-                    created_at=dao_resp.created_at,
-                )
-            )
+            activity_resp = {
+                "job": {
+                    "job_id": dao_resp.job_id,
+                    "connector_id": dao_resp.connector_id,
+                    "status": dao_resp.status.value,
+                    "created_at": dao_resp.created_at,
+                }
+            }
 
-            log_context_with_job = create_log_context(
-                LogContext(
-                    connector_id=request.connector_id,
-                    account_id=request.tenant_context.account_id,
-                    job_id=dao_resp.job_id,
-                )
-            )
-            logger.info("Custom connector job started successfully", extra=log_context_with_job)
-            logger.debug("Start job response", extra={**log_context_with_job, "response": activity_resp.model_dump()})
+            log_context["job_id"] = dao_resp.job_id
+            logger.info("Custom connector job started successfully", extra=log_context)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Start job response", extra={**log_context, "response": activity_resp})
 
             return create_success_response(activity_resp, status_code=201)
 
@@ -112,6 +111,11 @@ class StartCustomConnectorJobActivity:
             return create_error_response(ConflictError(error.message), status_code=500)
 
         except DaoInternalError as error:
+            if is_throttled(error):
+                logger.warning(
+                    "Throttled while starting custom connector job", extra={**log_context, "error": str(error)}
+                )
+                return create_error_response(ThrottlingError(str(error)))
             logger.exception(
                 "Internal error while starting custom connector job", extra={**log_context, "error": str(error)}
             )
@@ -1,11 +1,14 @@
 """Activity for stopping custom connector jobs."""
 
+import logging
+
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from common.clients import is_throttled
 from common.exceptions import (ConflictError, InternalServerError,
-                               ResourceNotFoundError)
-from common.observability import LogContext, create_log_context, logger
+                               ResourceNotFoundError, ThrottlingError)
+from common.observability import logger
 from common.response import create_error_response, create_success_response
 from common.storage.ddb.custom_connector_jobs_dao import (
     CustomConnectorJobsDao, DaoConflictError, DaoInternalError,
@@ -18,6 +21,8 @@ from common.tenant import TenantContext
 class StopCustomConnectorJobRequest(BaseModel):
     """Request model for stopping a custom connector job."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     tenant_context: TenantContext
     connector_id: str = Field(..., min_length=1)
     job_id: str = Field(..., min_length=1)
@@ -30,19 +35,32 @@ class StopCustomConnectorJobActivity:
     def __init__(self, jobs_dao: CustomConnectorJobsDao):
         self.jobs_dao = jobs_dao
 
-    def stop(self, request: StopCustomConnectorJobRequest) -> Response:
-        """Stop a custom connector job by updating its status to STOPPING."""
-        log_context = create_log_context(
-            LogContext(
-                connector_id=request.connector_id, account_id=request.tenant_context.account_id, job_id=request.job_id
-            )
-        )
+    def stop(self, request: StopCustomConnectorJobRequest, log_context: dict[str, str] | None = None) -> Response:
+        """
+        Stop a custom connector job by updating its status to STOPPING.
+
+        Args:
+            request: The stop job request
+            log_context: Log context already built by the caller
+
+        Returns:
+            Response: HTTP response with an empty body or error details
+
+        """
+        if log_context is None:
+            log_context = {
+                "connector_id": request.connector_id,
+                "account_id": request.tenant_context.account_id,
+                "job_id": request.job_id,
+            }
 
         try:
             logger.info("Stopping custom connector job", extra=log_context)
-            logger.debug("Stop job request details", extra={**log_context, "batch_job_id": request.batch_job_id})
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Stop job request details", extra={**log_context, "batch_job_id": request.batch_job_id})
 
-            dao_req = DaoUpdateJobStatusRequest(
+            # The request was validated at the API boundary, so the DAO hand-off skips re-validation
+            dao_req = DaoUpdateJobStatusRequest.model_construct(
                 tenant_context=request.tenant_context,
                 connector_id=request.connector_id,
                 job_id=request.job_id,
@@ -65,5 +83,8 @@ class StopCustomConnectorJobActivity:
             return create_error_response(ConflictError(error.message), status_code=409)
 
         except DaoInternalError as error:
+            if is_throttled(error):
+                logger.warning("Throttled while stopping job", extra={**log_context, "error": str(error)})
+                return create_error_response(ThrottlingError(str(error)))
             logger.exception("Internal error while stopping job", extra={**log_context, "error": str(error)})
             return create_error_response(InternalServerError(str(error)), status_code=500)
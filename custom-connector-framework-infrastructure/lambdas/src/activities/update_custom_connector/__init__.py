@@ -6,17 +6,15 @@ It handles validation, error handling, and delegates to the DAO layer for persis
 The implementation uses version-based optimistic locking to prevent concurrent updates.
 """
 
-from datetime import datetime
-
 from aws_lambda_powertools.event_handler import Response
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from common.clients import is_throttled
 from common.exceptions import (ConflictError, InternalServerError,
-                               ResourceNotFoundError)
+                               ResourceNotFoundError, ThrottlingError)
 from common.observability import logger
 from common.response import create_error_response, create_success_response
-from common.storage.ddb.custom_connectors_dao import (ConnectorStatus,
-                                                      CustomConnectorsDao,
+from common.storage.ddb.custom_connectors_dao import (CustomConnectorsDao,
                                                       DaoConflictError,
                                                       DaoResourceNotFoundError)
 from common.storage.ddb.custom_connectors_dao import \
@@ -33,6 +31,8 @@ from common.tenant import TenantContext
 class UpdateResourceRequirements(BaseModel):
     """Resource requirements for container execution in update operations."""
 
+    model_config = ConfigDict(defer_build=True)
+
     cpu: float | None = Field(default=None)
     memory: int | None = Field(default=None)
 
@@ -40,6 +40,8 @@ class UpdateResourceRequirements(BaseModel):
 class UpdateContainerProperties(BaseModel):
     """Container properties for custom connector execution in update operations."""
 
+    model_config = ConfigDict(defer_build=True)
+
     execution_role_arn: str | None = Field(default=None)
     image_uri: str | None = Field(default=None)
     job_role_arn: str | None = Field(default=None)
@@ -50,6 +52,8 @@ class UpdateContainerProperties(BaseModel):
 class UpdateCustomConnectorRequest(BaseModel):
     """Request model for updating a custom connector."""
 
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     tenant_context: TenantContext
     connector_id: str
     name: str | None = Field(default=None, min_length=1, max_length=128, pattern=r"^[a-zA-Z0-9-]+$")
@@ -57,31 +61,13 @@ class UpdateCustomConnectorRequest(BaseModel):
     container_properties: UpdateContainerProperties | None = None
 
 
-class ConnectorSummary(BaseModel):
-    """Summary information about a connector."""
-
-    connector_id: str
-    arn: str
-    name: str
-    created_at: datetime
-    updated_at: datetime
-    status: ConnectorStatus
-    description: str | None = None
-
-
-class UpdateCustomConnectorResponse(BaseModel):
-    """Response model for updating a custom connector."""
-
-    connector: ConnectorSummary
-
-
 class UpdateCustomConnectorActivity:
     """Activity for updating custom connectors."""
 
     def __init__(self, dao: CustomConnectorsDao):
         self.dao = dao
 
-    def update(self, request: UpdateCustomConnectorRequest) -> Response:
+    def update(self, request: UpdateCustomConnectorRequest, log_context: dict[str, str] | None = None) -> Response:
         """
         Update a custom connector with the provided information.
 
@@ -91,13 +77,17 @@ class UpdateCustomConnectorActivity:
 
         Args:
             request (UpdateCustomConnectorRequest): Contains connector ID and fields to update
+            log_context (dict[str, str] | None): Log context already built by the caller
 
         Returns:
             Response: HTTP response with updated connector information or error details
 
         """
+        if log_context is None:
+            log_context = {"connector_id": request.connector_id, "account_id": request.tenant_context.account_id}
+
         try:
-            logger.info(f"Updating connector with ID: {request.connector_id}")
+            logger.info("Updating connector", extra=log_context)
 
             # Convert the activity request to a DAO request
             dao_container_properties = None
@@ -105,12 +95,13 @@ class UpdateCustomConnectorActivity:
                 # Convert activity UpdateContainerProperties to DAO UpdateContainerProperties
                 dao_resource_reqs = None
                 if request.container_properties.resource_requirements:
+                    # Validated on purpose, the DAO model converts cpu to a Decimal for DynamoDB
                     dao_resource_reqs = DaoUpdateResourceRequirements(
                         cpu=request.container_properties.resource_requirements.cpu,
                         memory=request.container_properties.resource_requirements.memory,
                     )
 
-                dao_container_properties = DaoUpdateContainerProperties(
+                dao_container_properties = DaoUpdateContainerProperties.model_construct(
                     execution_role_arn=request.container_properties.execution_role_arn,
                     image_uri=request.container_properties.image_uri,
                     job_role_arn=request.container_properties.job_role_arn,
@@ -118,7 +109,7 @@ class UpdateCustomConnectorActivity:
                     timeout=request.container_properties.timeout,
                 )
 
-            dao_request = DaoUpdateConnectorRequest(
+            dao_request = DaoUpdateConnectorRequest.model_construct(
                 tenant_context=request.tenant_context,
                 connector_id=request.connector_id,
                 name=request.name,
@@ -129,28 +120,28 @@ class UpdateCustomConnectorActivity:
             # Call the DAO to update the connector
             dao_response: DaoUpdateConnectorResponse = self.dao.update_connector(dao_request)
 
-            # Convert the DAO response to an activity response
-            activity_response = UpdateCustomConnectorResponse(
-                connector=ConnectorSummary(
-                    connector_id=dao_response.connector_id,
-                    arn=dao_response.arn,
-                    name=dao_response.name,
-                    created_at=dao_response.created_at,
-                    updated_at=dao_response.updated_at,
-                    status=dao_response.status,
-                    description=dao_response.description,
-                )
-            )
+            connector = {
+                "connector_id": dao_response.connector_id,
+                "arn": dao_response.arn,
+                "name": dao_response.name,
+                "created_at": dao_response.created_at,
+                "updated_at": dao_response.updated_at,
+                "status": dao_response.status.value,
+                "description": dao_response.description,
+            }
 
-            logger.info(f"Connector updated successfully: {dao_response.connector_id}")
-            return create_success_response(activity_response)
+            logger.info("Connector updated successfully", extra=log_context)
+            return create_success_response({"connector": connector})
 
         except DaoResourceNotFoundError as error:
-            logger.warning(f"Connector not found: {error.message}")
+            logger.warning("Connector not found", extra={**log_context, "error_message": error.message})
             return create_error_response(ResourceNotFoundError(error.message), status_code=404)
         except DaoConflictError as error:
-            logger.warning(f"Conflict while updating connector: {error.message}")
+            logger.warning("Conflict while updating connector", extra={**log_context, "error_message": error.message})
             return create_error_response(ConflictError(error.message), status_code=409)
         except Exception as error:
-            logger.exception("Unexpected error while updating connector")
+            if is_throttled(error):
+                logger.warning("Throttled while updating connector", extra={**log_context, "error": str(error)})
+                return create_error_response(ThrottlingError(str(error)))
+            logger.exception("Unexpected error while updating connector", extra={**log_context, "error": str(error)})
             return create_error_response(InternalServerError(str(error)), status_code=500)
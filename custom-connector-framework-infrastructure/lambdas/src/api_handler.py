@@ -9,54 +9,21 @@ The handler uses AWS Lambda Powertools for standardized logging, metrics,
 and tracing, as well as API Gateway integration.
 """
 
-import json
-from typing import Any
+import functools
+import logging
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
-import boto3
+import orjson
 from aws_lambda_powertools.event_handler import (APIGatewayRestResolver,
                                                  Response)
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
-from activities.batch_delete_custom_connector_documents import (
-    BatchDeleteCustomConnectorDocumentsActivity,
-    BatchDeleteCustomConnectorDocumentsRequest)
-from activities.batch_put_custom_connector_documents import (
-    BatchPutCustomConnectorDocumentsActivity,
-    BatchPutCustomConnectorDocumentsRequest)
-from activities.create_custom_connector import (ContainerProperties,
-                                                CreateCustomConnectorActivity,
-                                                CreateCustomConnectorRequest)
-from activities.delete_custom_connector import (DeleteCustomConnectorActivity,
-                                                DeleteCustomConnectorRequest)
-from activities.delete_custom_connector_checkpoint import (
-    DeleteCustomConnectorCheckpointActivity,
-    DeleteCustomConnectorCheckpointRequest)
-from activities.get_custom_connector import (GetCustomConnectorActivity,
-                                             GetCustomConnectorRequest)
-from activities.get_custom_connector_checkpoint import (
-    GetCustomConnectorCheckpointActivity, GetCustomConnectorCheckpointRequest)
-from activities.list_custom_connector_documents import (
-    ListCustomConnectorDocumentsActivity, ListCustomConnectorDocumentsRequest)
-from activities.list_custom_connector_jobs import \
-    ListCustomConnectorJobsActivity
-from activities.list_custom_connector_jobs import \
-    ListCustomConnectorJobsRequest as ListJobsActivityRequest
-from activities.list_custom_connectors import (ListCustomConnectorsActivity,
-                                               ListCustomConnectorsRequest)
-from activities.put_custom_connector_checkpoint import (
-    PutCustomConnectorCheckpointActivity, PutCustomConnectorCheckpointRequest)
-from activities.start_custom_connector_job import (
-    EnvironmentVariable, StartCustomConnectorJobActivity,
-    StartCustomConnectorJobRequest)
-from activities.stop_custom_connector_job import (
-    StopCustomConnectorJobActivity, StopCustomConnectorJobRequest)
-from activities.update_custom_connector import (UpdateContainerProperties,
-                                                UpdateCustomConnectorActivity,
-                                                UpdateCustomConnectorRequest)
+from common.clients import create_dynamodb_resource
 from common.env import (CUSTOM_CONNECTOR_DOCUMENTS_TABLE_NAME,
                         CUSTOM_CONNECTOR_JOBS_TABLE_NAME,
                         CUSTOM_CONNECTORS_TABLE_NAME)
-from common.observability import LogContext, create_log_context, logger
+from common.observability import logger
 from common.response import create_error_response
 from common.storage.ddb.custom_connector_documents_dao import \
     CustomConnectorDocumentsDao
@@ -64,485 +31,604 @@ from common.storage.ddb.custom_connector_jobs_dao import CustomConnectorJobsDao
 from common.storage.ddb.custom_connectors_dao import CustomConnectorsDao
 from common.tenant import TenantContext, extract_tenant_context
 
+if TYPE_CHECKING:
+    from activities.batch_delete_custom_connector_documents import \
+        BatchDeleteCustomConnectorDocumentsActivity
+    from activities.batch_put_custom_connector_documents import \
+        BatchPutCustomConnectorDocumentsActivity
+    from activities.create_custom_connector import \
+        CreateCustomConnectorActivity
+    from activities.delete_custom_connector import \
+        DeleteCustomConnectorActivity
+    from activities.delete_custom_connector_checkpoint import \
+        DeleteCustomConnectorCheckpointActivity
+    from activities.get_custom_connector import GetCustomConnectorActivity
+    from activities.get_custom_connector_checkpoint import \
+        GetCustomConnectorCheckpointActivity
+    from activities.list_custom_connector_documents import \
+        ListCustomConnectorDocumentsActivity
+    from activities.list_custom_connector_jobs import \
+        ListCustomConnectorJobsActivity
+    from activities.list_custom_connectors import ListCustomConnectorsActivity
+    from activities.put_custom_connector_checkpoint import \
+        PutCustomConnectorCheckpointActivity
+    from activities.start_custom_connector_job import \
+        StartCustomConnectorJobActivity
+    from activities.stop_custom_connector_job import \
+        StopCustomConnectorJobActivity
+    from activities.update_custom_connector import \
+        UpdateCustomConnectorActivity
+
 app = APIGatewayRestResolver()
-dynamodb = boto3.resource("dynamodb")
+dynamodb = create_dynamodb_resource()
+
+# DAOs and activities are built on the first request that needs them, so a cold start only pays
+# for the route it serves. Each accessor is cached, so warm invocations reuse the same instance.
+# Activity modules are imported the same way, by the accessor and route that use them, and their
+# request models set defer_build, so a model's schema is only built when its route first validates one.
+# pylint: disable=import-outside-toplevel
+
+
+@functools.lru_cache(maxsize=1)
+def _connectors_dao() -> CustomConnectorsDao:
+    """Return the connectors DAO."""
+    return CustomConnectorsDao(dynamodb.Table(CUSTOM_CONNECTORS_TABLE_NAME))
+
+
+@functools.lru_cache(maxsize=1)
+def _jobs_dao() -> CustomConnectorJobsDao:
+    """Return the jobs DAO."""
+    return CustomConnectorJobsDao(dynamodb.Table(CUSTOM_CONNECTOR_JOBS_TABLE_NAME), _connectors_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _documents_dao() -> CustomConnectorDocumentsDao:
+    """Return the documents DAO."""
+    return CustomConnectorDocumentsDao(dynamodb.Table(CUSTOM_CONNECTOR_DOCUMENTS_TABLE_NAME), _connectors_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _create_connector_activity() -> "CreateCustomConnectorActivity":
+    """Return the create connector activity."""
+    from activities.create_custom_connector import \
+        CreateCustomConnectorActivity
+
+    return CreateCustomConnectorActivity(_connectors_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_connector_activity() -> "GetCustomConnectorActivity":
+    """Return the get connector activity."""
+    from activities.get_custom_connector import GetCustomConnectorActivity
+
+    return GetCustomConnectorActivity(_connectors_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _list_connectors_activity() -> "ListCustomConnectorsActivity":
+    """Return the list connectors activity."""
+    from activities.list_custom_connectors import ListCustomConnectorsActivity
+
+    return ListCustomConnectorsActivity(_connectors_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _delete_connector_activity() -> "DeleteCustomConnectorActivity":
+    """Return the delete connector activity."""
+    from activities.delete_custom_connector import \
+        DeleteCustomConnectorActivity
+
+    return DeleteCustomConnectorActivity(_connectors_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _update_connector_activity() -> "UpdateCustomConnectorActivity":
+    """Return the update connector activity."""
+    from activities.update_custom_connector import \
+        UpdateCustomConnectorActivity
+
+    return UpdateCustomConnectorActivity(_connectors_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _start_job_activity() -> "StartCustomConnectorJobActivity":
+    """Return the start job activity."""
+    from activities.start_custom_connector_job import \
+        StartCustomConnectorJobActivity
+
+    return StartCustomConnectorJobActivity(_jobs_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _stop_job_activity() -> "StopCustomConnectorJobActivity":
+    """Return the stop job activity."""
+    from activities.stop_custom_connector_job import \
+        StopCustomConnectorJobActivity
+
+    return StopCustomConnectorJobActivity(_jobs_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _list_jobs_activity() -> "ListCustomConnectorJobsActivity":
+    """Return the list jobs activity."""
+    from activities.list_custom_connector_jobs import \
+        ListCustomConnectorJobsActivity
+
+    return ListCustomConnectorJobsActivity(_jobs_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _put_checkpoint_activity() -> "PutCustomConnectorCheckpointActivity":
+    """Return the put checkpoint activity."""
+    from activities.put_custom_connector_checkpoint import \
+        PutCustomConnectorCheckpointActivity
+
+    return PutCustomConnectorCheckpointActivity(_connectors_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_checkpoint_activity() -> "GetCustomConnectorCheckpointActivity":
+    """Return the get checkpoint activity."""
+    from activities.get_custom_connector_checkpoint import \
+        GetCustomConnectorCheckpointActivity
+
+    return GetCustomConnectorCheckpointActivity(_connectors_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _delete_checkpoint_activity() -> "DeleteCustomConnectorCheckpointActivity":
+    """Return the delete checkpoint activity."""
+    from activities.delete_custom_connector_checkpoint import \
+        DeleteCustomConnectorCheckpointActivity
+
+    return DeleteCustomConnectorCheckpointActivity(_connectors_dao())
 
-connectors_table = dynamodb.Table(CUSTOM_CONNECTORS_TABLE_NAME)
-jobs_table = dynamodb.Table(CUSTOM_CONNECTOR_JOBS_TABLE_NAME)
-documents_table = dynamodb.Table(CUSTOM_CONNECTOR_DOCUMENTS_TABLE_NAME)
 
-connectors_dao = CustomConnectorsDao(connectors_table)
-jobs_dao = CustomConnectorJobsDao(jobs_table, connectors_dao)
-documents_dao = CustomConnectorDocumentsDao(documents_table, connectors_dao)
+@functools.lru_cache(maxsize=1)
+def _batch_put_docs_activity() -> "BatchPutCustomConnectorDocumentsActivity":
+    """Return the batch put documents activity."""
+    from activities.batch_put_custom_connector_documents import \
+        BatchPutCustomConnectorDocumentsActivity
 
-create_connector_activity = CreateCustomConnectorActivity(connectors_dao)
-get_connector_activity = GetCustomConnectorActivity(connectors_dao)
-list_connectors_activity = ListCustomConnectorsActivity(connectors_dao)
-delete_connector_activity = DeleteCustomConnectorActivity(connectors_dao)
-update_connector_activity = UpdateCustomConnectorActivity(connectors_dao)
+    return BatchPutCustomConnectorDocumentsActivity(_documents_dao())
 
-start_job_activity = StartCustomConnectorJobActivity(jobs_dao)
-stop_job_activity = StopCustomConnectorJobActivity(jobs_dao)
-list_jobs_activity = ListCustomConnectorJobsActivity(jobs_dao)
 
-put_checkpoint_activity = PutCustomConnectorCheckpointActivity(connectors_dao)
-get_checkpoint_activity = GetCustomConnectorCheckpointActivity(connectors_dao)
-delete_checkpoint_activity = DeleteCustomConnectorCheckpointActivity(connectors_dao)
+@functools.lru_cache(maxsize=1)
+def _batch_delete_docs_activity() -> "BatchDeleteCustomConnectorDocumentsActivity":
+    """Return the batch delete documents activity."""
+    from activities.batch_delete_custom_connector_documents import \
+        BatchDeleteCustomConnectorDocumentsActivity
 
-batch_put_docs_activity = BatchPutCustomConnectorDocumentsActivity(documents_dao)
-batch_delete_docs_activity = BatchDeleteCustomConnectorDocumentsActivity(documents_dao)
-list_docs_activity = ListCustomConnectorDocumentsActivity(documents_dao)
+    return BatchDeleteCustomConnectorDocumentsActivity(_documents_dao())
+
+
+@functools.lru_cache(maxsize=1)
+def _list_docs_activity() -> "ListCustomConnectorDocumentsActivity":
+    """Return the list documents activity."""
+    from activities.list_custom_connector_documents import \
+        ListCustomConnectorDocumentsActivity
+
+    return ListCustomConnectorDocumentsActivity(_documents_dao())
+
+
+def parse_json_body() -> dict[str, Any]:
+    """
+    Parse the JSON body of the current request.
+
+    The body is decoded with orjson, the parser already used for response bodies, which is faster than
+    both the standard library and pydantic-core for the document batches sent to the documents endpoints.
+
+    Returns:
+        dict[str, Any]: The decoded body, or an empty dict if the request has no body
+
+    """
+    body: dict[str, Any] = orjson.loads(app.current_event.body or "{}")
+    return body
+
+
+def route_handler(error_message: str) -> Callable[[Callable[..., Response]], Callable[..., Response]]:
+    """
+    Wrap a route with the tenant context, log context and error handling shared by every route.
+
+    The route is called with the tenant context and a log context holding the account ID and the
+    path parameters, which are the connector and job IDs, followed by the path parameters themselves.
+
+    Args:
+        error_message: The message logged when the route raises
+
+    Returns:
+        Callable: A decorator that returns an error response for any exception the route raises
+
+    """
+
+    def decorator(route: Callable[..., Response]) -> Callable[..., Response]:
+        @functools.wraps(route)
+        def wrapper(**path_params: str) -> Response:
+            log_context = dict(path_params)
+            try:
+                tenant_context = extract_tenant_context(app.current_event.raw_event)
+                log_context["account_id"] = tenant_context.account_id
+                return route(tenant_context, log_context, **path_params)
+            except Exception as error:
+                logger.exception(error_message, extra={**log_context, "error": str(error)})
+                return create_error_response(error)
+
+        return wrapper
+
+    return decorator
 
 
 @app.post("/api/v1/custom-connectors")
-def create_custom_connector() -> Response:
+@route_handler("Error creating custom connector")
+def create_custom_connector(tenant_context: TenantContext, log_context: dict[str, str]) -> Response:
     """Create a new custom connector."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
-        body = json.loads(app.current_event.body or "{}")
+    from activities.create_custom_connector import CreateCustomConnectorRequest
 
-        log_context = create_log_context(LogContext(account_id=tenant_context.account_id))
-        logger.info("Creating custom connector", extra=log_context)
-        logger.debug("Create connector request body", extra={**log_context, "request_body": body})
+    body = parse_json_body()
 
-        activity_req = CreateCustomConnectorRequest(
-            tenant_context=tenant_context,
-            name=body["name"],
-            description=body.get("description"),
-            container_properties=ContainerProperties(**body["container_properties"]),
-        )
+    logger.info("Creating custom connector", extra=log_context)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Create connector request body", extra={**log_context, "request_body": body})
 
-        response = create_connector_activity.create(activity_req)
+    activity_req = CreateCustomConnectorRequest(
+        tenant_context=tenant_context,
+        name=body["name"],
+        description=body.get("description"),
+        # Nested models are validated by pydantic-core in the same pass as the request itself
+        container_properties=body["container_properties"],
+    )
 
-        logger.info("Custom connector created successfully", extra={**log_context, "status_code": response.status_code})
-        return response
+    # The activity adds the connector ID to the shared context, so the outcome log below carries it too
+    response = _create_connector_activity().create(activity_req, log_context)
 
-    except Exception as error:
-        log_context = create_log_context(LogContext(account_id=getattr(tenant_context, "account_id", None)))
-        logger.exception("Error creating custom connector", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    logger.info("Custom connector created successfully", extra={**log_context, "status_code": response.status_code})
+    return response
 
 
 @app.get("/api/v1/custom-connectors/<connector_id>")
-def get_custom_connector(connector_id: str) -> Response:
+@route_handler("Error getting custom connector")
+def get_custom_connector(tenant_context: TenantContext, log_context: dict[str, str], connector_id: str) -> Response:
     """Get a custom connector by ID."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
-
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info("Getting custom connector", extra=log_context)
+    from activities.get_custom_connector import GetCustomConnectorRequest
 
-        activity_req = GetCustomConnectorRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-        )
+    logger.info("Getting custom connector", extra=log_context)
 
-        response = get_connector_activity.fetch(activity_req)
+    activity_req = GetCustomConnectorRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+    )
 
-        logger.info(
-            "Custom connector retrieved successfully", extra={**log_context, "status_code": response.status_code}
-        )
-        return response
+    response = _get_connector_activity().fetch(activity_req, log_context)
 
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error getting custom connector", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    logger.info("Custom connector retrieved successfully", extra={**log_context, "status_code": response.status_code})
+    return response
 
 
 @app.get("/api/v1/custom-connectors")
-def list_custom_connectors() -> Response:
+@route_handler("Error listing custom connectors")
+def list_custom_connectors(tenant_context: TenantContext, log_context: dict[str, str]) -> Response:
     """List all custom connectors."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
-        query_string = app.current_event.query_string_parameters or {}
+    from activities.list_custom_connectors import ListCustomConnectorsRequest
 
-        log_context = create_log_context(LogContext(account_id=tenant_context.account_id))
-        logger.info(
-            "Listing custom connectors", extra={**log_context, "max_results": query_string.get("max_results", 50)}
-        )
+    query_string = app.current_event.query_string_parameters or {}
+    max_results = int(query_string.get("max_results", 50))
 
-        activity_req = ListCustomConnectorsRequest(
-            tenant_context=tenant_context,
-            max_results=int(query_string.get("max_results", 50)),
-            next_token=query_string.get("next_token"),
-        )
+    logger.info("Listing custom connectors", extra={**log_context, "max_results": max_results})
 
-        response = list_connectors_activity.list(activity_req)
+    activity_req = ListCustomConnectorsRequest(
+        tenant_context=tenant_context,
+        max_results=max_results,
+        next_token=query_string.get("next_token"),
+    )
 
-        logger.info("Custom connectors listed successfully", extra={**log_context, "status_code": response.status_code})
-        return response
+    response = _list_connectors_activity().list(activity_req, log_context)
 
-    except Exception as error:
-        log_context = create_log_context(LogContext(account_id=getattr(tenant_context, "account_id", None)))
-        logger.exception("Error listing custom connectors", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    logger.info("Custom connectors listed successfully", extra={**log_context, "status_code": response.status_code})
+    return response
 
 
 @app.delete("/api/v1/custom-connectors/<connector_id>")
-def delete_custom_connector(connector_id: str) -> Response:
+@route_handler("Error deleting custom connector")
+def delete_custom_connector(tenant_context: TenantContext, log_context: dict[str, str], connector_id: str) -> Response:
     """Delete a custom connector."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
+    from activities.delete_custom_connector import DeleteCustomConnectorRequest
 
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info("Deleting custom connector", extra=log_context)
+    logger.info("Deleting custom connector", extra=log_context)
 
-        activity_req = DeleteCustomConnectorRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-        )
-
-        response = delete_connector_activity.delete(activity_req)
+    activity_req = DeleteCustomConnectorRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+    )
 
-        logger.info("Custom connector deleted successfully", extra={**log_context, "status_code": response.status_code})
-        return response
+    response = _delete_connector_activity().delete(activity_req, log_context)
 
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error deleting custom connector", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    logger.info("Custom connector deleted successfully", extra={**log_context, "status_code": response.status_code})
+    return response
 
 
 @app.put("/api/v1/custom-connectors/<connector_id>")
-def update_custom_connector(connector_id: str) -> Response:
+@route_handler("Error updating custom connector")
+def update_custom_connector(tenant_context: TenantContext, log_context: dict[str, str], connector_id: str) -> Response:
     """Update a custom connector."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
-        body = json.loads(app.current_event.body or "{}")
-
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info("Updating custom connector", extra=log_context)
-        logger.debug("Update connector request body", extra={**log_context, "request_body": body})
+    from activities.update_custom_connector import UpdateCustomConnectorRequest
 
-        # Extract fields from the request body
-        name = body.get("name")
-        description = body.get("description")
-        container_properties = body.get("container_properties")
+    body = parse_json_body()
 
-        # Create the activity request
-        activity_req = UpdateCustomConnectorRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-            name=name,
-            description=description,
-            container_properties=UpdateContainerProperties(**container_properties) if container_properties else None,
-        )
+    logger.info("Updating custom connector", extra=log_context)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Update connector request body", extra={**log_context, "request_body": body})
 
-        response = update_connector_activity.update(activity_req)
+    # Extract fields from the request body
+    name = body.get("name")
+    description = body.get("description")
+    container_properties = body.get("container_properties")
+
+    # Create the activity request
+    activity_req = UpdateCustomConnectorRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+        name=name,
+        description=description,
+        container_properties=container_properties or None,
+    )
 
-        logger.info("Custom connector updated successfully", extra={**log_context, "status_code": response.status_code})
-        return response
+    response = _update_connector_activity().update(activity_req, log_context)
 
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error updating custom connector", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    logger.info("Custom connector updated successfully", extra={**log_context, "status_code": response.status_code})
+    return response
 
 
 @app.post("/api/v1/custom-connectors/<connector_id>/jobs")
-def start_custom_connector_job(connector_id: str) -> Response:
+@route_handler("Error starting custom connector job")
+def start_custom_connector_job(
+    tenant_context: TenantContext, log_context: dict[str, str], connector_id: str
+) -> Response:
     """Start a custom connector job."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
-        body = json.loads(app.current_event.body or "{}")
+    from activities.start_custom_connector_job import \
+        StartCustomConnectorJobRequest
 
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info("Starting custom connector job", extra=log_context)
-        logger.debug("Start job request body", extra={**log_context, "request_body": body})
+    body = parse_json_body()
 
-        activity_req = StartCustomConnectorJobRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-            environment=[EnvironmentVariable(**env) for env in body.get("environment", [])],
-        )
+    logger.info("Starting custom connector job", extra=log_context)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Start job request body", extra={**log_context, "request_body": body})
 
-        response = start_job_activity.start(activity_req)
+    activity_req = StartCustomConnectorJobRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+        environment=body.get("environment", []),
+        idempotency_token=body.get("idempotency_token"),
+    )
 
-        logger.info(
-            "Custom connector job started successfully", extra={**log_context, "status_code": response.status_code}
-        )
-        return response
+    # The activity adds the job ID to the shared context, so the outcome log below carries it too
+    response = _start_job_activity().start(activity_req, log_context)
 
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error starting custom connector job", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    logger.info("Custom connector job started successfully", extra={**log_context, "status_code": response.status_code})
+    return response
 
 
 @app.post("/api/v1/custom-connectors/<connector_id>/jobs/<job_id>/stop")
-def stop_custom_connector_job(connector_id: str, job_id: str) -> Response:
+@route_handler("Error stopping custom connector job")
+def stop_custom_connector_job(
+    tenant_context: TenantContext, log_context: dict[str, str], connector_id: str, job_id: str
+) -> Response:
     """Stop a custom connector job."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
+    from activities.stop_custom_connector_job import \
+        StopCustomConnectorJobRequest
 
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=tenant_context.account_id, job_id=job_id)
-        )
-        logger.info("Stopping custom connector job", extra=log_context)
+    logger.info("Stopping custom connector job", extra=log_context)
 
-        activity_req = StopCustomConnectorJobRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-            job_id=job_id,
-        )
+    activity_req = StopCustomConnectorJobRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+        job_id=job_id,
+    )
 
-        response = stop_job_activity.stop(activity_req)
+    response = _stop_job_activity().stop(activity_req, log_context)
 
-        logger.info(
-            "Custom connector job stopped successfully", extra={**log_context, "status_code": response.status_code}
-        )
-        return response
-
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None), job_id=job_id)
-        )
-        logger.exception("Error stopping custom connector job", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    logger.info("Custom connector job stopped successfully", extra={**log_context, "status_code": response.status_code})
+    return response
 
 
 @app.get("/api/v1/custom-connectors/<connector_id>/jobs")
-def list_custom_connector_jobs(connector_id: str) -> Response:
+@route_handler("Error listing custom connector jobs")
+def list_custom_connector_jobs(
+    tenant_context: TenantContext, log_context: dict[str, str], connector_id: str
+) -> Response:
     """List jobs for a custom connector."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
-        query_string = app.current_event.query_string_parameters or {}
-        status_str = query_string.get("status")
-        status = status_str and query_string.get("status")
-
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info(
-            "Listing custom connector jobs",
-            extra={**log_context, "status_filter": status, "max_results": query_string.get("max_results", 50)},
-        )
-
-        activity_req = ListJobsActivityRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-            max_results=int(query_string.get("max_results", 50)),
-            next_token=query_string.get("next_token"),
-            status=(status and status.strip()) or None,
-        )
-
-        response = list_jobs_activity.list(activity_req)
-
-        logger.info(
-            "Custom connector jobs listed successfully", extra={**log_context, "status_code": response.status_code}
-        )
-        return response
+    from activities.list_custom_connector_jobs import \
+        ListCustomConnectorJobsRequest as ListJobsActivityRequest
 
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error listing custom connector jobs", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    query_string = app.current_event.query_string_parameters or {}
+    status = (query_string.get("status") or "").strip() or None
+    max_results = int(query_string.get("max_results", 50))
+
+    logger.info(
+        "Listing custom connector jobs", extra={**log_context, "status_filter": status, "max_results": max_results}
+    )
+
+    activity_req = ListJobsActivityRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+        max_results=max_results,
+        next_token=query_string.get("next_token"),
+        status=status,
+    )
+
+    response = _list_jobs_activity().list(activity_req)
+
+    logger.info("Custom connector jobs listed successfully", extra={**log_context, "status_code": response.status_code})
+    return response
 
 
 @app.put("/api/v1/custom-connectors/<connector_id>/checkpoint")
-def put_custom_connector_checkpoint(connector_id: str) -> Response:
+@route_handler("Error putting custom connector checkpoint")
+def put_custom_connector_checkpoint(
+    tenant_context: TenantContext, log_context: dict[str, str], connector_id: str
+) -> Response:
     """Put a checkpoint for a custom connector."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
-        body = json.loads(app.current_event.body or "{}")
+    from activities.put_custom_connector_checkpoint import \
+        PutCustomConnectorCheckpointRequest
 
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info("Putting custom connector checkpoint", extra=log_context)
+    body = parse_json_body()
+
+    logger.info("Putting custom connector checkpoint", extra=log_context)
+    if logger.isEnabledFor(logging.DEBUG):
         logger.debug("Put checkpoint request body", extra={**log_context, "request_body": body})
 
-        activity_req = PutCustomConnectorCheckpointRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-            checkpoint_data=body["checkpoint_data"],
-        )
+    activity_req = PutCustomConnectorCheckpointRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+        checkpoint_data=body["checkpoint_data"],
+    )
 
-        response = put_checkpoint_activity.put(activity_req)
+    response = _put_checkpoint_activity().put(activity_req)
 
-        logger.info(
-            "Custom connector checkpoint put successfully", extra={**log_context, "status_code": response.status_code}
-        )
-        return response
-
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error putting custom connector checkpoint", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    logger.info(
+        "Custom connector checkpoint put successfully", extra={**log_context, "status_code": response.status_code}
+    )
+    return response
 
 
 @app.get("/api/v1/custom-connectors/<connector_id>/checkpoint")
-def get_custom_connector_checkpoint(connector_id: str) -> Response:
+@route_handler("Error getting custom connector checkpoint")
+def get_custom_connector_checkpoint(
+    tenant_context: TenantContext, log_context: dict[str, str], connector_id: str
+) -> Response:
     """Get a checkpoint for a custom connector."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
+    from activities.get_custom_connector_checkpoint import \
+        GetCustomConnectorCheckpointRequest
 
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info("Getting custom connector checkpoint", extra=log_context)
+    logger.info("Getting custom connector checkpoint", extra=log_context)
 
-        activity_req = GetCustomConnectorCheckpointRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-        )
-
-        response = get_checkpoint_activity.fetch(activity_req)
+    activity_req = GetCustomConnectorCheckpointRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+    )
 
-        logger.info(
-            "Custom connector checkpoint retrieved successfully",
-            extra={**log_context, "status_code": response.status_code},
-        )
-        return response
+    response = _get_checkpoint_activity().fetch(activity_req)
 
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error getting custom connector checkpoint", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    logger.info(
+        "Custom connector checkpoint retrieved successfully",
+        extra={**log_context, "status_code": response.status_code},
+    )
+    return response
 
 
 @app.delete("/api/v1/custom-connectors/<connector_id>/checkpoint")
-def delete_custom_connector_checkpoint(connector_id: str) -> Response:
+@route_handler("Error deleting custom connector checkpoint")
+def delete_custom_connector_checkpoint(
+    tenant_context: TenantContext, log_context: dict[str, str], connector_id: str
+) -> Response:
     """Delete a checkpoint for a custom connector."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
+    from activities.delete_custom_connector_checkpoint import \
+        DeleteCustomConnectorCheckpointRequest
 
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info("Deleting custom connector checkpoint", extra=log_context)
+    logger.info("Deleting custom connector checkpoint", extra=log_context)
 
-        activity_req = DeleteCustomConnectorCheckpointRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-        )
-
-        response = delete_checkpoint_activity.delete(activity_req)
+    activity_req = DeleteCustomConnectorCheckpointRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+    )
 
-        logger.info(
-            "Custom connector checkpoint deleted successfully",
-            extra={**log_context, "status_code": response.status_code},
-        )
-        return response
+    response = _delete_checkpoint_activity().delete(activity_req)
 
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error deleting custom connector checkpoint", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    logger.info(
+        "Custom connector checkpoint deleted successfully",
+        extra={**log_context, "status_code": response.status_code},
+    )
+    return response
 
 
 @app.post("/api/v1/custom-connectors/<connector_id>/documents")
-def batch_put_custom_connector_documents(connector_id: str) -> Response:
+@route_handler("Error batch putting custom connector documents")
+def batch_put_custom_connector_documents(
+    tenant_context: TenantContext, log_context: dict[str, str], connector_id: str
+) -> Response:
     """Batch put documents for a custom connector."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
-        body = json.loads(app.current_event.body or "{}")
-
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info(
-            "Batch putting custom connector documents",
-            extra={**log_context, "document_count": len(body.get("documents", []))},
-        )
-
-        activity_req = BatchPutCustomConnectorDocumentsRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-            documents=body["documents"],
-        )
-
-        response = batch_put_docs_activity.put(activity_req)
-
-        logger.info(
-            "Custom connector documents batch put successfully",
-            extra={**log_context, "status_code": response.status_code},
-        )
-        return response
+    from activities.batch_put_custom_connector_documents import \
+        BatchPutCustomConnectorDocumentsRequest
 
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error batch putting custom connector documents", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    body = parse_json_body()
+
+    logger.info(
+        "Batch putting custom connector documents",
+        extra={**log_context, "document_count": len(body.get("documents", []))},
+    )
+
+    activity_req = BatchPutCustomConnectorDocumentsRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+        documents=body["documents"],
+    )
+
+    response = _batch_put_docs_activity().put(activity_req, log_context)
+
+    logger.info(
+        "Custom connector documents batch put successfully",
+        extra={**log_context, "status_code": response.status_code},
+    )
+    return response
 
 
 @app.delete("/api/v1/custom-connectors/<connector_id>/documents")
-def batch_delete_custom_connector_documents(connector_id: str) -> Response:
+@route_handler("Error batch deleting custom connector documents")
+def batch_delete_custom_connector_documents(
+    tenant_context: TenantContext, log_context: dict[str, str], connector_id: str
+) -> Response:
     """Batch delete documents for a custom connector."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
-        body = json.loads(app.current_event.body or "{}")
-
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info(
-            "Batch deleting custom connector documents",
-            extra={**log_context, "document_id_count": len(body.get("document_ids", []))},
-        )
-
-        activity_req = BatchDeleteCustomConnectorDocumentsRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-            document_ids=body["document_ids"],
-        )
-
-        response = batch_delete_docs_activity.delete(activity_req)
-
-        logger.info(
-            "Custom connector documents batch deleted successfully",
-            extra={**log_context, "status_code": response.status_code},
-        )
-        return response
+    from activities.batch_delete_custom_connector_documents import \
+        BatchDeleteCustomConnectorDocumentsRequest
 
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error batch deleting custom connector documents", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    body = parse_json_body()
+
+    logger.info(
+        "Batch deleting custom connector documents",
+        extra={**log_context, "document_id_count": len(body.get("document_ids", []))},
+    )
+
+    activity_req = BatchDeleteCustomConnectorDocumentsRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+        document_ids=body["document_ids"],
+    )
+
+    response = _batch_delete_docs_activity().delete(activity_req)
+
+    logger.info(
+        "Custom connector documents batch deleted successfully",
+        extra={**log_context, "status_code": response.status_code},
+    )
+    return response
 
 
 @app.get("/api/v1/custom-connectors/<connector_id>/documents")
-def list_custom_connector_documents(connector_id: str) -> Response:
+@route_handler("Error listing custom connector documents")
+def list_custom_connector_documents(
+    tenant_context: TenantContext, log_context: dict[str, str], connector_id: str
+) -> Response:
     """List documents for a custom connector."""
-    try:
-        tenant_context: TenantContext = extract_tenant_context(app.current_event.raw_event)
-        query_string = app.current_event.query_string_parameters or {}
-
-        log_context = create_log_context(LogContext(connector_id=connector_id, account_id=tenant_context.account_id))
-        logger.info(
-            "Listing custom connector documents",
-            extra={**log_context, "max_results": query_string.get("max_results", 50)},
-        )
-
-        activity_req = ListCustomConnectorDocumentsRequest(
-            tenant_context=tenant_context,
-            connector_id=connector_id,
-            max_results=int(query_string.get("max_results", 50)),
-            next_token=query_string.get("next_token"),
-        )
-
-        response = list_docs_activity.list(activity_req)
-
-        logger.info(
-            "Custom connector documents listed successfully", extra={**log_context, "status_code": response.status_code}
-        )
-        return response
+    from activities.list_custom_connector_documents import \
+        ListCustomConnectorDocumentsRequest
 
-    except Exception as error:
-        log_context = create_log_context(
-            LogContext(connector_id=connector_id, account_id=getattr(tenant_context, "account_id", None))
-        )
-        logger.exception("Error listing custom connector documents", extra={**log_context, "error": str(error)})
-        return create_error_response(error)
+    query_string = app.current_event.query_string_parameters or {}
+    max_results = int(query_string.get("max_results", 50))
+
+    logger.info("Listing custom connector documents", extra={**log_context, "max_results": max_results})
+
+    activity_req = ListCustomConnectorDocumentsRequest(
+        tenant_context=tenant_context,
+        connector_id=connector_id,
+        max_results=max_results,
+        next_token=query_string.get("next_token"),
+    )
+
+    response = _list_docs_activity().list(activity_req)
+
+    logger.info(
+        "Custom connector documents listed successfully", extra={**log_context, "status_code": response.status_code}
+    )
+    return response
 
 
 @logger.inject_lambda_context
@@ -552,7 +638,8 @@ def handler(event: dict[str, Any], context: LambdaContext) -> dict[str, Any]:
         "Received API Gateway event",
         extra={"event_type": "api_gateway", "http_method": event.get("httpMethod"), "resource": event.get("resource")},
     )
-    logger.debug("Full event details", extra={"event": event})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Full event details", extra={"event": event})
 
     try:
         response = app.resolve(event, context)
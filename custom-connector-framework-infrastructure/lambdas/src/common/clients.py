@@ -0,0 +1,59 @@
+"""Shared AWS SDK client configuration for the Custom Connector Framework."""
+
+from typing import Any
+
+import boto3
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
+from common.env import AWS_REGION
+
+# Clients are created once per Lambda container, so keep their HTTPS connections alive between
+# warm invocations instead of repeating the TLS handshake on every request. Throttled calls such as
+# ProvisionedThroughputExceededException are retried with exponential backoff and jitter, and adaptive
+# mode also slows the client's own request rate while the service keeps throttling it. The region is
+# pinned to the one tenant ARNs are built with, rather than left to the SDK's own lookup.
+BOTO_CLIENT_CONFIG = Config(
+    region_name=AWS_REGION,
+    tcp_keepalive=True,
+    max_pool_connections=25,
+    retries={"mode": "adaptive", "max_attempts": 5},
+)
+
+# Error codes AWS returns when a caller is throttled
+_THROTTLING_ERROR_CODES = frozenset(
+    {"ProvisionedThroughputExceededException", "ThrottlingException", "RequestLimitExceeded"}
+)
+
+
+def create_dynamodb_resource() -> Any:
+    """
+    Create a DynamoDB service resource with the shared client configuration.
+
+    Returns:
+        Any: A DynamoDB service resource
+
+    """
+    return boto3.resource("dynamodb", config=BOTO_CLIENT_CONFIG)
+
+
+def is_throttled(error: BaseException) -> bool:
+    """
+    Check whether an error was caused by AWS throttling a call.
+
+    The chain of causes is followed, since DAOs wrap the underlying ClientError in their own errors.
+    A throttled call has already used up its SDK retries by the time it is raised.
+
+    Args:
+        error: The error to inspect
+
+    Returns:
+        bool: True if a ClientError with a throttling error code is in the chain of causes
+
+    """
+    cause: BaseException | None = error
+    while cause is not None:
+        if isinstance(cause, ClientError) and cause.response.get("Error", {}).get("Code") in _THROTTLING_ERROR_CODES:
+            return True
+        cause = cause.__cause__
+    return False
@@ -3,7 +3,8 @@
 from aws_lambda_powertools import Logger, Tracer
 from pydantic import BaseModel
 
-# Initialize logger
+# Initialize logger. Debug records that dump a model or request body are guarded with
+# logger.isEnabledFor(logging.DEBUG), since building their extra walks the whole model even when dropped
 logger = Logger(service="CustomConnectorFramework")
 tracer = Tracer(service="CustomConnectorFramework")
 
@@ -1,16 +1,28 @@
 """Response utilities for the Custom Connector Framework."""
 
-import json
+import functools
 from http import HTTPStatus
 from typing import Any
 
+import orjson
 from aws_lambda_powertools.event_handler import Response
 from pydantic import BaseModel
+from pydantic_core import to_json
 
-from common.exceptions import CustomConnectorFrameworkError
+from common.exceptions import CustomConnectorFrameworkError, ErrorType
 
 APPLICATION_JSON = "application/json"
 
+# Pre-serialized tail of an error body for each error type, so only the message is encoded per error
+_ERROR_BODY_SUFFIXES = {
+    error_type.value: f',"errorType":{orjson.dumps(error_type.value).decode()}}}' for error_type in ErrorType
+}
+
+
+def _dumps(body: Any) -> str:
+    """Serialize a response body with orjson, decoded to the str body API Gateway expects."""
+    return orjson.dumps(body).decode()
+
 
 def create_success_response(
     body: BaseModel | dict[str, Any] | list[BaseModel | dict[str, Any] | str] | str | None = None,
@@ -35,20 +47,16 @@ def create_success_response(
 
     if isinstance(body, list):
         # Handle list of BaseModel, Dict, or str
-        processed_list = []
         for item in body:
-            if isinstance(item, BaseModel):
-                processed_list.append(json.loads(item.model_dump_json()))
-            elif isinstance(item, dict | str):
-                processed_list.append(item)
-            else:
+            if not isinstance(item, BaseModel | dict | str):
                 msg = "List items must be either BaseModel, dictionary, or string"
                 raise TypeError(msg)
 
+        # pydantic-core serializes the models in place, without dumping each one to a dict first
         return Response(
             status_code=status_code,
             content_type=APPLICATION_JSON,
-            body=json.dumps(processed_list),
+            body=to_json(body).decode(),
         )
 
     if isinstance(body, BaseModel):
@@ -62,13 +70,32 @@ def create_success_response(
         return Response(
             status_code=status_code,
             content_type=APPLICATION_JSON,
-            body=json.dumps(body),
+            body=_dumps(body),
         )
 
     msg = "Body must be a BaseModel, dictionary, string, or list of BaseModel/dictionary/string"
     raise ValueError(msg)
 
 
+def create_serialized_response(body: str, status_code: int = HTTPStatus.OK) -> Response:
+    """
+    Create a success response from a body that is already serialized JSON.
+
+    Args:
+        body: The JSON response body
+        status_code: The HTTP status code
+
+    Returns:
+        Response: The API Gateway response
+
+    """
+    return Response(
+        status_code=status_code,
+        content_type=APPLICATION_JSON,
+        body=body,
+    )
+
+
 def create_error_response(
     error: CustomConnectorFrameworkError | Exception,
     status_code: int | None = None,
@@ -86,19 +113,24 @@ def create_error_response(
     """
     if isinstance(error, CustomConnectorFrameworkError):
         response_status_code = status_code if status_code is not None else error.status_code
-        error_body = {
-            "message": error.message,
-            "errorType": error.error_type,
-        }
+        message = error.message
+        error_type = error.error_type.value
     else:
         response_status_code = status_code if status_code is not None else HTTPStatus.INTERNAL_SERVER_ERROR
-        error_body = {
-            "message": str(error),
-            "errorType": "InternalServerError",
-        }
+        message = str(error)
+        error_type = ErrorType.INTERNAL_SERVER_ERROR.value
 
     return Response(
         status_code=response_status_code,
         content_type=APPLICATION_JSON,
-        body=json.dumps(error_body),
+        body=_error_body(message, error_type),
     )
+
+
+@functools.lru_cache(maxsize=512)
+def _error_body(message: str, error_type: str) -> str:
+    """Serialize an error body, memoized since the same errors repeat, e.g. during throttling."""
+    suffix = _ERROR_BODY_SUFFIXES.get(error_type)
+    if suffix is None:
+        return _dumps({"message": message, "errorType": error_type})
+    return f'{{"message":{_dumps(message)}{suffix}'
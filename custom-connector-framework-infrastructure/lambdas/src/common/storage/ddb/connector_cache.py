@@ -0,0 +1,63 @@
+"""In-container cache of connector existence checks shared by the DAOs."""
+
+import time
+from collections import OrderedDict
+
+# Seconds a successful existence check is trusted before the connector is read again
+_TTL_SECONDS = 60.0
+
+# Connectors remembered per container, the oldest entry is evicted first
+_MAX_ENTRIES = 512
+
+# Module level, so warm invocations of the same container reuse it
+_verified_at: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+
+def is_known(arn_prefix: str, connector_id: str) -> bool:
+    """
+    Check whether a connector was seen to exist within the last TTL window.
+
+    Args:
+        arn_prefix: The tenant ARN prefix of the connector
+        connector_id: The connector ID
+
+    Returns:
+        True if the connector existence check can be skipped
+
+    """
+    key = (arn_prefix, connector_id)
+    verified_at = _verified_at.get(key)
+    if verified_at is None:
+        return False
+    if time.monotonic() - verified_at > _TTL_SECONDS:
+        _verified_at.pop(key, None)
+        return False
+    return True
+
+
+def remember(arn_prefix: str, connector_id: str) -> None:
+    """
+    Record that a connector was just seen to exist.
+
+    Args:
+        arn_prefix: The tenant ARN prefix of the connector
+        connector_id: The connector ID
+
+    """
+    key = (arn_prefix, connector_id)
+    _verified_at[key] = time.monotonic()
+    _verified_at.move_to_end(key)
+    if len(_verified_at) > _MAX_ENTRIES:
+        _verified_at.popitem(last=False)
+
+
+def invalidate(arn_prefix: str, connector_id: str) -> None:
+    """
+    Forget a connector, so the next existence check reads DynamoDB.
+
+    Args:
+        arn_prefix: The tenant ARN prefix of the connector
+        connector_id: The connector ID
+
+    """
+    _verified_at.pop((arn_prefix, connector_id), None)
@@ -2,21 +2,25 @@
 
 import json
 from datetime import UTC, datetime
-from typing import Any
 
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 from mypy_boto3_dynamodb.service_resource import Table
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
+from common.storage.ddb import connector_cache
 from common.storage.ddb.custom_connectors_dao import CustomConnectorsDao
 from common.storage.ddb.custom_connectors_dao import \
     DaoInternalError as ConnectorDaoInternalError
 from common.storage.ddb.custom_connectors_dao import \
     DaoResourceNotFoundError as ConnectorDaoNotFoundError
 from common.storage.ddb.custom_connectors_dao import GetConnectorRequest
+from common.storage.ddb.projection import build_projection
 from common.tenant import TenantContext
 
+# Attributes read into a DocumentSummary
+_DOCUMENT_SUMMARY_PROJECTION = build_projection(("document_id", "checksum", "created_at", "updated_at"))
+
 
 class DaoConflictError(Exception):
     """Exception raised when a conflict occurs in the DAO operations."""
@@ -52,6 +56,9 @@ class DaoInternalError(Exception):
 class DocumentItem(BaseModel):
     """Model representing a document item in the database."""
 
+    # Batches can hold many items, keep them immutable once validated
+    model_config = ConfigDict(frozen=True)
+
     document_id: str
     checksum: str
 
@@ -126,29 +133,34 @@ class CustomConnectorDocumentsDao:
         # Explicitly cast the return value to str to satisfy mypy
         return str(tenant_context.get_arn_prefix())
 
-    def _verify_connector_exists(self, tenant_context: TenantContext, connector_id: str) -> Any:
+    def _verify_connector_exists(
+        self, tenant_context: TenantContext, connector_id: str, *, use_cache: bool = False
+    ) -> None:
         """
         Verify that a connector exists.
 
         Args:
             tenant_context: The tenant context
             connector_id: The connector ID to verify
-
-        Returns:
-            The connector if it exists
+            use_cache: Skip the read if the connector was seen to exist recently in this container.
+                Only for read paths, another container may have deleted the connector since.
 
         Raises:
             DaoResourceNotFoundError: If the connector does not exist
             DaoInternalError: If there is an internal error
 
         """
+        arn_prefix = self._get_arn_prefix(tenant_context)
+        if use_cache and connector_cache.is_known(arn_prefix, connector_id):
+            return
         try:
             get_req = GetConnectorRequest(tenant_context=tenant_context, connector_id=connector_id)
-            return self.connectors_dao.get_connector(get_req)
+            self.connectors_dao.get_connector(get_req)
         except ConnectorDaoNotFoundError as error:
             raise DaoResourceNotFoundError(DaoResourceNotFoundError.CONNECTOR_NOT_FOUND) from error
         except ConnectorDaoInternalError as error:
             raise DaoInternalError(DaoInternalError.VERIFY_CONNECTOR_FAILED) from error
+        connector_cache.remember(arn_prefix, connector_id)
 
     def batch_put_documents(self, request: BatchPutDocumentsRequest) -> None:
         """
@@ -216,13 +228,14 @@ class CustomConnectorDocumentsDao:
             DaoInternalError: If there is an internal error
 
         """
-        self._verify_connector_exists(request.tenant_context, request.connector_id)
+        self._verify_connector_exists(request.tenant_context, request.connector_id, use_cache=True)
         arn_prefix = self._get_arn_prefix(request.tenant_context)
         query_kwargs = {
             "IndexName": "GSI1",
             "KeyConditionExpression": Key("custom_connector_arn_prefix").eq(arn_prefix)
             & Key("connector_id").eq(request.connector_id),
             "Limit": request.max_results,
+            **_DOCUMENT_SUMMARY_PROJECTION,
         }
         if request.next_token:
             try:
@@ -1,15 +1,19 @@
 """DAO for managing custom connector jobs."""
 
+import base64
 import json
 import uuid
 from datetime import UTC, datetime, timedelta
 from enum import Enum
+from typing import Any
 
+import orjson
 from boto3.dynamodb.conditions import Key
 from botocore.exceptions import ClientError
 from mypy_boto3_dynamodb.service_resource import Table
 from pydantic import BaseModel, Field
 
+from common.storage.ddb import connector_cache
 from common.storage.ddb.custom_connectors_dao import \
     ConnectorStatus as DaoConnectorStatus
 from common.storage.ddb.custom_connectors_dao import CustomConnectorsDao
@@ -19,8 +23,37 @@ from common.storage.ddb.custom_connectors_dao import \
     DaoResourceNotFoundError as ConnectorDaoNotFoundError
 from common.storage.ddb.custom_connectors_dao import (
     GetConnectorRequest, UpdateConnectorStatusRequest)
+from common.storage.ddb.projection import build_projection
 from common.tenant import TenantContext
 
+# Attributes read into a JobSummary, so listing skips each job's environment
+_JOB_SUMMARY_PROJECTION = build_projection(("job_id", "connector_id", "status", "created_at"))
+
+# Namespace for job IDs derived from an idempotency token, so a retried start maps to the same job
+_IDEMPOTENT_JOB_ID_NAMESPACE = uuid.UUID("9447f5e5-7b0b-4151-b30b-01e18b447254")
+
+
+def decode_environment(value: Any) -> list[dict]:
+    """
+    Decode a job's stored environment into the list of name/value dicts AWS Batch expects.
+
+    Args:
+        value: The stored attribute, an orjson blob as bytes or a boto3 Binary, the base64 string a
+            DynamoDB stream record carries for that blob, or a list on older items
+
+    Returns:
+        The environment variables, empty when none were stored
+
+    """
+    if not value:
+        return []
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        # Stream records keep binary attributes base64 encoded, as they arrive in the event
+        return orjson.loads(base64.b64decode(value))
+    return orjson.loads(getattr(value, "value", value))
+
 
 class JobStatus(str, Enum):
     """Enumeration of job statuses."""
@@ -39,6 +72,7 @@ class StartJobRequest(BaseModel):
     tenant_context: TenantContext
     connector_id: str
     environment: list[dict] | None = Field(default_factory=list)
+    idempotency_token: str | None = None
 
 
 class StartJobResponse(BaseModel):
@@ -148,7 +182,7 @@ class CustomConnectorJobsDao:
 
     Every method first verifies that the given connector exists in the CustomConnectors table.
     - start_job: checks connector exists & AVAILABLE, then marks connector IN_USE and inserts new job.
-    - update_job_status: checks connector exists, ensures job not in terminal status,
+    - update_job_status: in one transaction checks connector exists, ensures job not in terminal status,
       updates job status (and batch_job_id), applies TTL if needed, and marks connector AVAILABLE if stopped/failed.
     - list_jobs: checks connector exists, then queries the jobs GSI.
 
@@ -178,9 +212,15 @@ class CustomConnectorJobsDao:
         """
         Ensure that the connector exists in the CustomConnectors table.
 
+        A connector seen to exist recently in this container is not read again, so this is only
+        used on read paths. Writes check the connector in the same request instead.
+
         Raises DaoResourceNotFoundError if missing.
         Raises DaoInternalError on any unexpected error while fetching.
         """
+        arn_prefix = tenant_context.get_arn_prefix()
+        if connector_cache.is_known(arn_prefix, connector_id):
+            return
         try:
             get_req = GetConnectorRequest(tenant_context=tenant_context, connector_id=connector_id)
             self.connectors_dao.get_connector(get_req)
@@ -188,17 +228,19 @@ class CustomConnectorJobsDao:
             raise ConnectorNotFoundError(connector_id) from None
         except ConnectorDaoInternalError as error:
             raise DaoInternalError(f"Failed to verify connector: {error.message}") from error
+        connector_cache.remember(arn_prefix, connector_id)
 
     def start_job(self, request: StartJobRequest) -> StartJobResponse:
         """
         Start a new job for a custom connector.
 
+        0. If an idempotency token is given, derive the job ID from it and return the job
+           if an earlier request with the same token already started it.
         1. Verify connector exists in CustomConnectors & is AVAILABLE.
            - If not found: raise DaoResourceNotFoundError.
            - If found but status != AVAILABLE: raise DaoConflictError.
-        2. Mark connector as IN_USE.
-        3. Insert a new job item into DynamoDB with status=STARTED.
-           - If insertion fails, roll back connector status to AVAILABLE.
+        2. In one transaction, mark connector as IN_USE and insert a new job item with status=STARTED.
+           - If the connector stopped being AVAILABLE meanwhile: raise DaoConflictError.
 
         Raises:
             DaoResourceNotFoundError: if connector_id doesn’t exist.
@@ -206,6 +248,17 @@ class CustomConnectorJobsDao:
             DaoInternalError: on any unexpected DynamoDB/DAO failure.
 
         """
+        arn_prefix = request.tenant_context.get_arn_prefix()
+
+        # Step 0: A retried request returns the job its first attempt started
+        if request.idempotency_token is not None:
+            job_id = self._idempotent_job_id(arn_prefix, request.connector_id, request.idempotency_token)
+            existing_job = self._find_job(arn_prefix, job_id)
+            if existing_job is not None:
+                return existing_job
+        else:
+            job_id = f"ccj-{uuid.uuid4().hex[:12]}"
+
         # Step 1: Verify existence & availability
         try:
             get_req = GetConnectorRequest(tenant_context=request.tenant_context, connector_id=request.connector_id)
@@ -220,52 +273,62 @@ class CustomConnectorJobsDao:
                 f"Connector '{request.connector_id}' is in state '{connector_info.status.value}' and is not AVAILABLE"
             )
 
-        # Step 2: Mark connector as IN_USE
-        try:
-            update_conn_req = UpdateConnectorStatusRequest(
-                tenant_context=request.tenant_context,
-                connector_id=request.connector_id,
-                status=DaoConnectorStatus.IN_USE,
-            )
-            self.connectors_dao.update_connector_status(update_conn_req)
-        except ConnectorDaoNotFoundError:
-            raise DaoResourceNotFoundError(
-                f"Connector '{request.connector_id}' not found when marking IN_USE"
-            ) from None
-        except ConnectorDaoInternalError as error:
-            raise DaoInternalError(
-                f"Failed to mark connector '{request.connector_id}' IN_USE: {error.message}"
-            ) from error
-
-        # Step 3: Insert a new job record
-        now_dt = datetime.now(UTC)
-        now_iso = now_dt.isoformat()
-        job_id = f"ccj-{uuid.uuid4().hex[:12]}"
-        arn_prefix = request.tenant_context.get_arn_prefix()
+        # Step 2: Mark connector as IN_USE and insert the job in one transaction, so a failed
+        # insert never leaves the connector IN_USE and no rollback write is needed
+        now_iso = datetime.now(UTC).isoformat()
 
         item = {
             "custom_connector_arn_prefix": arn_prefix,
             "job_id": job_id,
             "connector_id": request.connector_id,
             "status": JobStatus.STARTED.value,
-            "environment": request.environment,
+            # One binary attribute instead of a list of maps, smaller to store and faster to marshal
+            "environment": orjson.dumps(request.environment or []),
             "created_at": now_iso,
             "updated_at": now_iso,
         }
 
         try:
-            self.table.put_item(Item=item)
+            self.table.meta.client.transact_write_items(
+                TransactItems=[
+                    {
+                        "Update": {
+                            "TableName": self.connectors_dao.table.name,
+                            "Key": {"custom_connector_arn_prefix": arn_prefix, "connector_id": request.connector_id},
+                            "UpdateExpression": (
+                                "SET #st = :in_use, version = if_not_exists(version, :one) + :one, "
+                                "updated_at = :updated_at"
+                            ),
+                            # Guards against another start taking the connector since it was read
+                            "ConditionExpression": "attribute_exists(connector_id) AND #st = :available",
+                            "ExpressionAttributeNames": {"#st": "status"},
+                            "ExpressionAttributeValues": {
+                                ":in_use": DaoConnectorStatus.IN_USE.value,
+                                ":available": DaoConnectorStatus.AVAILABLE.value,
+                                ":one": 1,
+                                ":updated_at": now_iso,
+                            },
+                        }
+                    },
+                    {
+                        "Put": {
+                            "TableName": self.table.name,
+                            "Item": item,
+                            "ConditionExpression": "attribute_not_exists(job_id)",
+                        }
+                    },
+                ]
+            )
         except ClientError as error:
-            # Roll back connector status to AVAILABLE on failure
-            try:
-                rollback_req = UpdateConnectorStatusRequest(
-                    tenant_context=request.tenant_context,
-                    connector_id=request.connector_id,
-                    status=DaoConnectorStatus.AVAILABLE,
-                )
-                self.connectors_dao.update_connector_status(rollback_req)
-            except Exception:
-                pass
+            if error.response.get("Error", {}).get("Code") == "TransactionCanceledException":
+                # A concurrent request with the same token may have inserted the job first
+                if request.idempotency_token is not None:
+                    existing_job = self._find_job(arn_prefix, job_id)
+                    if existing_job is not None:
+                        return existing_job
+                raise DaoConflictError(
+                    f"Connector '{request.connector_id}' is no longer AVAILABLE, it was modified by another process"
+                ) from error
             raise DaoInternalError(f"Failed to start job: {error.response['Error']['Message']}") from error
 
         return StartJobResponse(
@@ -275,6 +338,32 @@ class CustomConnectorJobsDao:
             created_at=now_iso,
         )
 
+    @staticmethod
+    def _idempotent_job_id(arn_prefix: str, connector_id: str, idempotency_token: str) -> str:
+        """Derive a job ID from an idempotency token, in the same ccj-<12 hex> format as random IDs."""
+        name = f"{arn_prefix}:{connector_id}:{idempotency_token}"
+        return f"ccj-{uuid.uuid5(_IDEMPOTENT_JOB_ID_NAMESPACE, name).hex[:12]}"
+
+    def _find_job(self, arn_prefix: str, job_id: str) -> StartJobResponse | None:
+        """Fetch a job as a StartJobResponse, or None if it does not exist."""
+        try:
+            response = self.table.get_item(
+                Key={"custom_connector_arn_prefix": arn_prefix, "job_id": job_id},
+                **_JOB_SUMMARY_PROJECTION,
+            )
+        except ClientError as error:
+            raise DaoInternalError(f"Failed to fetch job '{job_id}': {error.response['Error']['Message']}") from error
+
+        item = response.get("Item")
+        if not item:
+            return None
+        return StartJobResponse(
+            job_id=item["job_id"],
+            connector_id=item["connector_id"],
+            status=JobStatus(item["status"]),
+            created_at=item["created_at"],
+        )
+
     def _fetch_job_item(self, tenant_context: TenantContext, job_id: str) -> dict:
         """Fetch job item from DynamoDB."""
         arn_prefix = tenant_context.get_arn_prefix()
@@ -319,11 +408,12 @@ class CustomConnectorJobsDao:
         """
         Update the status of a job.
 
-        1. Verify that the connector exists in CustomConnectors.
-           - If not found: raise DaoResourceNotFoundError.
-        2. Fetch existing job; if status ∈ {STOPPED, FAILED}, raise DaoConflictError.
-        3. Update job’s status (and optionally batch_job_id).
-           If status ∈ {STOPPED, FAILED}:
+        1. In one transaction, check that the connector exists in CustomConnectors and update
+           the job’s status (and optionally batch_job_id) with a conditional write.
+           - If the connector is missing: raise DaoResourceNotFoundError.
+           - If the job is missing: raise DaoResourceNotFoundError.
+           - If its status ∈ {STOPPED, FAILED}: raise DaoConflictError.
+           If the new status ∈ {STOPPED, FAILED}:
              - Set TTL = now + 7 days.
              - Mark connector status back to AVAILABLE.
 
@@ -333,35 +423,10 @@ class CustomConnectorJobsDao:
             DaoInternalError: if DynamoDB update_item fails unexpectedly.
 
         """
-        # Step 1: Verify existence
-        self._verify_connector_exists(request.tenant_context, request.connector_id)
-
         arn_prefix = request.tenant_context.get_arn_prefix()
 
-        # Step 2: Retrieve current job status
-        try:
-            response = self.table.get_item(
-                Key={
-                    "custom_connector_arn_prefix": arn_prefix,
-                    "job_id": request.job_id,
-                }
-            )
-        except ClientError as error:
-            raise DaoInternalError(
-                f"Failed to fetch job '{request.job_id}': {error.response['Error']['Message']}"
-            ) from error
-
-        item = response.get("Item")
-        if not item:
-            raise DaoResourceNotFoundError(f"Job with ID '{request.job_id}' not found") from None
-
-        current_status = item.get("status")
-        if current_status in (JobStatus.STOPPED.value, JobStatus.FAILED.value):
-            raise DaoConflictError(
-                f"Job '{request.job_id!s}' is already in terminal status '{current_status}'"
-            ) from None
-
-        # Step 3: Apply update
+        # Step 1: Apply the update, the conditions reject a missing connector, a missing job and a job in a terminal
+        # status. The connector is checked in the same transaction, so a deleted connector never gets job writes
         now_dt = datetime.now(UTC)
         now_iso = now_dt.isoformat()
 
@@ -370,6 +435,8 @@ class CustomConnectorJobsDao:
         expr_attr_values = {
             ":status": request.status.value,
             ":updated_at": now_iso,
+            ":stopped": JobStatus.STOPPED.value,
+            ":failed": JobStatus.FAILED.value,
         }
 
         if request.batch_job_id is not None:
@@ -390,24 +457,47 @@ class CustomConnectorJobsDao:
         update_expr = "SET " + ", ".join(update_expr_parts)
 
         try:
-            self.table.meta.client.update_item(
-                TableName=self.table.name,
-                Key={
-                    "custom_connector_arn_prefix": arn_prefix,
-                    "job_id": request.job_id,
-                },
-                ConditionExpression="attribute_exists(job_id)",
-                UpdateExpression=update_expr,
-                ExpressionAttributeNames=expr_attr_names,
-                ExpressionAttributeValues=expr_attr_values,
+            self.table.meta.client.transact_write_items(
+                TransactItems=[
+                    {
+                        "ConditionCheck": {
+                            "TableName": self.connectors_dao.table.name,
+                            "Key": {"custom_connector_arn_prefix": arn_prefix, "connector_id": request.connector_id},
+                            "ConditionExpression": "attribute_exists(connector_id)",
+                        }
+                    },
+                    {
+                        "Update": {
+                            "TableName": self.table.name,
+                            "Key": {"custom_connector_arn_prefix": arn_prefix, "job_id": request.job_id},
+                            "ConditionExpression": "attribute_exists(job_id) AND NOT #status IN (:stopped, :failed)",
+                            "UpdateExpression": update_expr,
+                            "ExpressionAttributeNames": expr_attr_names,
+                            "ExpressionAttributeValues": expr_attr_values,
+                            "ReturnValuesOnConditionCheckFailure": "ALL_OLD",
+                        }
+                    },
+                ]
             )
         except ClientError as error:
             error_code = error.response.get("Error", {}).get("Code")
-            if error_code == "ConditionalCheckFailedException":
-                raise DaoResourceNotFoundError(f"Job with ID '{request.job_id}' not found") from error
+            if error_code == "TransactionCanceledException":
+                # One reason per transact item, in order: the connector check, then the job update
+                connector_reason, job_reason = error.response.get("CancellationReasons", [{}, {}])
+                if connector_reason.get("Code") == "ConditionalCheckFailed":
+                    raise ConnectorNotFoundError(request.connector_id) from error
+                if job_reason.get("Code") == "ConditionalCheckFailed":
+                    # The old item is returned in wire format, without it the job does not exist
+                    old_item = job_reason.get("Item")
+                    if not old_item:
+                        raise DaoResourceNotFoundError(f"Job with ID '{request.job_id}' not found") from error
+                    current_status = old_item.get("status", {}).get("S")
+                    raise DaoConflictError(
+                        f"Job '{request.job_id!s}' is already in terminal status '{current_status}'"
+                    ) from error
             raise DaoInternalError(f"Failed to update job status: {error.response['Error']['Message']}") from error
 
-        # Step 4: If terminal, mark connector AVAILABLE
+        # Step 2: If terminal, mark connector AVAILABLE
         if mark_available:
             try:
                 update_conn_req = UpdateConnectorStatusRequest(
@@ -446,6 +536,7 @@ class CustomConnectorJobsDao:
             "KeyConditionExpression": Key("custom_connector_arn_prefix").eq(arn_prefix)
             & Key("connector_id").eq(request.connector_id),
             "Limit": request.max_results,
+            **_JOB_SUMMARY_PROJECTION,
         }
 
         if request.next_token:
@@ -12,8 +12,36 @@ from botocore.exceptions import ClientError
 from mypy_boto3_dynamodb.service_resource import Table
 from pydantic import BaseModel, Field, field_validator
 
+from common.storage.ddb import connector_cache
+from common.storage.ddb.projection import build_projection
 from common.tenant import TenantContext
 
+# Attributes read into a ConnectorSummary, so listing skips container properties and checkpoints
+_CONNECTOR_SUMMARY_PROJECTION = build_projection(
+    ("connector_id", "arn", "name", "created_at", "updated_at", "description", "status", "version")
+)
+
+# Offset datetime.isoformat() writes for the stored UTC timestamps
+_UTC_OFFSET = "+00:00"
+
+
+def _api_timestamp(stored: str) -> str:
+    """
+    Format a stored UTC timestamp the way Pydantic serializes a UTC datetime, ending in Z.
+
+    Responses built from datetime fields and from stored strings then agree for the same connector.
+
+    Args:
+        stored: The ISO 8601 timestamp as stored in DynamoDB
+
+    Returns:
+        The timestamp with a Z suffix instead of the +00:00 offset
+
+    """
+    if stored.endswith(_UTC_OFFSET):
+        return stored[: -len(_UTC_OFFSET)] + "Z"
+    return stored
+
 
 class ConnectorStatus(str, Enum):
     """Enum representing the status of a connector."""
@@ -107,13 +135,13 @@ class UpdateConnectorRequest(BaseModel):
 
 
 class UpdateConnectorResponse(BaseModel):
-    """Response model for updating a connector."""
+    """Response model for updating a connector, with timestamps kept as ISO 8601 strings."""
 
     connector_id: str
     arn: str
     name: str
-    created_at: datetime
-    updated_at: datetime
+    created_at: str
+    updated_at: str
     description: str | None
     status: ConnectorStatus
     version: int
@@ -150,13 +178,13 @@ class ListConnectorsRequest(BaseModel):
 
 
 class ConnectorSummary(BaseModel):
-    """Summary model for a connector."""
+    """Summary model for a connector, with timestamps kept as ISO 8601 strings."""
 
     connector_id: str
     arn: str
     name: str
-    created_at: datetime
-    updated_at: datetime
+    created_at: str
+    updated_at: str
     description: str | None
     status: ConnectorStatus
     version: int
@@ -333,6 +361,7 @@ class CustomConnectorsDao:
         query_kwargs = {
             "KeyConditionExpression": Key("custom_connector_arn_prefix").eq(arn_prefix),
             "Limit": request.max_results,
+            **_CONNECTOR_SUMMARY_PROJECTION,
         }
         if request.next_token:
             query_kwargs["ExclusiveStartKey"] = json.loads(request.next_token)
@@ -347,8 +376,8 @@ class CustomConnectorsDao:
                 connector_id=item["connector_id"],
                 arn=item["arn"],
                 name=item["name"],
-                created_at=datetime.fromisoformat(item["created_at"]),
-                updated_at=datetime.fromisoformat(item["updated_at"]),
+                created_at=_api_timestamp(item["created_at"]),
+                updated_at=_api_timestamp(item["updated_at"]),
                 description=item.get("description"),
                 status=ConnectorStatus(item["status"]),
                 version=item.get("version", 1),
@@ -389,6 +418,7 @@ class CustomConnectorsDao:
                 except DaoResourceNotFoundError:
                     raise DaoResourceNotFoundError(f"Connector '{request.connector_id}' not found") from error
             raise DaoInternalError(f"Failed to delete connector: {error.response['Error']['Message']}") from error
+        connector_cache.invalidate(arn_prefix, request.connector_id)
 
     def update_connector_status(self, request: UpdateConnectorStatusRequest) -> None:
         """Update the status of a connector."""
@@ -444,38 +474,23 @@ class CustomConnectorsDao:
         }
 
         try:
-            # First get the current item to get the version
-            response = self.table.get_item(
-                Key={
-                    "custom_connector_arn_prefix": arn_prefix,
-                    "connector_id": request.connector_id,
-                }
-            )
-
-            item = response.get("Item")
-            if not item:
-                raise DaoResourceNotFoundError("Connector 'request.connector_id' not found") from None
-
-            # Get the current version for optimistic locking
-            current_version = item.get("version", 1)
-            new_version = current_version + 1
-
-            # Update the checkpoint and version
+            # Store the checkpoint and bump the version in one write conditioned on the connector existing
             self.table.update_item(
                 Key={"custom_connector_arn_prefix": arn_prefix, "connector_id": request.connector_id},
-                UpdateExpression="SET checkpoint = :cp, version = :new_version, updated_at = :updated_at",
-                ConditionExpression="version = :current_version",
+                UpdateExpression=(
+                    "SET checkpoint = :cp, version = if_not_exists(version, :one) + :one, updated_at = :updated_at"
+                ),
+                ConditionExpression="attribute_exists(connector_id)",
                 ExpressionAttributeValues={
                     ":cp": checkpoint_obj,
-                    ":current_version": current_version,
-                    ":new_version": new_version,
+                    ":one": 1,
                     ":updated_at": now_iso,
                 },
             )
         except ClientError as error:
             code = error.response.get("Error", {}).get("Code", "")
             if code == "ConditionalCheckFailedException":
-                raise DaoConflictError(f"Connector '{request.connector_id}' was modified by another process") from error
+                raise DaoResourceNotFoundError(f"Connector '{request.connector_id}' not found") from error
             raise DaoInternalError(f"Failed to put checkpoint: {error.response['Error']['Message']}") from error
 
     def get_checkpoint(self, request: GetCheckpointRequest) -> GetCheckpointResponse:
@@ -511,40 +526,28 @@ class CustomConnectorsDao:
         now_iso = datetime.now(UTC).isoformat()
 
         try:
-            # First get the current item to get the version and check if checkpoint exists
-            response = self.table.get_item(
-                Key={
-                    "custom_connector_arn_prefix": arn_prefix,
-                    "connector_id": request.connector_id,
-                }
-            )
-
-            item = response.get("Item")
-            if not item:
-                raise DaoResourceNotFoundError("Connector 'request.connector_id' not found") from None
-
-            if "checkpoint" not in item:
-                raise DaoResourceNotFoundError(f"No checkpoint to delete for connector '{request.connector_id}'")
-
-            # Get the current version for optimistic locking
-            current_version = item.get("version", 1)
-            new_version = current_version + 1
-
-            # Remove the checkpoint and update version
+            # Remove the checkpoint and bump the version in one conditional write; the old item is
+            # returned on a failed condition to tell a missing connector from a missing checkpoint
             self.table.update_item(
                 Key={"custom_connector_arn_prefix": arn_prefix, "connector_id": request.connector_id},
-                UpdateExpression="REMOVE checkpoint SET version = :new_version, updated_at = :updated_at",
-                ConditionExpression="version = :current_version",
+                UpdateExpression=(
+                    "REMOVE checkpoint SET version = if_not_exists(version, :one) + :one, updated_at = :updated_at"
+                ),
+                ConditionExpression="attribute_exists(connector_id) AND attribute_exists(checkpoint)",
                 ExpressionAttributeValues={
-                    ":current_version": current_version,
-                    ":new_version": new_version,
+                    ":one": 1,
                     ":updated_at": now_iso,
                 },
+                ReturnValuesOnConditionCheckFailure="ALL_OLD",
             )
         except ClientError as error:
             code = error.response.get("Error", {}).get("Code", "")
             if code == "ConditionalCheckFailedException":
-                raise DaoConflictError(f"Connector '{request.connector_id}' was modified by another process") from error
+                if not error.response.get("Item"):
+                    raise DaoResourceNotFoundError(f"Connector '{request.connector_id}' not found") from error
+                raise DaoResourceNotFoundError(
+                    f"No checkpoint to delete for connector '{request.connector_id}'"
+                ) from error
             raise DaoInternalError(f"Failed to delete checkpoint: {error.response['Error']['Message']}") from error
 
     def update_connector(self, request: UpdateConnectorRequest) -> UpdateConnectorResponse:
@@ -620,8 +623,8 @@ class CustomConnectorsDao:
                 connector_id=item["connector_id"],
                 arn=item["arn"],
                 name=item["name"],
-                created_at=datetime.fromisoformat(item["created_at"]),
-                updated_at=datetime.fromisoformat(item["updated_at"]),
+                created_at=_api_timestamp(item["created_at"]),
+                updated_at=_api_timestamp(item["updated_at"]),
                 description=item.get("description"),
                 status=ConnectorStatus(item["status"]),
                 version=new_version,
@@ -0,0 +1,24 @@
+"""Utility for building DynamoDB projection expressions."""
+
+from typing import Any
+
+
+def build_projection(attribute_names: tuple[str, ...]) -> dict[str, Any]:
+    """
+    Build query parameters that return only the given attributes.
+
+    Every attribute is referenced through a placeholder, so reserved words such as
+    `name` and `status` can be projected.
+
+    Args:
+        attribute_names: Names of the attributes to return
+
+    Returns:
+        dict[str, Any]: ProjectionExpression and ExpressionAttributeNames query parameters
+
+    """
+    placeholders = {f"#p{index}": name for index, name in enumerate(attribute_names)}
+    return {
+        "ProjectionExpression": ", ".join(placeholders),
+        "ExpressionAttributeNames": placeholders,
+    }
@@ -1,9 +1,10 @@
 """Tenant models for the Custom Connector Framework."""
 
+import functools
 import re
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from common.env import AWS_REGION
 from common.exceptions import BadRequestError
@@ -12,6 +13,9 @@ from common.exceptions import BadRequestError
 class TenantContext(BaseModel):
     """Model for tenant context."""
 
+    # Instances are shared by every request of the same account, so keep them immutable
+    model_config = ConfigDict(frozen=True)
+
     account_id: str
     region: str
 
@@ -79,4 +83,10 @@ def extract_tenant_context(event: dict[str, Any]) -> TenantContext:
     if not account_id:
         raise BadRequestError("Account ID not found in request context")
 
+    return _tenant_context_for_account(account_id)
+
+
+@functools.lru_cache(maxsize=256)
+def _tenant_context_for_account(account_id: str) -> TenantContext:
+    """Build the tenant context of an account once, warm invocations mostly serve the same tenants."""
     return TenantContext(account_id=account_id, region=AWS_REGION)
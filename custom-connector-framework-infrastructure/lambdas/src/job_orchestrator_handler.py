@@ -1,5 +1,6 @@
 """Lambda handler for orchestrating custom connector jobs."""
 
+import logging
 from dataclasses import dataclass
 from typing import Any
 
@@ -10,12 +11,14 @@ from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import
     DynamoDBRecord
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
+from common.clients import BOTO_CLIENT_CONFIG, create_dynamodb_resource
 from common.env import (AWS_BATCH_JOB_QUEUE, CUSTOM_CONNECTOR_API_ENDPOINT,
                         CUSTOM_CONNECTOR_JOBS_TABLE_NAME,
                         CUSTOM_CONNECTORS_TABLE_NAME)
 from common.observability import LogContext, create_log_context, logger, tracer
 from common.storage.ddb.custom_connector_jobs_dao import (
-    CustomConnectorJobsDao, JobStatus, UpdateJobStatusRequest)
+    CustomConnectorJobsDao, JobStatus, UpdateJobStatusRequest,
+    decode_environment)
 from common.storage.ddb.custom_connectors_dao import (
     ConnectorStatus, CustomConnectorsDao, GetConnectorRequest,
     UpdateConnectorStatusRequest)
@@ -35,8 +38,8 @@ class JobStartContext:
 
 
 processor = BatchProcessor(event_type=EventType.DynamoDBStreams)
-batch_client = boto3.client("batch")
-dynamodb = boto3.resource("dynamodb")
+batch_client = boto3.client("batch", config=BOTO_CLIENT_CONFIG)
+dynamodb = create_dynamodb_resource()
 
 connectors_table = dynamodb.Table(CUSTOM_CONNECTORS_TABLE_NAME)
 jobs_table = dynamodb.Table(CUSTOM_CONNECTOR_JOBS_TABLE_NAME)
@@ -59,7 +62,7 @@ def record_handler(record: DynamoDBRecord):
     custom_connector_arn_prefix = new_image.get("custom_connector_arn_prefix")
     status = new_image.get("status")
     batch_job_id = new_image.get("batch_job_id")
-    environment = new_image.get("environment", [])
+    environment = decode_environment(new_image.get("environment"))
 
     if not all([job_id, connector_id, custom_connector_arn_prefix, status]):
         logger.error(
@@ -295,7 +298,8 @@ def handler(event, _context: LambdaContext):
         "Received DynamoDB Streams event",
         extra={"event_type": "dynamodb_streams", "record_count": len(event.get("Records", []))},
     )
-    logger.debug("Full event details", extra={"event": event})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Full event details", extra={"event": event})
 
     try:
         result = process_partial_response(
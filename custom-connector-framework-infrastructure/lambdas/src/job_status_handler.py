@@ -1,8 +1,10 @@
 """Lambda handler for processing job status changes."""
 
-import boto3
+import logging
+
 from aws_lambda_powertools.utilities.typing import LambdaContext
 
+from common.clients import create_dynamodb_resource
 from common.env import (CUSTOM_CONNECTOR_JOBS_TABLE_NAME,
                         CUSTOM_CONNECTORS_TABLE_NAME)
 from common.observability import LogContext, create_log_context, logger, tracer
@@ -12,7 +14,7 @@ from common.storage.ddb.custom_connectors_dao import (
     ConnectorStatus, CustomConnectorsDao, UpdateConnectorStatusRequest)
 from common.tenant import TenantContext
 
-dynamodb = boto3.resource("dynamodb")
+dynamodb = create_dynamodb_resource()
 
 connectors_table = dynamodb.Table(CUSTOM_CONNECTORS_TABLE_NAME)
 jobs_table = dynamodb.Table(CUSTOM_CONNECTOR_JOBS_TABLE_NAME)
@@ -109,7 +111,8 @@ def process_batch_event(event_detail: dict) -> None:
 def handler(event, _context: LambdaContext):
     """Handle Batch job state change events."""
     logger.info("Received EventBridge event", extra={"event_type": "eventbridge", "source": event.get("source")})
-    logger.debug("Full event details", extra={"event": event})
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Full event details", extra={"event": event})
 
     try:
         event_detail = event.get("detail", {})
@@ -0,0 +1,58 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from activities.batch_delete_custom_connector_documents import (
+    BatchDeleteCustomConnectorDocumentsActivity,
+    BatchDeleteCustomConnectorDocumentsRequest)
+from common.storage.ddb.custom_connector_documents_dao import \
+    DaoResourceNotFoundError
+from common.tenant import TenantContext
+
+
+@pytest.fixture
+def mock_documents_dao():
+    return MagicMock()
+
+
+@pytest.fixture
+def activity(mock_documents_dao):
+    return BatchDeleteCustomConnectorDocumentsActivity(mock_documents_dao)
+
+
+@pytest.fixture
+def tenant_context():
+    return TenantContext(account_id="123456789012", region="us-west-2")
+
+
+def test_delete_documents_removes_duplicate_ids(activity, mock_documents_dao, tenant_context):
+    # Arrange
+    request = BatchDeleteCustomConnectorDocumentsRequest(
+        tenant_context=tenant_context, connector_id="test-connector", document_ids=["d2", "d1", "d2", "d1"]
+    )
+
+    # Act
+    response = activity.delete(request)
+
+    # Assert
+    mock_documents_dao.batch_delete_documents.assert_called_once()
+    dao_request = mock_documents_dao.batch_delete_documents.call_args[0][0]
+    assert dao_request.document_ids == ["d2", "d1"]
+    assert response.status_code == 202
+
+
+def test_delete_documents_connector_not_found(activity, mock_documents_dao, tenant_context):
+    # Arrange
+    request = BatchDeleteCustomConnectorDocumentsRequest(
+        tenant_context=tenant_context, connector_id="test-connector", document_ids=["d1"]
+    )
+    mock_documents_dao.batch_delete_documents.side_effect = DaoResourceNotFoundError("Connector not found")
+
+    # Act
+    response = activity.delete(request)
+
+    # Assert
+    assert response.status_code == 404
+    body = json.loads(response.body)
+    assert "Connector not found" in body["message"]
@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from activities.batch_put_custom_connector_documents import (
+    BatchPutCustomConnectorDocumentsActivity,
+    BatchPutCustomConnectorDocumentsRequest)
+from common.tenant import TenantContext
+
+
+@pytest.fixture
+def mock_documents_dao():
+    return MagicMock()
+
+
+@pytest.fixture
+def activity(mock_documents_dao):
+    return BatchPutCustomConnectorDocumentsActivity(mock_documents_dao)
+
+
+@pytest.fixture
+def tenant_context():
+    return TenantContext(account_id="123456789012", region="us-west-2")
+
+
+def test_put_documents_keeps_last_checksum_for_duplicate_ids(activity, mock_documents_dao, tenant_context):
+    # Arrange
+    request = BatchPutCustomConnectorDocumentsRequest(
+        tenant_context=tenant_context,
+        connector_id="test-connector",
+        documents=[
+            {"document_id": "d1", "checksum": "old"},
+            {"document_id": "d2", "checksum": "cs2"},
+            {"document_id": "d1", "checksum": "new"},
+        ],
+    )
+
+    # Act
+    response = activity.put(request)
+
+    # Assert
+    mock_documents_dao.batch_put_documents.assert_called_once()
+    dao_request = mock_documents_dao.batch_put_documents.call_args[0][0]
+    assert [(doc.document_id, doc.checksum) for doc in dao_request.documents] == [("d1", "new"), ("d2", "cs2")]
+    assert response.status_code == 202
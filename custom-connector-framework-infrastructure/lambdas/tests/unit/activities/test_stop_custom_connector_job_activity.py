@@ -2,6 +2,7 @@ import json
 from unittest.mock import MagicMock
 
 import pytest
+from botocore.exceptions import ClientError
 
 from activities.stop_custom_connector_job import (
     StopCustomConnectorJobActivity, StopCustomConnectorJobRequest)
@@ -90,3 +91,24 @@ def test_stop_job_internal_error(activity, mock_jobs_dao, tenant_context):
     assert response.status_code == 500
     body = json.loads(response.body)
     assert "Internal error" in body["message"]
+
+
+def test_stop_job_throttled(activity, mock_jobs_dao, tenant_context):
+    # Arrange
+    request = StopCustomConnectorJobRequest(
+        tenant_context=tenant_context, connector_id="test-connector", job_id="test-job"
+    )
+    throttled = ClientError(
+        {"Error": {"Code": "ProvisionedThroughputExceededException", "Message": "Rate exceeded"}}, "UpdateItem"
+    )
+    error = DaoInternalError("Failed to update job status: Rate exceeded")
+    error.__cause__ = throttled
+    mock_jobs_dao.update_job_status.side_effect = error
+
+    # Act
+    response = activity.stop(request)
+
+    # Assert
+    assert response.status_code == 429
+    body = json.loads(response.body)
+    assert "Rate exceeded" in body["message"]
@@ -58,8 +58,8 @@ def test_update_connector_success(activity, mock_dao, tenant_context):
     dao_response.connector_id = connector_id
     dao_response.arn = f"arn:aws:custom-connector:us-east-1:123456789012:{connector_id}"
     dao_response.name = name
-    dao_response.created_at = datetime(2023, 1, 1, tzinfo=UTC)
-    dao_response.updated_at = datetime(2023, 1, 2, tzinfo=UTC)
+    dao_response.created_at = datetime(2023, 1, 1, tzinfo=UTC).isoformat()
+    dao_response.updated_at = datetime(2023, 1, 2, tzinfo=UTC).isoformat()
     dao_response.description = description
     dao_response.status = ConnectorStatus.AVAILABLE
     mock_dao.update_connector.return_value = dao_response
@@ -155,8 +155,8 @@ def test_update_connector_partial_update(activity, mock_dao, tenant_context):
     dao_response.connector_id = connector_id
     dao_response.arn = f"arn:aws:custom-connector:us-east-1:123456789012:{connector_id}"
     dao_response.name = name
-    dao_response.created_at = datetime(2023, 1, 1, tzinfo=UTC)
-    dao_response.updated_at = datetime(2023, 1, 2, tzinfo=UTC)
+    dao_response.created_at = datetime(2023, 1, 1, tzinfo=UTC).isoformat()
+    dao_response.updated_at = datetime(2023, 1, 2, tzinfo=UTC).isoformat()
     dao_response.description = "Original description"
     dao_response.status = ConnectorStatus.AVAILABLE
     dao_response.version = 2
@@ -0,0 +1,45 @@
+"""Unit tests for the in-container connector existence cache."""
+
+import pytest
+
+from common.storage.ddb import connector_cache
+
+ARN_PREFIX = "arn:aws:qbusiness:us-east-1:123456789012:custom-connector"
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    connector_cache._verified_at.clear()
+    yield
+    connector_cache._verified_at.clear()
+
+
+def test_remember_then_known():
+    assert not connector_cache.is_known(ARN_PREFIX, "cc-1")
+    connector_cache.remember(ARN_PREFIX, "cc-1")
+    assert connector_cache.is_known(ARN_PREFIX, "cc-1")
+    assert not connector_cache.is_known(ARN_PREFIX, "cc-2")
+
+
+def test_entry_expires_after_ttl(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(connector_cache.time, "monotonic", lambda: now[0])
+    connector_cache.remember(ARN_PREFIX, "cc-1")
+
+    now[0] += connector_cache._TTL_SECONDS + 1
+    assert not connector_cache.is_known(ARN_PREFIX, "cc-1")
+
+
+def test_invalidate_forgets_connector():
+    connector_cache.remember(ARN_PREFIX, "cc-1")
+    connector_cache.invalidate(ARN_PREFIX, "cc-1")
+    assert not connector_cache.is_known(ARN_PREFIX, "cc-1")
+
+
+def test_oldest_entry_is_evicted(monkeypatch):
+    monkeypatch.setattr(connector_cache, "_MAX_ENTRIES", 2)
+    for connector_id in ("cc-1", "cc-2", "cc-3"):
+        connector_cache.remember(ARN_PREFIX, connector_id)
+
+    assert not connector_cache.is_known(ARN_PREFIX, "cc-1")
+    assert connector_cache.is_known(ARN_PREFIX, "cc-3")
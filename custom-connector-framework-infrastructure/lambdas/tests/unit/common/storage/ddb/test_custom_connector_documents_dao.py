@@ -133,6 +133,27 @@ def test_batch_put_documents_connector_not_found(documents_dao, tenant_context):
         documents_dao.batch_put_documents(bogus_req)
 
 
+@mock_aws
+def test_batch_put_documents_connector_deleted_elsewhere(connectors_dao, documents_dao, tenant_context):
+    """A connector cached by a read must still be checked on write, another container may have deleted it."""
+    cid = create_sample_connector(connectors_dao, tenant_context)
+    documents_dao.list_documents(ListDocumentsRequest(tenant_context=tenant_context, connector_id=cid))
+
+    # Delete the item directly, so this container's cache still holds the connector
+    connectors_dao.table.delete_item(
+        Key={"custom_connector_arn_prefix": tenant_context.get_arn_prefix(), "connector_id": cid}
+    )
+
+    with pytest.raises(DaoResourceNotFoundError):
+        documents_dao.batch_put_documents(
+            BatchPutDocumentsRequest(
+                tenant_context=tenant_context,
+                connector_id=cid,
+                documents=[DocumentItem(document_id="doc1", checksum="sum1")],
+            )
+        )
+
+
 @mock_aws
 def test_batch_put_and_verify_documents(connectors_dao, documents_dao, tenant_context):
     """
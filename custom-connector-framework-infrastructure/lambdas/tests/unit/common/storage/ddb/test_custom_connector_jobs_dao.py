@@ -8,7 +8,8 @@ from moto.core import DEFAULT_ACCOUNT_ID as ACCOUNT_ID
 # Imports from the CustomConnectorJobs DAO under test
 from common.storage.ddb.custom_connector_jobs_dao import (
     CustomConnectorJobsDao, DaoConflictError, DaoResourceNotFoundError,
-    JobStatus, ListJobsRequest, StartJobRequest, UpdateJobStatusRequest)
+    JobStatus, ListJobsRequest, StartJobRequest, UpdateJobStatusRequest,
+    decode_environment)
 # Imports from the CustomConnectors DAO (needed for connector‐side setup/verification)
 from common.storage.ddb.custom_connectors_dao import \
     ConnectorStatus as DaoConnectorStatus
@@ -165,7 +166,27 @@ def test_start_job_success(connectors_dao, jobs_dao, tenant_context):
     ).get("Item")
     assert raw_job_item["connector_id"] == cid
     assert raw_job_item["status"] == JobStatus.STARTED.value
-    assert raw_job_item["environment"] == [{"env": "val"}]
+    assert decode_environment(raw_job_item["environment"]) == [{"env": "val"}]
+
+
+@mock_aws
+def test_start_job_idempotency_token_returns_same_job(connectors_dao, jobs_dao, tenant_context):
+    """Retrying start_job with the same idempotency token should return the first job instead of conflicting."""
+    cid = create_sample_connector(connectors_dao, tenant_context, available=True)
+    request = StartJobRequest(
+        tenant_context=tenant_context, connector_id=cid, environment=[], idempotency_token="retry-token"
+    )
+
+    first = jobs_dao.start_job(request)
+    # The connector is IN_USE now, so without the token this retry would raise DaoConflictError
+    second = jobs_dao.start_job(request)
+
+    assert second.job_id == first.job_id
+    assert second.job_id.startswith("ccj-")
+    assert second.created_at == first.created_at
+
+    listed = jobs_dao.list_jobs(ListJobsRequest(tenant_context=tenant_context, connector_id=cid)).jobs
+    assert [job.job_id for job in listed] == [first.job_id]
 
 
 @mock_aws
@@ -178,6 +199,32 @@ def test_update_job_status_connector_not_found(jobs_dao, tenant_context):
         jobs_dao.update_job_status(bogus_req)
 
 
+@mock_aws
+def test_update_job_status_connector_deleted_elsewhere(connectors_dao, jobs_dao, tenant_context):
+    """A connector cached by a read must still be checked on write, another container may have deleted it."""
+    cid = create_sample_connector(connectors_dao, tenant_context, available=True)
+    start_resp = jobs_dao.start_job(StartJobRequest(tenant_context=tenant_context, connector_id=cid))
+    jobs_dao.list_jobs(ListJobsRequest(tenant_context=tenant_context, connector_id=cid))
+
+    # Delete the item directly, so this container's cache still holds the connector
+    connectors_dao.table.delete_item(
+        Key={"custom_connector_arn_prefix": tenant_context.get_arn_prefix(), "connector_id": cid}
+    )
+
+    with pytest.raises(DaoResourceNotFoundError):
+        jobs_dao.update_job_status(
+            UpdateJobStatusRequest(
+                tenant_context=tenant_context, connector_id=cid, job_id=start_resp.job_id, status=JobStatus.RUNNING
+            )
+        )
+
+    # The job is left untouched
+    raw = jobs_dao.table.get_item(
+        Key={"custom_connector_arn_prefix": tenant_context.get_arn_prefix(), "job_id": start_resp.job_id}
+    ).get("Item")
+    assert raw["status"] == JobStatus.STARTED.value
+
+
 @mock_aws
 def test_update_job_status_job_not_found(connectors_dao, jobs_dao, tenant_context):
     """If connector exists but the job_id is not found, update_job_status should raise DaoResourceNotFoundError."""
@@ -11,7 +11,8 @@ from common.storage.ddb.custom_connectors_dao import (
     DaoResourceNotFoundError, DeleteCheckpointRequest, DeleteConnectorRequest,
     GetCheckpointRequest, GetCheckpointResponse, GetConnectorRequest,
     GetConnectorResponse, ListConnectorsRequest, ListConnectorsResponse,
-    PutCheckpointRequest, UpdateConnectorStatusRequest)
+    PutCheckpointRequest, UpdateConnectorRequest,
+    UpdateConnectorStatusRequest)
 from common.tenant import TenantContext
 
 TABLE_NAME = "CustomConnectors"
@@ -135,6 +136,40 @@ def test_list_connectors_pagination(dynamodb_table, dao, tenant_context):
     assert page2.next_token is None
 
 
+@mock_aws
+def test_list_and_update_timestamps_match_get(dynamodb_table, dao, tenant_context):
+    """List and update return stored timestamps in the same format as get serializes its datetimes."""
+    container_props = ContainerProperties(
+        execution_role_arn="arn:role",
+        image_uri="uri",
+        job_role_arn="arn:job",
+        environment=[],
+        resource_requirements=ResourceRequirements(cpu=1024, memory=2048),
+        timeout=0,
+    )
+    cid = dao.create_connector(
+        CreateConnectorRequest(
+            tenant_context=tenant_context, name="conn", description=None, container_properties=container_props
+        )
+    ).connector_id
+
+    def get_json():
+        return dao.get_connector(GetConnectorRequest(tenant_context=tenant_context, connector_id=cid)).model_dump(
+            mode="json"
+        )
+
+    listed = dao.list_connectors(ListConnectorsRequest(tenant_context=tenant_context)).connectors[0]
+    fetched = get_json()
+    assert listed.created_at == fetched["created_at"]
+    assert listed.updated_at == fetched["updated_at"]
+    assert listed.created_at.endswith("Z")
+
+    updated = dao.update_connector(UpdateConnectorRequest(tenant_context=tenant_context, connector_id=cid, name="new"))
+    fetched = get_json()
+    assert updated.created_at == fetched["created_at"]
+    assert updated.updated_at == fetched["updated_at"]
+
+
 @mock_aws
 def test_delete_connector_and_conflict(dynamodb_table, dao, tenant_context):
     container_props = ContainerProperties(
@@ -1,5 +1,7 @@
+import base64
 from unittest.mock import MagicMock, patch
 
+import orjson
 import pytest
 from aws_lambda_powertools.utilities.data_classes.dynamo_db_stream_event import \
     DynamoDBRecord
@@ -138,6 +140,38 @@ def test_record_handler_started_status():
         assert args[0].tenant_context.region == "us-west-2"
 
 
+@pytest.mark.parametrize(
+    ("environment", "expected"),
+    [
+        ([], []),
+        ([{"name": "FOO", "value": "bar"}], [{"name": "FOO", "value": "bar"}]),
+    ],
+    ids=["empty-environment", "environment"],
+)
+def test_record_handler_decodes_environment_blob(environment, expected):
+    with patch("job_orchestrator_handler.handle_job_start") as mock_handle_job_start:
+        # The stream event carries the stored orjson blob as a base64 encoded B attribute
+        record = DynamoDBRecord(
+            {
+                "eventName": "INSERT",
+                "dynamodb": {
+                    "NewImage": {
+                        "job_id": {"S": "test-job"},
+                        "connector_id": {"S": "test-connector"},
+                        "custom_connector_arn_prefix": {"S": "arn:aws:ccf:us-west-2:123456789012"},
+                        "status": {"S": JobStatus.STARTED.value},
+                        "environment": {"B": base64.b64encode(orjson.dumps(environment)).decode()},
+                    }
+                },
+            }
+        )
+
+        job_orchestrator_handler.record_handler(record)
+
+        args, _ = mock_handle_job_start.call_args
+        assert args[0].environment == expected
+
+
 def test_record_handler_other_status():
     # Arrange
     with patch("job_orchestrator_handler.handle_job_start") as mock_handle_job_start: